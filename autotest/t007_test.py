@@ -294,6 +294,44 @@ def test_export_output():
     assert np.array_equal(ibound_mask, arr_mask)
 
 
+def test_export_output_chunked():
+    import os
+    import numpy as np
+    import flopy
+
+    # Do not fail if netCDF4 not installed
+    try:
+        import netCDF4
+        import pyproj
+    except:
+        return
+
+    model_ws = os.path.join("..", "examples", "data", "freyberg")
+    ml = flopy.modflow.Modflow.load("freyberg.nam", model_ws=model_ws)
+    hds_pth = os.path.join(model_ws, "freyberg.githds")
+    hds = flopy.utils.HeadFile(hds_pth)
+
+    out_pth = os.path.join(npth, "freyberg.chunked.nc")
+    chunks = (1, 1, ml.nrow // 2, ml.ncol)
+    nc = flopy.export.utils.output_helper(out_pth, ml,
+                                          {"freyberg.githds": hds},
+                                          chunksizes=chunks, complevel=6)
+    var = nc.nc.variables.get("head")
+    assert tuple(var.chunking()) == chunks
+    filters = var.filters()
+    assert filters["zlib"] and filters["complevel"] == 6
+
+    # streamed time steps match the head file
+    arr = var[:]
+    heads = hds.get_alldata()
+    ibound_mask = ml.bas6.ibound.array == 0
+    for i in range(arr.shape[0]):
+        assert np.array_equal(ibound_mask, arr.mask[i])
+        assert np.allclose(arr[i][~ibound_mask], heads[i][~ibound_mask])
+    assert np.isclose(var.getncattr("min"), arr.min())
+    assert np.isclose(var.getncattr("max"), arr.max())
+
+
 def test_write_shapefile():
     sf = import_shapefile()
     if not sf:
@@ -367,6 +405,42 @@ def test_shapefile_polygon_closed():
             raise AssertionError("Shapefile polygon is not closed!")
 
 
+def test_write_shapefile_attributes():
+    sf = import_shapefile()
+    if not sf:
+        return
+
+    from flopy.discretization import StructuredGrid
+    from flopy.export.shapefile_utils import write_grid_shapefile
+
+    nrow, ncol = 3, 4
+    sg = StructuredGrid(delr=np.arange(1., ncol + 1),
+                        delc=np.arange(1., nrow + 1),
+                        xoff=10., yoff=20., angrot=30.)
+    hk = np.arange(nrow * ncol, dtype=float).reshape(nrow, ncol)
+    hk[1, 2] = np.nan
+    zone = np.arange(nrow * ncol).reshape(nrow, ncol) % 3
+    outshp = os.path.join(tpth, 'attributes.shp')
+    write_grid_shapefile(outshp, sg, array_dict={'hk': hk, 'zone': zone},
+                         nan_val=-999.)
+
+    sfobj = sf.Reader(outshp)
+    assert [f[0] for f in sfobj.fields[1:]] == \
+           ['node', 'row', 'column', 'hk', 'zone']
+    for shape, rec in zip(sfobj.iterShapes(), sfobj.iterRecords()):
+        node, row, column, hkval, zoneval = rec
+        i, j = row - 1, column - 1
+        assert node == i * ncol + j + 1
+        verts = sg.get_cell_vertices(i, j)
+        assert np.allclose(shape.points, verts + [verts[0]])
+        if (i, j) == (1, 2):
+            assert hkval == -999.
+        else:
+            assert hkval == hk[i, j]
+        assert zoneval == zone[i, j]
+    sfobj.close()
+
+
 def test_export_array():
     from flopy.export import utils
     try:
@@ -1438,6 +1512,102 @@ def test_vertex_model_dot_plot():
     plt.close('all')
 
 
+def test_vertex_grid_cache():
+    # load up the vertex example problem
+    sim_name = "mfsim.nam"
+    sim_path = "../examples/data/mf6/test003_gwftri_disv"
+    disv_sim = flopy.mf6.MFSimulation.load(sim_name=sim_name, version="mf6",
+                                           exe_name="mf6",
+                                           sim_ws=sim_path)
+    mg = disv_sim.get_model('gwf_1').modelgrid
+    xverts = mg.xvertices
+    assert isinstance(xverts, list) and isinstance(xverts[0], list)
+    assert mg.get_cell_vertices(0) == list(zip(xverts[0],
+                                               mg.yvertices[0]))
+
+    # read-only cache returns views of the cached geometry
+    mg.readonly_cache = True
+    xc, xv = mg.xcellcenters, mg.xvertices
+    assert not xc.flags.writeable
+    assert isinstance(xv, tuple) and isinstance(xv[0], tuple)
+    assert mg.xvertices is xv, 'read-only vertices should not be rebuilt'
+    assert np.allclose(xc, mg.xcellcenters)
+    for v0, v1 in zip(xverts, xv):
+        assert np.allclose(v0, v1)
+    try:
+        xc[0] = 0.
+        raise AssertionError("cached cell centers should be read-only")
+    except ValueError:
+        pass
+    try:
+        xv[0][0] = 0.
+        raise AssertionError("cached cell vertices should be read-only")
+    except TypeError:
+        pass
+
+    # the cache is only updated when the origin or rotation changes
+    mg.set_coord_info(xoff=mg.xoffset, yoff=mg.yoffset, angrot=mg.angrot)
+    assert mg.xcellcenters.base is xc.base
+    mg.set_coord_info(xoff=mg.xoffset + 100., yoff=mg.yoffset,
+                      angrot=mg.angrot)
+    assert np.allclose(mg.xcellcenters, xc + 100.)
+    assert np.allclose(mg.xvertices[0], np.array(xv[0]) + 100.)
+    mg.readonly_cache = False
+    assert mg.xcellcenters.flags.writeable
+
+    # the read-only cache can be requested when the grid is built
+    vertices = [[0, 0., 1.], [1, 1., 1.], [2, 1., 0.], [3, 0., 0.]]
+    cell2d = [[0, 0.5, 0.5, 4, 0, 1, 2, 3]]
+    mg = flopy.discretization.VertexGrid(vertices=vertices, cell2d=cell2d,
+                                         readonly_cache=True)
+    assert not mg.xcellcenters.flags.writeable
+    assert mg.xvertices == ((0., 1., 1., 0.),)
+
+    # cells that reference an unknown vertex number are rejected
+    cell2d = [[0, 0.5, 0.5, 4, 0, 1, 2, 4]]
+    mg = flopy.discretization.VertexGrid(vertices=vertices, cell2d=cell2d)
+    try:
+        mg.xvertices
+        raise AssertionError("unknown vertex number should raise")
+    except KeyError:
+        pass
+
+
+def test_vertex_grid_readonly_speed():
+    import time
+    # square cells of a 200 x 200 grid
+    nrow = ncol = 200
+    iv = np.arange((nrow + 1) * (ncol + 1)).reshape(nrow + 1, ncol + 1)
+    vertices = [[i, float(i % (ncol + 1)), float(i // (ncol + 1))]
+                for i in range(iv.size)]
+    cell2d = [[i * ncol + j, j + 0.5, i + 0.5, 4, iv[i, j], iv[i, j + 1],
+               iv[i + 1, j + 1], iv[i + 1, j]]
+              for i in range(nrow) for j in range(ncol)]
+    mg = flopy.discretization.VertexGrid(vertices=vertices, cell2d=cell2d)
+    xverts = mg.xvertices
+
+    t0 = time.time()
+    for _ in range(5):
+        mg.xvertices
+    tcopy = time.time() - t0
+
+    mg.readonly_cache = True
+    xv = mg.xvertices
+    t0 = time.time()
+    for _ in range(5):
+        assert mg.xvertices is xv
+    treadonly = time.time() - t0
+    assert treadonly < tcopy, \
+        'read-only vertices ({:.3f} s) are not faster than copies ' \
+        '({:.3f} s)'.format(treadonly, tcopy)
+    assert xv == tuple(tuple(v) for v in xverts)
+    try:
+        xv[0][0] = 0.
+        raise AssertionError("cached cell vertices should be read-only")
+    except TypeError:
+        pass
+
+
 def test_model_dot_plot():
     import matplotlib.pyplot as plt
     loadpth = os.path.join('..', 'examples', 'data', 'mf2005_test')
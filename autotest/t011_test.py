@@ -84,6 +84,33 @@ def test_mf6listfile():
     return
 
 
+def test_mflistfile_line_endings():
+    """
+    test that budgets are located in list files with windows line endings
+    """
+    pth = os.path.join('..', 'examples', 'data', 'freyberg')
+    list_file = os.path.join(pth, 'freyberg.gitlist')
+    mflist = flopy.utils.MfListBudget(list_file)
+
+    tpth = os.path.join('temp', 't011')
+    if not os.path.isdir(tpth):
+        os.makedirs(tpth)
+    crlf_file = os.path.join(tpth, 'freyberg_crlf.list')
+    with open(list_file, 'r') as f:
+        lines = f.read().splitlines()
+    with open(crlf_file, 'wb') as f:
+        f.write('\r\n'.join(lines).encode('ascii'))
+    crlf = flopy.utils.MfListBudget(crlf_file)
+
+    assert crlf.get_kstpkper() == mflist.get_kstpkper()
+    assert np.array_equal(crlf.get_times(), mflist.get_times())
+    assert crlf.get_incremental().tobytes() == \
+           mflist.get_incremental().tobytes()
+    assert crlf.get_cumulative().tobytes() == \
+           mflist.get_cumulative().tobytes()
+    return
+
+
 @raises(AssertionError) 
 def test_mflist_reducedpumping_fail():
     '''
@@ -106,3 +133,4 @@ if __name__ == '__main__':
     test_mflist_reducedpumping()
     test_mflist_reducedpumping_fail()
     test_mf6listfile()
+    test_mflistfile_line_endings()
@@ -1,6 +1,7 @@
 # Test binary and formatted data readers
 import os
 import shutil
+import warnings
 import numpy as np
 import flopy
 from nose.tools import assert_raises
@@ -99,6 +100,164 @@ def test_binaryfile_read_context():
     assert str(e.exception) == 'seek of closed file', str(e.exception)
 
 
+def test_binaryfile_memmap():
+    hds_path = os.path.join('..', 'examples', 'data', 'mf6', 'create_tests',
+                            'test005_advgw_tidal', 'expected_output',
+                            'AdvGW_tidal.hds')
+    with flopy.utils.HeadFile(hds_path) as h:
+        hds = h.get_memmap()
+        assert hds.shape == (361, 3, 15, 10), hds.shape
+        assert not hds.flags.writeable
+        times = h.get_times()
+        for itim in [0, 100, 360]:
+            data = h.get_data(totim=times[itim])
+            assert np.array_equal(hds[itim], data)
+            assert np.array_equal(hds[itim, 1], data[1])
+        alldata = h.get_alldata()
+        assert alldata.shape == hds.shape
+        assert alldata.flags.writeable
+        assert np.array_equal(h.get_alldata(mflay=2), alldata[:, 2])
+        assert np.array_equal(alldata[-1], h.get_data())
+
+    # unstructured head files cannot be memory-mapped
+    hdsu_path = os.path.join('..', 'examples', 'data', 'unstructured',
+                             'headu.githds')
+    with flopy.utils.HeadUFile(hdsu_path) as h:
+        with assert_raises(Exception) as e:
+            h.get_memmap()
+        assert 'cannot be memory-mapped' in str(e.exception)
+
+
+def test_binaryfile_get_ts():
+    hds_path = os.path.join('..', 'examples', 'data', 'mf6', 'create_tests',
+                            'test005_advgw_tidal', 'expected_output',
+                            'AdvGW_tidal.hds')
+    with flopy.utils.HeadFile(hds_path) as h:
+        alldata = h.get_alldata(nodata=None)
+        kijlist = [(k, i, j) for k in range(h.nlay) for i in range(h.nrow)
+                   for j in range(0, h.ncol, 3)]
+        ts = h.get_ts(kijlist)
+        assert ts.shape == (len(h.get_times()), len(kijlist) + 1)
+        assert np.array_equal(ts[:, 0], h.get_times())
+        for istat, (k, i, j) in enumerate(kijlist):
+            assert np.array_equal(ts[:, istat + 1], alldata[:, k, i, j])
+
+        # read without the memory-mapped view
+        h._build_memmap = lambda: None
+        h._memmap = None
+        ts2 = h.get_ts(kijlist)
+        assert np.array_equal(ts, ts2)
+
+
+def test_binaryfile_index_cache():
+    hds_path = os.path.join(cpth, 'AdvGW_tidal.hds')
+    shutil.copy(os.path.join('..', 'examples', 'data', 'mf6', 'create_tests',
+                             'test005_advgw_tidal', 'expected_output',
+                             'AdvGW_tidal.hds'), hds_path)
+    cbc_path = os.path.join(cpth, 'test1tr.cbc')
+    shutil.copy(os.path.join('..', 'examples', 'data', 'mf2005_test',
+                             'test1tr.gitcbc'), cbc_path)
+
+    for fpth, cls, attrs in (
+            (hds_path, flopy.utils.HeadFile,
+             ['recordarray', 'iposarray', 'times', 'kstpkper', 'nlay']),
+            (cbc_path, flopy.utils.CellBudgetFile,
+             ['recordarray', 'iposarray', 'iposheader', 'times', 'kstpkper',
+              'textlist', 'imethlist', 'paknamlist', 'nper'])):
+        idx_path = fpth + '.idx.npz'
+        with cls(fpth) as f0:
+            assert not os.path.isfile(idx_path)
+            with cls(fpth, cache_index=True) as f1:
+                assert os.path.isfile(idx_path)
+            with cls(fpth, cache_index=True) as f2:
+                for attr in attrs:
+                    v0 = getattr(f0, attr)
+                    assert np.array_equal(v0, getattr(f1, attr)), attr
+                    assert np.array_equal(v0, getattr(f2, attr)), attr
+                assert f2.realtype == f0.realtype
+
+    # a stale index is rebuilt
+    with open(hds_path, 'rb') as f:
+        data = f.read()
+    with flopy.utils.HeadFile(hds_path, cache_index=True) as h:
+        ntimes = len(h.get_times())
+        nbytes = len(data) // ntimes
+    with open(hds_path, 'wb') as f:
+        f.write(data[:-nbytes])
+    with flopy.utils.HeadFile(hds_path, cache_index=True) as h:
+        assert len(h.get_times()) == ntimes - 1
+        assert np.array_equal(h.get_data(), h.get_alldata()[-1])
+
+    # a cache that cannot be written only issues a warning
+    from flopy.utils.binaryfile import _save_index_cache
+    idx_path = hds_path + '.idx.npz'
+    os.remove(idx_path)
+    bad = np.array([lambda: None], dtype=object)
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        _save_index_cache(hds_path, 'key', bad=bad)
+    assert any('Could not write index cache' in str(wi.message) for wi in w)
+    assert not os.path.isfile(idx_path)
+    assert not os.path.isfile(idx_path + '.tmp')
+
+
+def test_binaryfile_refresh():
+    src = os.path.join('..', 'examples', 'data', 'mf6', 'create_tests',
+                       'test005_advgw_tidal', 'expected_output',
+                       'AdvGW_tidal.hds')
+    with open(src, 'rb') as f:
+        data = f.read()
+    with flopy.utils.HeadFile(src) as h0:
+        times = h0.get_times()
+        alldata = h0.get_alldata()
+
+    # write part of the file, ending with an incomplete record
+    fpth = os.path.join(cpth, 'refresh.hds')
+    nbytes = len(data) // 2 + 10
+    with open(fpth, 'wb') as f:
+        f.write(data[:nbytes])
+    with flopy.utils.HeadFile(fpth) as h:
+        nrec = h.recordarray.shape[0]
+        assert 0 < nrec < len(times) * 3
+        assert h.get_times() == times[:len(h.get_times())]
+        assert h.refresh() == 0
+        with open(fpth, 'ab') as f:
+            f.write(data[nbytes:])
+        assert h.refresh() == len(times) * 3 - nrec
+        assert h.get_times() == times
+        assert np.array_equal(h.get_alldata(), alldata)
+
+        # follow the complete file
+        for itim, (kstpkper, totim, hd) in enumerate(h.follow(timeout=0)):
+            assert totim == times[itim]
+            assert np.array_equal(hd, alldata[itim])
+        assert itim == len(times) - 1
+
+    src = os.path.join('..', 'examples', 'data', 'mf2005_test',
+                       'test1tr.gitcbc')
+    with open(src, 'rb') as f:
+        data = f.read()
+    with flopy.utils.CellBudgetFile(src) as v0:
+        nrecords = v0.get_nrecords()
+        wells = v0.get_data(text='WELLS')
+
+    fpth = os.path.join(cpth, 'refresh.cbc')
+    nbytes = len(data) // 2 + 10
+    with open(fpth, 'wb') as f:
+        f.write(data[:nbytes])
+    with flopy.utils.CellBudgetFile(fpth) as v:
+        nrec = v.get_nrecords()
+        assert 0 < nrec < nrecords
+        with open(fpth, 'ab') as f:
+            f.write(data[nbytes:])
+        assert v.refresh() == nrecords - nrec
+        assert v.get_nrecords() == nrecords
+        follow = list(v.follow(text='WELLS', timeout=0))
+        assert len(follow) == len(wells)
+        for (kstpkper, totim, q), q0 in zip(follow, wells):
+            assert np.array_equal(q, q0)
+
+
 def test_cellbudgetfile_read_context():
     cbc_path = os.path.join(
             '..', 'examples', 'data', 'mf2005_test', 'mnw1.gitcbc')
@@ -136,6 +295,94 @@ def test_cellbudgetfile_read():
     return
 
 
+def test_cellbudgetfile_get_ts():
+    cbc_path = os.path.join('..', 'examples', 'data', 'mf2005_test',
+                            'test1tr.gitcbc')
+    kijlist = [(0, i, j) for i in range(0, 15, 2) for j in range(0, 10, 3)]
+    with flopy.utils.CellBudgetFile(cbc_path) as v:
+        for text in ('STORAGE', 'WELLS', 'STREAM LEAKAGE', 'CONSTANT HEAD'):
+            ts = v.get_ts(kijlist, text=text)
+            assert ts.shape == (len(v.get_kstpkper()), len(kijlist) + 1)
+            for itim, kstpkper in enumerate(v.get_kstpkper()):
+                data = v.get_data(kstpkper=kstpkper, text=text, full3D=True)
+                for istat, (k, i, j) in enumerate(kijlist):
+                    if len(data) == 0 or data[0][k, i, j] is np.ma.masked:
+                        assert np.isnan(ts[itim, istat + 1])
+                    else:
+                        assert ts[itim, istat + 1] == data[0][k, i, j]
+
+            # threaded reads return the same values
+            ts2 = v.get_ts(kijlist, text=text, max_workers=3)
+            assert np.array_equal(ts, ts2, equal_nan=True)
+
+    # imeth 6 records are located using the model grid
+    pth = os.path.join('..', 'examples', 'data', 'mf6-freyberg')
+    mg = flopy.utils.MfGrdFile(
+        os.path.join(pth, 'freyberg.dis.grb')).get_modelgrid()
+    with flopy.utils.CellBudgetFile(os.path.join(pth, 'freyberg.cbc'),
+                                    modelgrid=mg) as v:
+        wel = v.get_data(text='WEL')[0]
+        kijlist = [np.unravel_index(node - 1, (mg.nlay, mg.nrow, mg.ncol))
+                   for node in wel['node']]
+        kijlist.append((0, 0, 0))
+        ts = v.get_ts(kijlist, text='WEL')
+        assert np.array_equal(ts[0, 1:-1], wel['q'])
+        assert np.isnan(ts[0, -1])
+
+
+def test_cellbudgetfile_recorddict():
+    pth = os.path.join('..', 'examples', 'data', 'mf6-freyberg',
+                       'freyberg.cbc')
+    with flopy.utils.CellBudgetFile(pth) as v:
+        recorddict = v.recorddict
+        assert len(recorddict) == v.get_nrecords()
+        for header, ipos in zip(v.recordarray, v.iposarray):
+            assert recorddict[tuple(header)] == ipos
+
+        # truncate the file in the model and package names of the first
+        # imeth 6 record
+        idx = int(np.where(v.recordarray['imeth'] == 6)[0][0])
+        iposheader = v.get_position(idx, header=True)
+        ipos = v.get_position(idx) - 30
+    opth = os.path.join(cpth, 'truncated.cbc')
+    with open(pth, 'rb') as fin, open(opth, 'wb') as fout:
+        fout.write(fin.read(ipos))
+    with flopy.utils.CellBudgetFile(opth) as v:
+        assert v.get_nrecords() == idx
+        v.file.seek(iposheader)
+        with assert_raises(flopy.utils.binaryfile.BudgetIndexError) as e:
+            v._get_header()
+        assert str(e.exception) == 'Incomplete header', str(e.exception)
+    return
+
+
+def test_cellbudgetfile_get_ts_list_double():
+    # list records in double precision files are summed in double
+    # precision and cells that are not in the list are nan
+    fpth = os.path.join(cpth, 'list_double.cbc')
+    h1 = np.dtype([('kstp', 'i4'), ('kper', 'i4'), ('text', 'S16'),
+                   ('ncol', 'i4'), ('nrow', 'i4'), ('nlay', 'i4')])
+    h2 = np.dtype([('imeth', 'i4'), ('delt', 'f8'), ('pertim', 'f8'),
+                   ('totim', 'f8')])
+    dt = np.dtype([('node', 'i4'), ('q', 'f8')])
+    q = [1.0 + 1e-12, 2.0, 3.0 + 1e-12]
+    with open(fpth, 'wb') as f:
+        for kstp in range(2):
+            np.array((kstp + 1, 1, b'           WELLS', 3, 2, -1),
+                     h1).tofile(f)
+            np.array((2, 1., kstp + 1., kstp + 1.), h2).tofile(f)
+            np.array(3, np.int32).tofile(f)
+            np.array([(1, q[0]), (4, q[1]), (1, q[2])], dt).tofile(f)
+    with flopy.utils.CellBudgetFile(fpth) as v:
+        assert v.realtype == np.float64
+        ts = v.get_ts([(0, 0, 0), (0, 1, 0), (0, 0, 1)], text='WELLS')
+    assert np.array_equal(ts[:, 0], [1., 2.])
+    assert np.all(ts[:, 1] == q[0] + q[2])
+    assert np.all(ts[:, 2] == q[1])
+    assert np.all(np.isnan(ts[:, 3]))
+    return
+
+
 def test_cellbudgetfile_position():
 
     fpth = os.path.join('..', 'examples', 'data', 'zonbud_examples',
@@ -361,6 +608,8 @@ def test_binaryfile_writeread():
 
 if __name__ == '__main__':
     test_cellbudgetfile_position()
+    test_cellbudgetfile_recorddict()
+    test_cellbudgetfile_get_ts_list_double()
     test_binaryfile_writeread()
     test_formattedfile_read()
     test_binaryfile_read()
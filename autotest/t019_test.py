@@ -134,6 +134,41 @@ def test_hydmodfile_read():
     return
 
 
+def test_hydmodfile_obsname():
+    import os
+    import numpy as np
+    import flopy
+
+    pth = os.path.join('..', 'examples', 'data', 'hydmod_test',
+                       'test1tr.hyd.gitbin')
+    h = flopy.utils.HydmodObs(pth)
+    obsnames = ['HDC001HDOBS3', 'SO008006SFROT1']
+    hsub = flopy.utils.HydmodObs(pth, obsname=obsnames)
+    assert hsub.get_obsnames() == obsnames, \
+        'subset obsnames are not {}'.format(obsnames)
+    assert hsub.get_times() == h.get_times(), \
+        'subset times are not equal to the file times'
+    for obsname in obsnames:
+        assert np.array_equal(hsub.get_data(obsname=obsname),
+                              h.get_data(obsname=obsname)), \
+            'subset data for {} not equal to the file data'.format(obsname)
+    assert hsub.get_nobs() == len(obsnames), \
+        'subset nobs is not {}'.format(len(obsnames))
+
+    # repeated names are only loaded once
+    hsub = flopy.utils.HydmodObs(pth, obsname=obsnames + obsnames[:1])
+    assert hsub.get_obsnames() == obsnames, \
+        'repeated obsnames are not {}'.format(obsnames)
+
+    try:
+        flopy.utils.HydmodObs(pth, obsname='NOTANOBS')
+        raise AssertionError('an invalid obsname did not raise an error')
+    except Exception as e:
+        assert 'did not match' in str(e)
+
+    return
+
+
 def test_mf6obsfile_read():
     import os
     import flopy
@@ -212,8 +247,56 @@ def test_mf6obsfile_read():
     return
 
 
+def test_mf6_csv_observations():
+    import os
+    import shutil
+    import numpy as np
+    from flopy.mf6.utils.mfobservation import Observations
+
+    src = os.path.join('..', 'examples', 'data', 'mf6', 'test045_lake2tr',
+                       'lakeex2a.lak.csv')
+    pth = os.path.join(mpth, 'lakeex2a.lak.csv')
+    shutil.copyfile(src, pth)
+    with open(src) as f:
+        names = f.readline().strip().split(',')
+    ref = np.loadtxt(src, delimiter=',', skiprows=1)
+
+    obs = Observations(pth)
+    assert obs.get_ntimes() == ref.shape[0], 'number of times is not correct'
+    assert obs.get_nrecords() == len(names), \
+        'number of records is not correct'
+    assert np.allclose(obs.get_times(), ref[:, 0]), 'times are not correct'
+    for idx, key in enumerate(names):
+        assert np.allclose(obs.get_data(key=key), ref[:, idx]), \
+            'data for {} is not correct'.format(key)
+    assert obs.get_data(key='L1STAGE', idx=2) == ref[2, 1]
+    assert obs.get_data(key='L2VOL', totim=ref[3, 0]) == ref[3, 4]
+
+    # the parsed file is cached until the file changes
+    with open(pth, 'w') as f:
+        f.write('time,OBS1\n1.,10.\n2.,20.\n')
+    obs = Observations(pth)
+    assert obs.get_times() == [1., 2.], 'changed file was not read'
+    assert obs.get_data(key='OBS1') == [10., 20.], 'changed file was not read'
+
+    # only the most recently used files are kept in the cache
+    from flopy.mf6.utils import mfobservation
+    for i in range(mfobservation._observation_cache_size + 1):
+        fpth = os.path.join(mpth, 'obs{}.csv'.format(i))
+        with open(fpth, 'w') as f:
+            f.write('time,OBS1\n1.,{}.\n'.format(i))
+        assert Observations(fpth).get_data(key='OBS1') == [float(i)]
+    assert len(mfobservation._observation_cache) == \
+        mfobservation._observation_cache_size
+    assert os.path.abspath(pth) not in mfobservation._observation_cache
+
+    return
+
+
 if __name__ == '__main__':
     test_mf6obsfile_read()
     test_hydmodfile_create()
     test_hydmodfile_load()
     test_hydmodfile_read()
+    test_hydmodfile_obsname()
+    test_mf6_csv_observations()
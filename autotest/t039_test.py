@@ -5,6 +5,7 @@ import os
 import numpy as np
 from flopy.utils import CellBudgetFile, ZoneBudget, \
     MfListBudget, read_zbarray, write_zbarray
+from flopy.utils.zonbud import sum_flux_tuples
 
 loadpth = os.path.join('..', 'examples', 'data', 'zonbud_examples')
 outpth = os.path.join('temp', 't039')
@@ -369,6 +370,29 @@ def test_zonbud_active_areas_zone_zero(rtol=1e-2):
     return
 
 
+def test_zonbud_processes():
+    # Compute the budgets of all time steps in worker processes
+    cbc_pth = os.path.join('..', 'examples', 'data', 'mf2005_test',
+                           'test1tr.gitcbc')
+    cbc = CellBudgetFile(cbc_pth)
+    zon = np.ones(cbc.get_data(idx=0, full3D=True)[0].shape, np.int32)
+    zon[..., :zon.shape[-1] // 2] = 2
+    zon[..., zon.shape[-2] // 2:, :] += 2
+    zb = ZoneBudget(cbc, zon)
+    zbp = ZoneBudget(cbc_pth, zon, processes=2)
+    assert len(zb.get_budget()) > 0
+    assert zb.get_budget().tobytes() == zbp.get_budget().tobytes(), \
+        'Zonebudget arrays computed in worker processes do not match.'
+
+    # Flow between zones is summed for each (from zone, to zone) pair
+    fz, tz, f = sum_flux_tuples([2, 1, 2, 1], [1, 3, 1, 3],
+                                np.array([1., 2., 3., 4.], np.float32))
+    assert np.array_equal(fz, [1, 2])
+    assert np.array_equal(tz, [3, 1])
+    assert np.array_equal(f, [6., 4.])
+    return
+
+
 if __name__ == '__main__':
     # test_compare2mflist_mlt()
     test_compare2zonebudget()
@@ -383,3 +407,4 @@ if __name__ == '__main__':
     test_get_model_shape()
     test_zonebudget_output_to_netcdf()
     test_zonbud_active_areas_zone_zero()
+    test_zonbud_processes()
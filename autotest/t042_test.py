@@ -95,6 +95,45 @@ def test_get_sat_thickness_gradients():
     sat_thick = get_saturated_thickness(hds, m, nodata)
     assert np.abs(np.sum(sat_thick[:, 1, 1] - np.array([0.2, 1., 1.]))) < 1e-6
 
+    sat_thick = get_saturated_thickness(hds, m, nodata, per_idx=[])
+    assert sat_thick.shape == (0, nl, nr, nc)
+
+def test_get_water_table_headfile():
+    import os
+    import flopy.utils.postprocessing as pp
+    hds_path = os.path.join('..', 'examples', 'data', 'mf6', 'create_tests',
+                            'test005_advgw_tidal', 'expected_output',
+                            'AdvGW_tidal.hds')
+    nodata = 1e30
+    with flopy.utils.HeadFile(hds_path) as hf:
+        hds = hf.get_alldata()
+        # make the top layer dry in part of the model
+        hds[10:20, 0, :5, :] = nodata
+        wt = get_water_table(hds, nodata=nodata)
+        assert wt.shape == (hds.shape[0],) + hds.shape[2:]
+        assert np.array_equal(wt[10:20, :5], hds[10:20, 1, :5])
+        assert np.array_equal(wt[:10], hds[:10, 0])
+
+        # heads read from the file through the memory-mapped view
+        wt = get_water_table(hf, nodata=nodata, per_idx=[3, 1])
+        assert np.array_equal(wt, hds[[3, 1], 0])
+
+        # process the heads one stress period at a time
+        chunk_size = pp._HEAD_CHUNK_SIZE
+        try:
+            pp._HEAD_CHUNK_SIZE = 1
+            wt2 = get_water_table(hds, nodata=nodata)
+            assert np.array_equal(wt2, get_water_table(hds, nodata=nodata))
+        finally:
+            pp._HEAD_CHUNK_SIZE = chunk_size
+
+        # no stress periods requested
+        wt = get_water_table(hf, nodata=nodata, per_idx=[])
+        assert wt.shape == (0,) + hds.shape[2:]
+        wt = get_water_table(hds, nodata=nodata, per_idx=[])
+        assert wt.shape == (0,) + hds.shape[2:]
+        assert wt.dtype == hds.dtype
+
 if __name__ == '__main__':
     #test_get_transmissivities()
     #test_get_water_table()
@@ -295,6 +295,89 @@ def test_mp5_load():
     return
 
 
+def test_mp7_pathline_offsets():
+    # write a small MODPATH 7 pathline file with unsorted particles
+    fpth = os.path.join(cpth, 'offsets.mppth')
+    rng = np.random.RandomState(49)
+    npart = 25
+    with open(fpth, 'w') as f:
+        f.write('MODPATH_PATHLINE_FILE         7         2\n')
+        f.write('    1    0.0    0.0    0.0    0.0\n')
+        f.write('END HEADER\n')
+        for seq in rng.permutation(npart) + 1:
+            nrow = rng.randint(1, 10)
+            f.write('{:10d}{:10d}{:10d}{:10d}\n'.format(seq, 1, seq, nrow))
+            times = np.sort(rng.rand(nrow)) * 100.
+            for t in times:
+                f.write('{:10d} {:16.8E} {:16.8E} {:16.8E} '.format(
+                    seq, 1., 1., 1.) +
+                        '{:16.8E} {:16.8E} {:16.8E} {:16.8E}'.format(
+                            t, 0.5, 0.5, 0.5) +
+                        '{:5d}{:5d}{:5d}\n'.format(1, 1, 1))
+
+    pthobj = flopy.utils.PathlineFile(fpth)
+    assert pthobj.get_maxid() == npart - 1
+    assert np.array_equal(pthobj.nid, np.arange(npart))
+
+    plines = pthobj.get_alldata()
+    assert len(plines) == npart
+    for n, p in enumerate(plines):
+        assert np.all(p['particleid'] == n)
+        assert np.array_equal(p, pthobj.get_data(partid=n))
+        assert np.all(np.diff(p['time']) >= 0.)
+
+    # stream the data in small blocks without loading the file
+    pthobj = flopy.utils.PathlineFile(fpth, load_data=False)
+    pthobj._blocksize = 7
+    totim = 50.
+    streamed = {p['particleid'][0]: p
+                for p in pthobj.iter_data(totim=totim, ge=False)
+                if p.shape[0] > 0}
+    plines = [p for p in
+              flopy.utils.PathlineFile(fpth).get_alldata(totim=totim, ge=False)
+              if p.shape[0] > 0]
+    assert len(streamed) == len(plines)
+    for p in plines:
+        assert np.array_equal(p, streamed[p['particleid'][0]])
+
+    return
+
+
+def test_endpoint_cache():
+    # copy an endpoint file so the cache is written to the temp directory
+    src = os.path.join('..', 'examples', 'data', 'mp6', 'EXAMPLE-2.endpoint')
+    fpth = os.path.join(cpth, 'EXAMPLE-2.endpoint')
+    shutil.copy(src, fpth)
+
+    endobj = flopy.utils.EndpointFile(fpth)
+    endcache = flopy.utils.EndpointFile(fpth, cache=True)
+    assert os.path.isfile(fpth + '.npy'), 'endpoint cache was not written'
+    endcache = flopy.utils.EndpointFile(fpth, cache=True)
+    assert isinstance(endcache._data, np.memmap), \
+        'endpoint data were not read from the cache'
+    epts = endobj.get_alldata()
+    assert np.array_equal(epts, endcache.get_alldata())
+
+    # indexed queries
+    for n in range(0, endobj.nid, 37):
+        assert np.array_equal(endcache.get_data(n),
+                              epts[epts['particleid'] == n])
+    groups = np.unique(epts['particlegroup'])[:2]
+    e = endcache.get_group_data(groups)
+    assert np.array_equal(e, epts[np.isin(epts['particlegroup'], groups)])
+    tmax = np.median(epts['time'])
+    e = endcache.get_time_data(maxtime=tmax)
+    assert np.array_equal(e, epts[epts['time'] <= tmax])
+    cells = [tuple(c) for c in epts[['k', 'i', 'j']][::25].tolist()]
+    e = endcache.get_destination_endpoint_data(cells)
+    idx = np.zeros(epts.shape[0], dtype=bool)
+    for k, i, j in cells:
+        idx |= (epts['k'] == k) & (epts['i'] == i) & (epts['j'] == j)
+    assert np.array_equal(e, epts[idx])
+
+    return
+
+
 def test_mp5_timeseries_load():
     pth = os.path.join('..', 'examples', 'data', 'mp5')
     files = [os.path.join(pth, name) for name in sorted(os.listdir(pth))
@@ -395,5 +478,7 @@ if __name__ == '__main__':
     test_modpath()
     test_pathline_plot()
     test_mp5_load()
+    test_mp7_pathline_offsets()
+    test_endpoint_cache()
     test_mp5_timeseries_load()
     test_mp6_timeseries_load()
@@ -495,6 +495,79 @@ def test_vtk_vti():
 
     return
 
+def test_vtk_unstructured_connectivity():
+    # model with non-uniform spacing and an inactive cell
+    name = 'test_vtu_connectivity'
+    m = flopy.modflow.Modflow(name)
+    nlay, nrow, ncol = 2, 3, 4
+    botm = np.array([np.ones((nrow, ncol)), np.zeros((nrow, ncol))])
+    flopy.modflow.ModflowDis(m, nlay, nrow, ncol, delr=np.arange(1., 5.),
+                             delc=np.arange(1., 4.), top=2., botm=botm)
+    ibound = np.ones((nlay, nrow, ncol), dtype=int)
+    ibound[0, 0, 0] = 0
+    flopy.modflow.ModflowBas(m, ibound=ibound)
+
+    vtkobj = vtk.Vtk(m, vtk_grid_type='UnstructuredGrid', binary=True)
+    verts, iverts, zverts = vtkobj._get_3d_vertex_connectivity()
+    ncells = nlay * nrow * ncol - 1
+    assert verts.shape == (ncells, 8, 3)
+    assert iverts.shape == (ncells, 8)
+    assert np.array_equal(iverts.ravel(), np.arange(ncells * 8))
+
+    # check the vertices of the last cell against the model grid
+    xv, yv, zv = m.modelgrid.xyzvertices
+    cell = verts[-1]
+    assert np.allclose(cell[:, 0], [xv[3, 3], xv[3, 4], xv[2, 3], xv[2, 4]] * 2)
+    assert np.allclose(cell[:, 1], [yv[3, 3], yv[3, 4], yv[2, 3], yv[2, 4]] * 2)
+    assert np.allclose(zverts[-1], [0.] * 4 + [1.] * 4)
+
+    # the geometry is reused for time steps with the same active cells
+    output_dir = os.path.join(cpth, name)
+    os.makedirs(output_dir)
+    for kper in range(2):
+        vtkobj.add_array('head', np.full((nlay, nrow, ncol), float(kper)))
+        vtkobj.write(os.path.join(output_dir, 'head{}'.format(kper)))
+        assert vtkobj._get_3d_vertex_connectivity()[0] is verts
+        assert os.path.exists(
+            os.path.join(output_dir, 'head{}.vtu'.format(kper)))
+
+    # and rebuilt when the active cells change
+    head = np.ones((nlay, nrow, ncol))
+    head[1, 2, 3] = np.nan
+    vtkobj.add_array('head', head)
+    vtkobj.write(os.path.join(output_dir, 'head2'))
+    assert vtkobj._geometry['verts'].shape == (ncells - 1, 8, 3)
+
+    return
+
+def test_vtk_transient_processes():
+    # write the stress periods of a transient array with worker processes
+    name = 'test_vtk_processes'
+    m = flopy.modflow.Modflow(name)
+    nlay, nrow, ncol, nper = 2, 3, 4, 5
+    botm = np.array([np.ones((nrow, ncol)), np.zeros((nrow, ncol))])
+    flopy.modflow.ModflowDis(m, nlay, nrow, ncol, nper=nper, top=2.,
+                             botm=botm)
+    array = np.arange(nper * nlay * nrow * ncol, dtype=float).reshape(
+        (nper, nlay, nrow, ncol))
+
+    output_dir = os.path.join(cpth, name)
+    vtk.export_transient(m, array, output_dir, 'a', binary=True,
+                         vtk_grid_type='UnstructuredGrid')
+    vtk.export_transient(m, array, output_dir + '_processes', 'a',
+                         binary=True, vtk_grid_type='UnstructuredGrid',
+                         processes=2)
+    for kper in range(nper):
+        filename = 'a_0{}.vtu'.format(kper + 1)
+        with open(os.path.join(output_dir, filename), 'rb') as f:
+            expected = f.read()
+        with open(os.path.join(output_dir + '_processes', filename),
+                  'rb') as f:
+            assert f.read() == expected, \
+                '{} differs when written by a worker process'.format(filename)
+
+    return
+
 def test_vtk_vtr():
     # test mf 2005 l1a2k
     mpth = os.path.join('..', 'examples', 'data', 'mf2005_test')
@@ -810,6 +883,8 @@ if __name__ == '__main__':
     test_vtk_cbc()
     test_vtk_vector()
     test_vtk_vti()
+    test_vtk_unstructured_connectivity()
+    test_vtk_transient_processes()
     test_vtk_vtr()
     test_vtk_export_true2d_regular()
     test_vtk_export_true2d_nonregxy()
@@ -142,5 +142,77 @@ def test_intersection():
             assert all(np.isnan([row, col, cell2d_disv]))
 
 
+def test_intersection_arrays():
+    dis_grid = dis_model().modelgrid
+    disv_grid = disv_model().modelgrid
+
+    # points inside and outside of the grid
+    xp = np.linspace(-240., 10260., 43)
+    yp = np.linspace(-240., 10760., 45)
+    xp, yp = [a.ravel() for a in np.meshgrid(xp, yp)]
+    for local in (True, False):
+        x, y = xp, yp
+        if local:
+            # add points on cell edges
+            x = np.concatenate((x, np.arange(0., 10001., delr),
+                                np.full(nrow + 1, 1000.)))
+            y = np.concatenate((y, np.full(ncol + 1, 2000.),
+                                np.arange(0., 10501., delc)))
+        else:
+            x, y = dis_grid.get_coords(x, y)
+        row, col = dis_grid.intersect(x, y, local, forgive=True)
+        cell2d_disv = disv_grid.intersect(x, y, local, forgive=True)
+        assert row.shape == col.shape == cell2d_disv.shape == x.shape
+        assert np.array_equal(np.isnan(cell2d_disv), np.isnan(row))
+        cell2d_dis = row * dis_grid.ncol + col
+        assert np.array_equal(cell2d_dis, cell2d_disv, equal_nan=True)
+
+        # same results as locating the points one at a time
+        for i in range(x.size):
+            r, c = dis_grid.intersect(x[i], y[i], local, forgive=True)
+            assert np.array_equal([r, c], [row[i], col[i]], equal_nan=True)
+            icell2d = disv_grid.intersect(x[i], y[i], local, forgive=True)
+            assert np.array_equal(icell2d, cell2d_disv[i], equal_nan=True)
+
+        try:
+            disv_grid.intersect(x, y, local)
+            raise AssertionError('points outside of grid were not trapped')
+        except Exception as e:
+            assert 'outside of the model area' in str(e)
+
+
+def test_intersection_unstructured():
+    verts = [[iv, xv, yv] for iv, (xv, yv) in enumerate(
+        [(0., 0.), (1., 0.), (2., 0.), (0., 1.), (1., 1.), (2., 1.),
+         (0., 2.), (1., 2.), (2., 2.)])]
+    iverts = [[3, 4, 1, 0], [4, 5, 2, 1], [6, 7, 4, 3], [7, 8, 5, 4]]
+    xc = [0.5, 1.5, 0.5, 1.5]
+    yc = [0.5, 0.5, 1.5, 1.5]
+    mg = flopy.discretization.UnstructuredGrid(vertices=verts, iverts=iverts,
+                                               xcenters=xc, ycenters=yc)
+    assert mg.intersect(0.2, 0.2) == 0
+    # vertex shared by all of the cells
+    assert mg.intersect(1., 1.) == 0
+    nodes = mg.intersect([0.2, 1.7, 5.], [1.2, 0.1, 5.], forgive=True)
+    assert np.array_equal(nodes, [2, 1, np.nan], equal_nan=True)
+
+    # cached cell index is updated with the coordinate information
+    mg.set_coord_info(xoff=10., yoff=0., angrot=0.)
+    assert mg.intersect(11.7, 0.1) == 1
+    assert mg.intersect(1.7, 0.1, local=True) == 1
+
+    # grid that varies by layer
+    mg = flopy.discretization.UnstructuredGrid(vertices=verts,
+                                               iverts=iverts + iverts[:1],
+                                               xcenters=xc + xc[:1],
+                                               ycenters=yc + yc[:1],
+                                               ncpl=[4, 1])
+    assert mg.intersect(1.5, 1.5) == 3
+    assert mg.intersect(0.5, 0.5, layer=1) == 4
+    assert np.isnan(mg.intersect(1.5, 1.5, layer=1, forgive=True))
+
+
 if __name__ == '__main__':
-    test_intersection()
\ No newline at end of file
+    test_intersection()
+    test_intersection_arrays()
+    test_intersection_unstructured()
\ No newline at end of file
@@ -1212,6 +1212,50 @@ def test_all_intersections_shapely_no_strtree():
     return ix
 
 
+# %% test batch intersect
+
+
+def test_intersect_batch():
+    # avoid test fail when shapely not available
+    try:
+        import shapely
+    except:
+        return
+    polys = [Polygon([(x, y), (x + 7.5, y), (x + 7.5, y + 7.5), (x, y + 7.5)])
+             for x, y in [(2.5, 2.5), (7.5, 7.5), (12.5, 2.5), (25., 25.)]]
+    lines = [LineString([(5., 1.), (5., 19.)]),
+             LineString([(1., 15.), (19., 5.)])]
+    points = [Point(1., 1.), MultiPoint([(5., 15.), (15., 5.)])]
+    for gr, method in [(get_rect_grid(), "structured"),
+                       (get_rect_grid(), "vertex"),
+                       (get_tri_grid(), "vertex")]:
+        ix = GridIntersect(gr, method=method)
+        for shapes in (polys, lines, points):
+            expected = [ix.intersect(shp) for shp in shapes]
+            for processes in (None, 2):
+                result = ix.intersect_batch(shapes, processes=processes)
+                assert len(result) == sum(len(r) for r in expected)
+                i0 = 0
+                for i, rec in enumerate(expected):
+                    batch = result[i0:i0 + len(rec)]
+                    assert (batch.shpids == i).all()
+                    assert list(batch.cellids) == list(rec.cellids)
+                    i0 += len(rec)
+                if shapes is polys:
+                    assert np.allclose(result.areas,
+                                       np.concatenate([r.areas
+                                                       for r in expected]))
+    # all shapes must give the same type of intersection
+    try:
+        ix.intersect_batch([polys[0], points[0]])
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("mixed shape types should raise TypeError")
+    assert len(ix.intersect_batch([])) == 0
+    return
+
+
 # %% test rasters
 
 
@@ -0,0 +1,87 @@
+"""
+Test running models with flopy.run_model and flopy.run_models, using the
+python interpreter as the model executable.
+
+"""
+
+import os
+import sys
+import time
+import flopy
+
+tpth = os.path.join("temp", "t076")
+if not os.path.isdir(tpth):
+    os.makedirs(tpth)
+
+script = """import sys
+import time
+print("starting model")
+sys.stdout.flush()
+time.sleep(float(sys.argv[1]))
+print("Normal termination of simulation")
+"""
+
+
+def write_script():
+    fname = "model.py"
+    with open(os.path.join(tpth, fname), "w") as f:
+        f.write(script)
+    return fname
+
+
+def test_run_model():
+    fname = write_script()
+    for use_async in (False, True):
+        success, buff = flopy.run_model(
+            sys.executable,
+            fname,
+            model_ws=tpth,
+            silent=True,
+            report=True,
+            use_async=use_async,
+            cargs="0.1",
+        )
+        assert success
+        assert len(buff) == 2
+        assert "normal termination" in buff[-1].lower()
+
+    # kill the model if it runs too long
+    t0 = time.time()
+    success, buff = flopy.run_model(
+        sys.executable,
+        fname,
+        model_ws=tpth,
+        silent=True,
+        report=True,
+        cargs="30",
+        timeout=1.0,
+    )
+    assert not success
+    assert time.time() - t0 < 20.0
+    assert "stopped after" in buff[-1]
+
+
+def test_run_models():
+    fname = write_script()
+    runs = [
+        {"exe_name": sys.executable, "namefile": fname, "model_ws": tpth,
+         "cargs": "1"}
+        for _ in range(4)
+    ]
+    runs.append(
+        {"exe_name": sys.executable, "namefile": fname, "model_ws": tpth,
+         "cargs": "30"}
+    )
+    t0 = time.time()
+    results = flopy.run_models(runs, max_workers=5, timeout=5.0, report=True)
+    assert time.time() - t0 < 20.0
+    assert len(results) == len(runs)
+    for success, buff in results[:-1]:
+        assert success
+        assert len(buff) == 2
+    assert not results[-1][0]
+
+
+if __name__ == "__main__":
+    test_run_model()
+    test_run_models()
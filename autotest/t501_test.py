@@ -115,5 +115,141 @@ def test_mf6():
 
     return
 
+
+def test_package_registry():
+    from flopy.mf6.mfbase import PackageContainer
+    from flopy.mf6.data.mfstructure import MFStructure
+
+    assert PackageContainer.package_factory('npf', 'gwf') is \
+        flopy.mf6.ModflowGwfnpf
+    assert PackageContainer.package_factory('obs', 'gwf') is \
+        flopy.mf6.ModflowUtlobs
+    assert PackageContainer.package_factory('xyz', 'gwf') is None
+    assert PackageContainer.model_factory('gwf') is flopy.mf6.ModflowGwf
+    packages = PackageContainer.package_factory(None, None)
+    assert flopy.mf6.ModflowGwfdis in packages
+    assert not any(p.package_abbr.endswith('packages') for p in packages)
+
+    # package structures are built when first used
+    gwf_struct = MFStructure().sim_struct.model_struct_objs['gwf6']
+    assert 'rch' in gwf_struct.package_struct_objs
+    assert gwf_struct.package_struct_objs['rcha'].read_as_arrays
+    assert not gwf_struct.package_struct_objs['rch'].read_as_arrays
+    return
+
+
+def test_structure_cache():
+    from flopy.mf6.data.mfstructure import MFStructure
+
+    cache_dir = os.path.join('temp', 't501', 'structure_cache')
+    if os.path.isdir(cache_dir):
+        shutil.rmtree(cache_dir)
+    instance, MFStructure._instance = MFStructure._instance, None
+    structure_cache_dir, MFStructure.cache_dir = MFStructure.cache_dir, \
+        cache_dir
+    try:
+        # the first structure is built from the package classes and stored
+        structure = MFStructure()
+        cache_files = os.listdir(cache_dir)
+        assert len(cache_files) == 1
+        assert cache_files[0].startswith('mfstructure_')
+        npf = structure.sim_struct.model_struct_objs['gwf6'] \
+            .package_struct_objs['npf']
+
+        # later structures are loaded from the cache
+        MFStructure._instance = None
+        cached = MFStructure()
+        assert cached is not structure
+        assert cached.valid
+        cached_npf = cached.sim_struct.model_struct_objs['gwf6'] \
+            .package_struct_objs['npf']
+        assert list(cached_npf.blocks) == list(npf.blocks)
+        assert len(cached.dimension_dict) == len(structure.dimension_dict)
+    finally:
+        MFStructure._instance = instance
+        MFStructure.cache_dir = structure_cache_dir
+    return
+
+
+def test_list_file_entry():
+    sim = flopy.mf6.MFSimulation(sim_ws=os.path.join('temp', 't501'))
+    flopy.mf6.ModflowTdis(sim, nper=2)
+    gwf = flopy.mf6.ModflowGwf(sim, modelname='list')
+    flopy.mf6.ModflowGwfdis(gwf, nlay=2, nrow=3, ncol=4)
+    spd = {0: [((0, 1, 2), -150.0, 1.0e-4, 'well a'),
+               ((1, 2, 3), 0.0, 2.5, 'wellb')],
+           1: [((0, 0, 0), 2.0e6, 1.0, 'wellc'),
+               ((1, 0, 1), -0.5, 1.0, None)]}
+    wel = flopy.mf6.ModflowGwfwel(gwf, stress_period_data=spd,
+                                  auxiliary=['conc'], boundnames=True)
+
+    # simple lists are formatted a column at a time
+    entry = wel.stress_period_data.get_file_entry(0).splitlines()
+    assert entry == [
+        "  1 2 3    -150.00000000  1.00000000E-04  'well a'",
+        '  2 3 4       0.00000000       2.50000000  wellb',
+    ]
+
+    # lists with missing values are formatted line by line
+    entry = wel.stress_period_data.get_file_entry(1).splitlines()
+    assert entry == [
+        '  1 1 1  2.00000000E+06       1.00000000  wellc',
+        '  2 1 2      -0.50000000       1.00000000',
+    ]
+    return
+
+
+def test_output_requester():
+    import numpy as np
+    from flopy.mf6.utils.binaryfile_utils import MFOutputArray
+
+    sim_ws = os.path.join('..', 'examples', 'data', 'mf6-freyberg')
+    sim = flopy.mf6.MFSimulation.load(sim_ws=sim_ws, verbosity_level=0)
+    mfdata = sim.simulation_data.mfdata
+
+    # binary output is returned as a lazy array of records
+    heads = mfdata[('gwf_1', 'HDS', 'HEAD')]
+    assert isinstance(heads, MFOutputArray)
+    hds = flopy.utils.HeadFile(os.path.join(sim_ws, 'freyberg.hds'))
+    ref = hds.get_alldata()
+    assert heads.shape == ref.shape
+    assert np.allclose(np.array(heads), ref)
+    assert np.allclose(heads[-1], ref[-1])
+    assert np.allclose(heads[:, 0, 10, :], ref[:, 0, 10, :])
+    assert np.allclose(heads - ref, 0.)
+
+    # ndarray methods and boolean masks are applied to all of the records
+    assert heads.max() == ref.max()
+    assert np.allclose(heads.mean(axis=0), ref.mean(axis=0), equal_nan=True)
+    assert heads.reshape(len(ref), -1).shape == (len(ref), ref[0].size)
+    assert heads.T.shape == ref.T.shape
+    assert np.allclose(heads.copy(), ref, equal_nan=True)
+    mask = ref > 30.
+    assert np.allclose(heads[heads > 30.], ref[mask])
+    assert np.allclose(heads[mask], ref[mask])
+    assert np.allclose(heads[[0, -1]], ref[[0, -1]])
+
+    # the binary file is only open while records are read
+    assert heads._bindata.file.closed
+
+    cbc = flopy.utils.CellBudgetFile(os.path.join(sim_ws, 'freyberg.cbc'))
+    storage = mfdata[('gwf_1', 'CBC', 'STO-SS')]
+    ref = np.array(cbc.get_data(text='STO-SS', full3D=True))
+    assert storage.shape == ref.shape
+    assert np.allclose(storage[0], ref[0])
+
+    # imeth 6 budget records are returned as list data
+    wel = mfdata[('gwf_1', 'CBC', 'WEL')]
+    ref = cbc.get_data(text='WEL')
+    assert len(wel) == len(ref)
+    assert np.allclose(wel[0]['q'], ref[0]['q'])
+    heads.close()
+    return
+
+
 if __name__ == '__main__':
     test_mf6()
+    test_package_registry()
+    test_structure_cache()
+    test_list_file_entry()
+    test_output_requester()
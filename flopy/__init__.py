@@ -35,4 +35,4 @@ from . import pest
 from . import mf6
 from . import discretization
 
-from .mbase import run_model, which
+from .mbase import run_model, run_models, which
@@ -17,11 +17,31 @@ class CachedData(object):
     def data(self):
         return copy.deepcopy(self._data)
 
+    @property
+    def data_readonly(self):
+        return _readonly_view(self._data)
+
     def update_data(self, data):
         self._data = data
         self.out_of_date = False
 
 
+def _readonly_view(data):
+    """
+    Return numpy arrays in data as views that cannot be written to.  Lists
+    and tuples are rebuilt with the same (read-only) items, so the cached
+    data itself is never copied.
+    """
+    if isinstance(data, np.ndarray):
+        if data.flags.writeable:
+            data = data.view()
+            data.flags.writeable = False
+        return data
+    elif isinstance(data, (list, tuple)):
+        return type(data)(_readonly_view(item) for item in data)
+    return data
+
+
 class Grid(object):
     """
     Base class for a structured or unstructured model grid
@@ -49,6 +69,10 @@ class Grid(object):
         in the spatial reference coordinate system
     rotation : float
         rotation angle of model grid, as it is rotated around the origin point
+    readonly_cache : bool
+        if True, cached grid geometry is returned as read-only numpy views
+        of the cached arrays, or as tuples for the vertices of each cell,
+        instead of deep copies. Defaults to False.
 
     Attributes
     ----------
@@ -101,6 +125,11 @@ class Grid(object):
         information. otherwise the cell centers are based on a 0,0 location
         for the upper left corner of the model grid. returns a list of three
         ndarrays for the x, y, and z coordinates
+    readonly_cache : bool
+        if True, cached grid geometry (cell centers, vertices, edges, ...) is
+        returned as read-only numpy views of the cached arrays, or as tuples
+        for the vertices of each cell, instead of deep copies. Defaults to
+        False.
 
     Methods
     ----------
@@ -116,7 +145,8 @@ class Grid(object):
         (single layer) in C-style (row-major) order
         (same as np.ravel())
     intersect(x, y, local)
-        returns the row and column of the grid that the x, y point is in
+        returns the row and column of the grid that the x, y point or
+        arrays of points are in
 
     See Also
     --------
@@ -128,6 +158,9 @@ class Grid(object):
     --------
     """
 
+    # points within this distance of a cell edge are inside the cell
+    _intersect_tolerance = 1e-9
+
     def __init__(
         self,
         grid_type=None,
@@ -141,6 +174,7 @@ class Grid(object):
         xoff=0.0,
         yoff=0.0,
         angrot=0.0,
+        readonly_cache=False,
     ):
         lenunits = {0: "undefined", 1: "feet", 2: "meters", 3: "centimeters"}
         LENUNI = {"u": 0, "f": 1, "m": 2, "c": 3}
@@ -171,6 +205,7 @@ class Grid(object):
         self._angrot = angrot
         self._cache_dict = {}
         self._copy_cache = True
+        self._readonly_cache = bool(readonly_cache)
 
     ###################################
     # access to basic grid properties
@@ -264,6 +299,14 @@ class Grid(object):
     def prj(self, prj):
         self._proj4 = prj
 
+    @property
+    def readonly_cache(self):
+        return self._readonly_cache
+
+    @readonly_cache.setter
+    def readonly_cache(self, readonly_cache):
+        self._readonly_cache = bool(readonly_cache)
+
     @property
     def top(self):
         return copy.deepcopy(self._top)
@@ -444,6 +487,142 @@ class Grid(object):
         else:
             return x, y
 
+    def _get_cell_index(self, istart=0, istop=None):
+        """
+        Get closed, padded cell polygon arrays and a bounding-box bin
+        index of the cells in xyzvertices[istart:istop].  The index is
+        cached and rebuilt when the grid geometry changes.
+        """
+        cache_index = "cellindex_{}_{}".format(istart, istop)
+        if (
+            cache_index not in self._cache_dict
+            or self._cache_dict[cache_index].out_of_date
+        ):
+            self._copy_cache = False
+            xverts, yverts = self.xyzvertices[:2]
+            self._copy_cache = True
+            xverts = xverts[istart:istop]
+            yverts = yverts[istart:istop]
+
+            # pad each polygon with its first vertex, which closes it
+            nv = np.array([len(v) for v in xverts], dtype=int)
+            ncell = nv.size
+            offsets = np.cumsum(nv) - nv
+            icell = np.repeat(np.arange(ncell), nv)
+            ivert = np.arange(nv.sum()) - np.repeat(offsets, nv)
+            xflat = np.concatenate(xverts).astype(float)
+            yflat = np.concatenate(yverts).astype(float)
+            xv = np.repeat(xflat[offsets], nv.max() + 1).reshape(ncell, -1)
+            yv = np.repeat(yflat[offsets], nv.max() + 1).reshape(ncell, -1)
+            xv[icell, ivert] = xflat
+            yv[icell, ivert] = yflat
+
+            # assign the cells to the bins that their bounding boxes overlap
+            tol = self._intersect_tolerance
+            xmin, xmax = xv.min(axis=1) - tol, xv.max(axis=1) + tol
+            ymin, ymax = yv.min(axis=1) - tol, yv.max(axis=1) + tol
+            x0, y0 = xmin.min(), ymin.min()
+            nbx = nby = max(1, int(np.sqrt(ncell)))
+            dx = (xmax.max() - x0) / nbx
+            dy = (ymax.max() - y0) / nby
+            ix0 = np.clip(((xmin - x0) // dx).astype(int), 0, nbx - 1)
+            ix1 = np.clip(((xmax - x0) // dx).astype(int), 0, nbx - 1)
+            iy0 = np.clip(((ymin - y0) // dy).astype(int), 0, nby - 1)
+            iy1 = np.clip(((ymax - y0) // dy).astype(int), 0, nby - 1)
+            nbinx = ix1 - ix0 + 1
+            nbin = nbinx * (iy1 - iy0 + 1)
+            icell = np.repeat(np.arange(ncell), nbin)
+            k = np.arange(nbin.sum()) - np.repeat(np.cumsum(nbin) - nbin, nbin)
+            ibin = (iy0[icell] + k // nbinx[icell]) * nbx + (
+                ix0[icell] + k % nbinx[icell]
+            )
+            order = np.lexsort((icell, ibin))
+            start = np.searchsorted(ibin[order], np.arange(nbx * nby + 1))
+            self._cache_dict[cache_index] = CachedData(
+                [xv, yv, (x0, y0, dx, dy, nbx, nby), start, icell[order]]
+            )
+        return self._cache_dict[cache_index].data_nocopy
+
+    def _intersect_cells(
+        self, x, y, local=False, forgive=False, istart=0, istop=None
+    ):
+        """
+        Get the cell number of points with coordinates x and y using the
+        cell polygons in xyzvertices[istart:istop].  Points on the edge of
+        two cells are assigned to the cell with the lowest cell number.
+        """
+        scalar = np.isscalar(x) and np.isscalar(y)
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        x, y = np.broadcast_arrays(x, y)
+        if local:
+            # transform x and y to real-world coordinates
+            x, y = self.get_coords(x, y)
+        shape = x.shape
+        x, y = x.ravel(), y.ravel()
+
+        xv, yv, bins, start, cells = self._get_cell_index(istart, istop)
+        x0, y0, dx, dy, nbx, nby = bins
+        with np.errstate(invalid="ignore"):
+            ix = np.floor((x - x0) / dx)
+            iy = np.floor((y - y0) / dy)
+            ipt = np.nonzero((ix >= 0) & (ix < nbx) & (iy >= 0) & (iy < nby))
+        ipt = ipt[0]
+        ibin = (iy[ipt] * nbx + ix[ipt]).astype(int)
+
+        cellid = np.full(x.size, -1, dtype=int)
+        chunksize = 100000
+        for i0 in range(0, ipt.size, chunksize):
+            p = ipt[i0 : i0 + chunksize]
+            b = ibin[i0 : i0 + chunksize]
+            ncand = start[b + 1] - start[b]
+            offsets = np.cumsum(ncand) - ncand
+            k = np.arange(ncand.sum()) - np.repeat(offsets, ncand)
+            p = np.repeat(p, ncand)
+            c = cells[np.repeat(start[b], ncand) + k]
+            hit = self._points_in_cells(x[p], y[p], xv[c], yv[c])
+            # candidates are sorted by cell number within each bin
+            p, ifirst = np.unique(p[hit], return_index=True)
+            cellid[p] = c[hit][ifirst]
+
+        outside = cellid < 0
+        if np.any(outside):
+            if not forgive:
+                raise Exception(
+                    "x, y point given is outside of the model area"
+                )
+            cellid = np.where(outside, np.nan, cellid + istart)
+        else:
+            cellid += istart
+        cellid = cellid.reshape(shape)
+        if scalar:
+            return cellid[0]
+        return cellid
+
+    def _points_in_cells(self, x, y, xv, yv):
+        """
+        Test if each point is inside, or on the edge of, the closed
+        polygon in the same row of xv and yv.
+        """
+        tol2 = self._intersect_tolerance ** 2
+        inside = np.zeros(x.shape, dtype=bool)
+        onedge = np.zeros(x.shape, dtype=bool)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for k in range(xv.shape[1] - 1):
+                x1, y1 = xv[:, k], yv[:, k]
+                x2, y2 = xv[:, k + 1], yv[:, k + 1]
+                dx, dy = x2 - x1, y2 - y1
+                # ray casting
+                xint = x1 + (y - y1) * dx / dy
+                inside ^= ((y1 > y) != (y2 > y)) & (x < xint)
+                # distance to the edge
+                l2 = dx * dx + dy * dy
+                t = ((x - x1) * dx + (y - y1) * dy) / np.where(l2 > 0, l2, 1)
+                t = np.clip(t, 0.0, 1.0)
+                d2 = (x1 + t * dx - x) ** 2 + (y1 + t * dy - y) ** 2
+                onedge |= d2 <= tol2
+        return inside | onedge
+
     def set_coord_info(
         self,
         xoff=0.0,
@@ -465,12 +644,19 @@ class Grid(object):
             if proj4 is None:
                 proj4 = self._proj4
 
+        # cached geometry only depends on the origin and rotation
+        update_cache = (xoff, yoff, angrot) != (
+            self._xoff,
+            self._yoff,
+            self._angrot,
+        )
         self._xoff = xoff
         self._yoff = yoff
         self._angrot = angrot
         self._epsg = epsg
         self._proj4 = proj4
-        self._require_cache_updates()
+        if update_cache:
+            self._require_cache_updates()
 
     def load_coord_info(self, namefile=None, reffile="usgs.model.reference"):
         """Attempts to load spatial reference information from
@@ -618,17 +804,35 @@ class Grid(object):
             return yul - (np.cos(self.angrot_radians) * yext)
 
     def _set_sr_coord_info(self, sr):
+        update_cache = (sr.xll, sr.yll, sr.rotation) != (
+            self._xoff,
+            self._yoff,
+            self._angrot,
+        )
         self._xoff = sr.xll
         self._yoff = sr.yll
         self._angrot = sr.rotation
         self._epsg = sr.epsg
         self._proj4 = sr.proj4_str
-        self._require_cache_updates()
+        if update_cache:
+            self._require_cache_updates()
 
     def _require_cache_updates(self):
         for cache_data in self._cache_dict.values():
             cache_data.out_of_date = True
 
+    def _get_cache_data(self, cache_index):
+        """
+        Get the data cached under cache_index as a deep copy (default), as
+        read-only views (readonly_cache) or without copying for internal
+        use (_copy_cache is False).
+        """
+        if not self._copy_cache:
+            return self._cache_dict[cache_index].data_nocopy
+        elif self._readonly_cache:
+            return self._cache_dict[cache_index].data_readonly
+        return self._cache_dict[cache_index].data
+
     @property
     def _has_ref_coordinates(self):
         return self._xoff != 0.0 or self._yoff != 0.0 or self._angrot != 0.0
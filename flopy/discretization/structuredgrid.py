@@ -112,6 +112,9 @@ class StructuredGrid(Grid):
         delc array
     delr
         delr array
+    readonly_cache
+        return read-only views of the cached grid geometry instead of
+        copies
 
     Properties
     ----------
@@ -153,6 +156,7 @@ class StructuredGrid(Grid):
         nrow=None,
         ncol=None,
         laycbd=None,
+        readonly_cache=False,
     ):
         super(StructuredGrid, self).__init__(
             "structured",
@@ -166,6 +170,7 @@ class StructuredGrid(Grid):
             xoff,
             yoff,
             angrot,
+            readonly_cache=readonly_cache,
         )
         if delc is not None:
             self.__nrow = len(delc)
@@ -265,10 +270,7 @@ class StructuredGrid(Grid):
         ):
             delz = self.top_botm[:-1, :, :] - self.top_botm[1:, :, :]
             self._cache_dict[cache_index] = CachedData(delz)
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def top_botm_withnan(self):
@@ -288,10 +290,7 @@ class StructuredGrid(Grid):
             where_to_nan = np.logical_and(is_inactive_above, is_inactive_below)
             top_botm_withnan = np.where(where_to_nan, np.nan, self.top_botm)
             self._cache_dict[cache_index] = CachedData(top_botm_withnan)
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def xyzvertices(self):
@@ -325,10 +324,7 @@ class StructuredGrid(Grid):
             else:
                 self._cache_dict[cache_index] = CachedData([xgrid, ygrid])
 
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def xyedges(self):
@@ -348,10 +344,7 @@ class StructuredGrid(Grid):
                 ([length_y], length_y - np.add.accumulate(self.delc))
             )
             self._cache_dict[cache_index] = CachedData([xedge, yedge])
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def zedges(self):
@@ -367,10 +360,7 @@ class StructuredGrid(Grid):
                 (np.array([self.top[0, 0]]), self.botm[:, 0, 0])
             )
             self._cache_dict[cache_index] = CachedData(zedges)
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def zverts_smooth(self):
@@ -391,10 +381,7 @@ class StructuredGrid(Grid):
         ):
             zverts_smooth = self.array_at_verts(self.top_botm)
             self._cache_dict[cache_index] = CachedData(zverts_smooth)
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def xycenters(self):
@@ -414,10 +401,7 @@ class StructuredGrid(Grid):
             y = Ly - (np.add.accumulate(self.__delc) - 0.5 * self.__delc)
             # store in cache
             self._cache_dict[cache_index] = CachedData([x, y])
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def xyzcellcenters(self):
@@ -456,10 +440,7 @@ class StructuredGrid(Grid):
                 x_mesh, y_mesh = self.get_coords(x_mesh, y_mesh)
             # store in cache
             self._cache_dict[cache_index] = CachedData([x_mesh, y_mesh, z])
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def grid_lines(self):
@@ -521,10 +502,7 @@ class StructuredGrid(Grid):
             is_regular_x = np.count_nonzero(np.abs(rel_diff_x) > rel_tol) == 0
 
             self._cache_dict[cache_index] = CachedData(is_regular_x)
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def is_regular_y(self):
@@ -544,10 +522,7 @@ class StructuredGrid(Grid):
             is_regular_y = np.count_nonzero(np.abs(rel_diff_y) > rel_tol) == 0
 
             self._cache_dict[cache_index] = CachedData(is_regular_y)
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def is_regular_z(self):
@@ -576,10 +551,7 @@ class StructuredGrid(Grid):
                 is_regular_z = is_regular_z and np.count_nonzero(failed) == 0
 
             self._cache_dict[cache_index] = CachedData(is_regular_z)
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def is_regular_xy(self):
@@ -604,10 +576,7 @@ class StructuredGrid(Grid):
             )
 
             self._cache_dict[cache_index] = CachedData(is_regular_xy)
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def is_regular_xz(self):
@@ -632,10 +601,7 @@ class StructuredGrid(Grid):
             )
 
             self._cache_dict[cache_index] = CachedData(is_regular_xz)
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def is_regular_yz(self):
@@ -660,10 +626,7 @@ class StructuredGrid(Grid):
             )
 
             self._cache_dict[cache_index] = CachedData(is_regular_yz)
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def is_regular(self):
@@ -688,10 +651,7 @@ class StructuredGrid(Grid):
             )
 
             self._cache_dict[cache_index] = CachedData(is_regular)
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def is_rectilinear(self):
@@ -717,10 +677,7 @@ class StructuredGrid(Grid):
                 is_rect_z = is_rect_z and np.count_nonzero(failed) == 0
 
             self._cache_dict[cache_index] = CachedData(is_rect_z)
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     ###############
     ### Methods ###
@@ -734,10 +691,10 @@ class StructuredGrid(Grid):
 
         Parameters
         ----------
-        x : float
-            The x-coordinate of the requested point
-        y : float
-            The y-coordinate of the requested point
+        x : float or array_like
+            The x-coordinate of the requested point(s)
+        y : float or array_like
+            The y-coordinate of the requested point(s)
         local: bool (optional)
             If True, x and y are in local coordinates (defaults to False)
         forgive: bool (optional)
@@ -746,41 +703,46 @@ class StructuredGrid(Grid):
 
         Returns
         -------
-        row : int
-            The row number
-        col : int
-            The column number
+        row : int or ndarray
+            The row number(s)
+        col : int or ndarray
+            The column number(s)
 
         """
+        scalar = np.isscalar(x) and np.isscalar(y)
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        x, y = np.broadcast_arrays(x, y)
+
         # transform x and y to local coordinates
         x, y = super(StructuredGrid, self).intersect(x, y, local, forgive)
 
         # get the cell edges in local coordinates
+        self._copy_cache = False
         xe, ye = self.xyedges
+        self._copy_cache = True
 
-        xcomp = x > xe
-        if np.all(xcomp) or not np.any(xcomp):
-            if forgive:
-                col = np.nan
-            else:
+        # xe is increasing and ye is decreasing, so a point on the edge
+        # between two cells is assigned to the lower row or column
+        col = np.searchsorted(xe, x, side="left") - 1
+        row = ye.size - np.searchsorted(ye[::-1], y, side="right") - 1
+        # points on the left and top edges of the grid are in the grid
+        col[x == xe[0]] = 0
+        row[y == ye[0]] = 0
+        outside = (
+            (col < 0) | (col >= xe.size - 1) | (row < 0) | (row >= ye.size - 1)
+        )
+        outside |= np.isnan(x) | np.isnan(y)
+        if np.any(outside):
+            if not forgive:
                 raise Exception(
                     "x, y point given is outside of the model area"
                 )
-        else:
-            col = np.where(xcomp)[0][-1]
+            row = np.where(outside, np.nan, row)
+            col = np.where(outside, np.nan, col)
 
-        ycomp = y < ye
-        if np.all(ycomp) or not np.any(ycomp):
-            if forgive:
-                row = np.nan
-            else:
-                raise Exception(
-                    "x, y point given is outside of the model area"
-                )
-        else:
-            row = np.where(ycomp)[0][-1]
-        if np.any(np.isnan([row, col])):
-            row = col = np.nan
+        if scalar:
+            return row[0], col[0]
         return row, col
 
     def _cell_vert_list(self, i, j):
@@ -40,6 +40,9 @@ class UnstructuredGrid(Grid):
         top elevations for all cells in the grid.
     botm : list or ndarray
         bottom elevations for all cells in the grid.
+    readonly_cache : bool
+        if True, return read-only views of the cached grid geometry instead
+        of copies. Defaults to False.
 
     Properties
     ----------
@@ -89,6 +92,7 @@ class UnstructuredGrid(Grid):
         xoff=0.0,
         yoff=0.0,
         angrot=0.0,
+        readonly_cache=False,
     ):
         super(UnstructuredGrid, self).__init__(
             "unstructured",
@@ -102,6 +106,7 @@ class UnstructuredGrid(Grid):
             xoff,
             yoff,
             angrot,
+            readonly_cache=readonly_cache,
         )
 
         # if any of these are None, then the grid is not valid
@@ -277,10 +282,7 @@ class UnstructuredGrid(Grid):
             or self._cache_dict[cache_index].out_of_date
         ):
             self._build_grid_geometry_info()
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def xyzvertices(self):
@@ -296,14 +298,42 @@ class UnstructuredGrid(Grid):
             or self._cache_dict[cache_index].out_of_date
         ):
             self._build_grid_geometry_info()
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
+
+    def intersect(self, x, y, local=False, forgive=False, layer=0):
+        """
+        Get the cell number of a point with coordinates x and y
+
+        When the point is on the edge of two cells, the cell with the lowest
+        cell number is returned.
+
+        Parameters
+        ----------
+        x : float or array_like
+            The x-coordinate of the requested point(s)
+        y : float or array_like
+            The y-coordinate of the requested point(s)
+        local: bool (optional)
+            If True, x and y are in local coordinates (defaults to False)
+        forgive: bool (optional)
+            Forgive x,y arguments that fall outside the model grid and
+            return NaNs instead (defaults to False - will throw exception)
+        layer : int (optional)
+            Layer to search if the grid varies by layer (defaults to 0)
 
-    def intersect(self, x, y, local=False, forgive=False):
-        x, y = super(UnstructuredGrid, self).intersect(x, y, local, forgive)
-        raise Exception("Not implemented yet")
+        Returns
+        -------
+        node : int or ndarray
+            The cell number(s).  If the grid varies by layer, these are
+            node numbers of cells in the requested layer.
+
+        """
+        istart, istop = 0, None
+        if self.grid_varies_by_layer:
+            istart, istop = self.get_layer_node_range(layer)
+        return self._intersect_cells(
+            x, y, local=local, forgive=forgive, istart=istart, istop=istop
+        )
 
     def get_cell_vertices(self, cellid):
         """
@@ -1,12 +1,7 @@
+import copy
 import numpy as np
 
-try:
-    from matplotlib.path import Path
-except ImportError:
-    Path = None
-
-from .grid import Grid, CachedData
-from ..utils.geometry import is_clockwise
+from .grid import Grid, CachedData, _readonly_view
 
 
 class VertexGrid(Grid):
@@ -19,6 +14,9 @@ class VertexGrid(Grid):
         list of vertices that make up the grid
     cell2d
         list of cells and their vertices
+    readonly_cache
+        return read-only views of the cached grid geometry instead of
+        copies; the vertices of each cell are returned as tuples
 
     Properties
     ----------
@@ -51,6 +49,7 @@ class VertexGrid(Grid):
         nlay=None,
         ncpl=None,
         cell1d=None,
+        readonly_cache=False,
     ):
         super(VertexGrid, self).__init__(
             "vertex",
@@ -64,6 +63,7 @@ class VertexGrid(Grid):
             xoff,
             yoff,
             angrot,
+            readonly_cache=readonly_cache,
         )
         self._vertices = vertices
         self._cell1d = cell1d
@@ -124,10 +124,7 @@ class VertexGrid(Grid):
 
     @property
     def extent(self):
-        self._copy_cache = False
-        xvertices = np.hstack(self.xvertices)
-        yvertices = np.hstack(self.yvertices)
-        self._copy_cache = True
+        xvertices, yvertices = self._cell_vertex_arrays[:2]
         return (
             np.min(xvertices),
             np.max(xvertices),
@@ -144,21 +141,15 @@ class VertexGrid(Grid):
         Returns:
             list: grid line vertices
         """
-        self._copy_cache = False
-        xgrid = self.xvertices
-        ygrid = self.yvertices
-
-        lines = []
-        for ncell, verts in enumerate(xgrid):
-            for ix, vert in enumerate(verts):
-                lines.append(
-                    [
-                        (xgrid[ncell][ix - 1], ygrid[ncell][ix - 1]),
-                        (xgrid[ncell][ix], ygrid[ncell][ix]),
-                    ]
-                )
-        self._copy_cache = True
-        return lines
+        xgrid, ygrid, _, nvert = self._cell_vertex_arrays
+
+        # line ix of a cell connects vertex ix - 1 with vertex ix
+        icell = np.repeat(np.arange(nvert.size), nvert)
+        ix = np.arange(icell.size) - np.repeat(np.cumsum(nvert) - nvert, nvert)
+        ix0 = np.where(ix == 0, nvert[icell], ix) - 1
+        x0, y0 = xgrid[icell, ix0].tolist(), ygrid[icell, ix0].tolist()
+        x1, y1 = xgrid[icell, ix].tolist(), ygrid[icell, ix].tolist()
+        return [[p0, p1] for p0, p1 in zip(zip(x0, y0), zip(x1, y1))]
 
     @property
     def xyzcellcenters(self):
@@ -171,10 +162,7 @@ class VertexGrid(Grid):
             or self._cache_dict[cache_index].out_of_date
         ):
             self._build_grid_geometry_info()
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._get_cache_data(cache_index)
 
     @property
     def xyzvertices(self):
@@ -185,15 +173,82 @@ class VertexGrid(Grid):
             list of size sum(nvertices per cell)
         """
         cache_index = "xyzgrid"
+        xgrid, ygrid, zgrid, nvert = self._cell_vertex_arrays
+        if (
+            cache_index not in self._cache_dict
+            or self._cache_dict[cache_index].out_of_date
+        ):
+            xvertices = self._vertex_lists(xgrid, nvert)
+            yvertices = self._vertex_lists(ygrid, nvert)
+            if self._cell1d is not None:
+                zvertices = self._vertex_lists(zgrid, nvert)
+            else:
+                zvertices = self._zcoords()[0]
+            self._cache_dict[cache_index] = CachedData(
+                [xvertices, yvertices, zvertices]
+            )
+        if self._copy_cache and self._readonly_cache:
+            return self._readonly_vertices(cache_index)
+        elif self._copy_cache:
+            # building lists from the padded arrays is much faster than
+            # deep copying the cached lists of vertices
+            xvertices = self._vertex_lists(xgrid, nvert)
+            yvertices = self._vertex_lists(ygrid, nvert)
+            if self._cell1d is not None:
+                zvertices = self._vertex_lists(zgrid, nvert)
+            else:
+                zvertices = copy.deepcopy(
+                    self._cache_dict[cache_index].data_nocopy[2]
+                )
+            return [xvertices, yvertices, zvertices]
+        return self._get_cache_data(cache_index)
+
+    def _readonly_vertices(self, cache_index):
+        """
+        Tuples of the vertices of each cell, built once from the cached
+        vertex lists.  They cannot be changed, so they are returned without
+        copying.
+        """
+        readonly_index = cache_index + "_readonly"
+        if (
+            readonly_index not in self._cache_dict
+            or self._cache_dict[readonly_index].out_of_date
+        ):
+            xvertices, yvertices, zvertices = self._cache_dict[
+                cache_index
+            ].data_nocopy
+            xvertices = tuple(tuple(xv) for xv in xvertices)
+            yvertices = tuple(tuple(yv) for yv in yvertices)
+            if self._cell1d is not None:
+                zvertices = tuple(tuple(zv) for zv in zvertices)
+            else:
+                zvertices = _readonly_view(zvertices)
+            self._cache_dict[readonly_index] = CachedData(
+                (xvertices, yvertices, zvertices)
+            )
+        return self._cache_dict[readonly_index].data_nocopy
+
+    @property
+    def _cell_vertex_arrays(self):
+        """
+        Read-only x, y and z (DISV1D only, None otherwise) vertex arrays of
+        shape (ncpl, max number of vertices) and the number of vertices of
+        each cell.  Each row is padded with the first vertex of the cell.
+        """
+        cache_index = "cellvertices"
         if (
             cache_index not in self._cache_dict
             or self._cache_dict[cache_index].out_of_date
         ):
             self._build_grid_geometry_info()
-        if self._copy_cache:
-            return self._cache_dict[cache_index].data
-        else:
-            return self._cache_dict[cache_index].data_nocopy
+        return self._cache_dict[cache_index].data_nocopy
+
+    @staticmethod
+    def _vertex_lists(vertices, nvert):
+        """Lists of the vertices of each cell from a padded vertex array"""
+        if np.all(nvert == vertices.shape[1]):
+            return vertices.tolist()
+        return [v[:n] for v, n in zip(vertices.tolist(), nvert.tolist())]
 
     def intersect(self, x, y, local=False, forgive=False):
         """
@@ -204,10 +259,10 @@ class VertexGrid(Grid):
 
         Parameters
         ----------
-        x : float
-            The x-coordinate of the requested point
-        y : float
-            The y-coordinate of the requested point
+        x : float or array_like
+            The x-coordinate of the requested point(s)
+        y : float or array_like
+            The y-coordinate of the requested point(s)
         local: bool (optional)
             If True, x and y are in local coordinates (defaults to False)
         forgive: bool (optional)
@@ -216,43 +271,17 @@ class VertexGrid(Grid):
 
         Returns
         -------
-        icell2d : int
-            The CELL2D number
+        icell2d : int or ndarray
+            The CELL2D number(s)
+
+        Notes
+        -----
+        The cell polygons are binned by their bounding boxes the first time
+        this method is called, so that each point is only tested against
+        the cells in its bin.
 
         """
-        if Path is None:
-            s = (
-                "Could not import matplotlib.  Must install matplotlib "
-                + " in order to use VertexGrid.intersect() method"
-            )
-            raise ImportError(s)
-
-        if local:
-            # transform x and y to real-world coordinates
-            x, y = super(VertexGrid, self).get_coords(x, y)
-        xv, yv, zv = self.xyzvertices
-        for icell2d in range(self.ncpl):
-            xa = np.array(xv[icell2d])
-            ya = np.array(yv[icell2d])
-            # x and y at least have to be within the bounding box of the cell
-            if (
-                np.any(x <= xa)
-                and np.any(x >= xa)
-                and np.any(y <= ya)
-                and np.any(y >= ya)
-            ):
-                path = Path(np.stack((xa, ya)).transpose())
-                # use a small radius, so that the edge of the cell is included
-                if is_clockwise(xa, ya):
-                    radius = -1e-9
-                else:
-                    radius = 1e-9
-                if path.contains_point((x, y), radius=radius):
-                    return icell2d
-        if forgive:
-            icell2d = np.nan
-            return icell2d
-        raise Exception("x, y point given is outside of the model area")
+        return self._intersect_cells(x, y, local=local, forgive=forgive)
 
     def get_cell_vertices(self, cellid):
         """
@@ -262,9 +291,11 @@ class VertexGrid(Grid):
         Returns
         ------- list of x,y cell vertices
         """
-        self._copy_cache = False
-        cell_verts = list(zip(self.xvertices[cellid], self.yvertices[cellid]))
-        self._copy_cache = True
+        xgrid, ygrid, _, nvert = self._cell_vertex_arrays
+        n = nvert[cellid]
+        cell_verts = list(
+            zip(xgrid[cellid, :n].tolist(), ygrid[cellid, :n].tolist())
+        )
         return cell_verts
 
     def plot(self, **kwargs):
@@ -288,91 +319,98 @@ class VertexGrid(Grid):
 
     def _build_grid_geometry_info(self):
         cache_index_cc = "cellcenters"
-        cache_index_vert = "xyzgrid"
-
-        xcenters = []
-        ycenters = []
-        xvertices = []
-        yvertices = []
+        cache_index_vert = "cellvertices"
 
         if self._cell1d is not None:
-            zcenters = []
-            zvertices = []
-            vertexdict = {v[0]: [v[1], v[2], v[3]] for v in self._vertices}
-            for cell1d in self._cell1d:
-                cell1d = tuple(cell1d)
-                xcenters.append(cell1d[1])
-                ycenters.append(cell1d[2])
-                zcenters.append(cell1d[3])
-
-                vert_number = []
-                for i in cell1d[3:]:
-                    if i is not None:
-                        vert_number.append(int(i))
-
-                xcellvert = []
-                ycellvert = []
-                zcellvert = []
-                for ix in vert_number:
-                    xcellvert.append(vertexdict[ix][0])
-                    ycellvert.append(vertexdict[ix][1])
-                    zcellvert.append(vertexdict[ix][2])
-                xvertices.append(xcellvert)
-                yvertices.append(ycellvert)
-                zvertices.append(zcellvert)
-
+            cells = self._cell1d
+            ixyz = 3
+            # vertex numbers start at the fourth item of each cell1d record
+            ivert0 = 3
         else:
-            vertexdict = {v[0]: [v[1], v[2]] for v in self._vertices}
-            # build xy vertex and cell center info
-            for cell2d in self._cell2d:
-                cell2d = tuple(cell2d)
-                xcenters.append(cell2d[1])
-                ycenters.append(cell2d[2])
-
-                vert_number = []
-                for i in cell2d[4:]:
-                    if i is not None:
-                        vert_number.append(int(i))
-
-                xcellvert = []
-                ycellvert = []
-                for ix in vert_number:
-                    xcellvert.append(vertexdict[ix][0])
-                    ycellvert.append(vertexdict[ix][1])
-                xvertices.append(xcellvert)
-                yvertices.append(ycellvert)
-
-            # build z cell centers
-            zvertices, zcenters = self._zcoords()
-
+            cells = self._cell2d
+            ixyz = 2
+            ivert0 = 4
+
+        # vertex coordinates, indexed by their position in vertices
+        vertices = [tuple(v) for v in self._vertices]
+        vertid = np.array([v[0] for v in vertices], dtype=int)
+        vertxyz = np.array(
+            [v[1 : ixyz + 1] for v in vertices], dtype=float
+        ).reshape(-1, ixyz)
+        if np.any(vertid[1:] < vertid[:-1]):
+            order = np.argsort(vertid, kind="stable")
+            vertid = vertid[order]
+            vertxyz = vertxyz[order]
+
+        # cell centers and vertex numbers of each cell
+        centers = []
+        cellverts = []
+        for cell in cells:
+            cell = tuple(cell)
+            centers.append(cell[1 : ixyz + 1])
+            cellverts.append([int(i) for i in cell[ivert0:] if i is not None])
+        centers = np.array(centers, dtype=float).reshape(-1, ixyz)
+        nvert = np.array([len(iv) for iv in cellverts], dtype=int)
+
+        # pad the vertex numbers of each cell with its first vertex
+        ncell = nvert.size
+        maxnv = nvert.max() if ncell > 0 else 0
+        ids = np.array([i for iv in cellverts for i in iv], dtype=int)
+        flat = np.searchsorted(vertid, ids)
+        unknown = flat >= vertid.size
+        unknown[~unknown] = vertid[flat[~unknown]] != ids[~unknown]
+        if np.any(unknown):
+            raise KeyError(
+                "cell vertex number {} is not in vertices".format(
+                    ids[unknown][0]
+                )
+            )
+        offsets = np.cumsum(nvert) - nvert
+        icell = np.repeat(np.arange(ncell), nvert)
+        ivert = np.zeros((ncell, maxnv), dtype=int)
+        ivert[:] = flat[np.minimum(offsets, flat.size - 1)][:, np.newaxis]
+        ivert[icell, np.arange(flat.size) - offsets[icell]] = flat
+
+        xvertices = vertxyz[:, 0]
+        yvertices = vertxyz[:, 1]
+        xcenters = centers[:, 0]
+        ycenters = centers[:, 1]
         if self._has_ref_coordinates:
             # transform x and y
             xcenters, ycenters = self.get_coords(xcenters, ycenters)
-            xvertxform = []
-            yvertxform = []
-            # vertices are a list within a list
-            for xcellvertices, ycellvertices in zip(xvertices, yvertices):
-                xcellvertices, ycellvertices = self.get_coords(
-                    xcellvertices, ycellvertices
-                )
-                xvertxform.append(xcellvertices)
-                yvertxform.append(ycellvertices)
-            xvertices = xvertxform
-            yvertices = yvertxform
+            xvertices, yvertices = self.get_coords(xvertices, yvertices)
+
+        xgrid = xvertices[ivert]
+        ygrid = yvertices[ivert]
+        if self._cell1d is not None:
+            zgrid = vertxyz[:, 2][ivert]
+            zcenters = centers[:, 2]
+        else:
+            zgrid = None
+            zcenters = self._zcoords()[1]
+
+        # cached vertex arrays are shared with every caller
+        for arr in (xgrid, ygrid, zgrid, nvert):
+            if arr is not None:
+                arr.flags.writeable = False
 
         self._cache_dict[cache_index_cc] = CachedData(
             [xcenters, ycenters, zcenters]
         )
         self._cache_dict[cache_index_vert] = CachedData(
-            [xvertices, yvertices, zvertices]
+            [xgrid, ygrid, zgrid, nvert]
         )
 
     def get_xvertices_for_layer(self, layer):
+        self._copy_cache = False
         xgrid = np.array(self.xvertices, dtype=object)
+        self._copy_cache = True
         return xgrid
 
     def get_yvertices_for_layer(self, layer):
+        self._copy_cache = False
         ygrid = np.array(self.yvertices, dtype=object)
+        self._copy_cache = True
         return ygrid
 
     def get_xcellcenters_for_layer(self, layer):
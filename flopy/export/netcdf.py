@@ -1270,6 +1270,8 @@ class NetCdf(object):
         precision_str="f4",
         dimensions=("time", "layer"),
         group=None,
+        chunksizes=None,
+        complevel=4,
     ):
         """
         Create a new variable in the netcdf object
@@ -1288,6 +1290,14 @@ class NetCdf(object):
         group : str
             which netcdf group the variable goes in
             default : None which creates the variable in root
+        chunksizes : tuple
+            chunk shape of the zlib-compressed variable, one entry per
+            dimension. Writing data one chunk at a time keeps memory use
+            bounded for large variables.
+            default : None which uses the netCDF4 default chunking
+        complevel : int
+            zlib compression level (1-9)
+            default : 4
 
         Returns
         -------
@@ -1330,17 +1340,17 @@ class NetCdf(object):
         if self.nc is None:
             self.initialize_file()
 
-        # check that the requested dimension exists and
-        # build up the chuck sizes
-        # chunks = []
-        # for dimension in dimensions:
-        #    assert self.nc.dimensions.get(dimension) is not None, \
-        #        "netcdf.create_variable() dimension not found:" + dimension
-        #    chunk = self.chunks[dimension]
-        #    assert chunk is not None, \
-        #        "netcdf.create_variable() chunk size of {0} is None in self.chunks". \
-        #            format(dimension)
-        #    chunks.append(chunk)
+        if chunksizes is not None:
+            chunksizes = tuple(chunksizes)
+            assert len(chunksizes) == len(dimensions), (
+                "netcdf.create_variable() error: chunksizes {0} do not "
+                "match dimensions {1}".format(chunksizes, dimensions)
+            )
+            # chunks can not be larger than the dimension they span
+            chunksizes = tuple(
+                max(1, min(int(c), len(self.nc.dimensions[d])))
+                for c, d in zip(chunksizes, dimensions)
+            )
 
         self.var_attr_dict[name] = attributes
 
@@ -1350,8 +1360,9 @@ class NetCdf(object):
             dimensions,
             fill_value=self.fillvalue,
             zlib=True,
-        )  # ,
-        # chunksizes=tuple(chunks))
+            complevel=complevel,
+            chunksizes=chunksizes,
+        )
         for k, v in attributes.items():
             try:
                 var.setncattr(k, v)
@@ -133,11 +133,16 @@ def write_grid_shapefile(
             category=DeprecationWarning,
         )
     elif mg.grid_type == "structured":
-        verts = [
-            mg.get_cell_vertices(i, j)
-            for i in range(mg.nrow)
-            for j in range(mg.ncol)
-        ]
+        # vertices of all cells, with a shape of (nrow * ncol, 4, 2)
+        verts = np.stack(
+            [
+                np.stack(
+                    (v[:-1, :-1], v[:-1, 1:], v[1:, 1:], v[1:, :-1]), axis=-1
+                ).reshape(-1, 4)
+                for v in (mg.xvertices, mg.yvertices)
+            ],
+            axis=-1,
+        )
     elif mg.grid_type == "vertex":
         verts = [mg.get_cell_vertices(cellid) for cellid in range(mg.ncpl)]
     elif mg.grid_type == "unstructured":
@@ -156,12 +161,12 @@ def write_grid_shapefile(
             (enforce_10ch_limit([name])[0], array_dict[name].dtype)
             for name in names[3:]
         ]
-        node = list(range(1, mg.ncol * mg.nrow + 1))
-        col = list(range(1, mg.ncol + 1)) * mg.nrow
-        row = sorted(list(range(1, mg.nrow + 1)) * mg.ncol)
-        at = np.vstack(
-            [node, row, col] + [array_dict[name].ravel() for name in names[3:]]
-        ).transpose()
+        node = np.arange(1, mg.ncol * mg.nrow + 1)
+        col = np.tile(np.arange(1, mg.ncol + 1), mg.nrow)
+        row = np.repeat(np.arange(1, mg.nrow + 1), mg.ncol)
+        columns = [node, row, col] + [
+            array_dict[name].ravel() for name in names[3:]
+        ]
 
         names = enforce_10ch_limit(names)
 
@@ -171,10 +176,8 @@ def write_grid_shapefile(
             (enforce_10ch_limit([name])[0], array_dict[name].dtype)
             for name in names[1:]
         ]
-        node = list(range(1, mg.ncpl + 1))
-        at = np.vstack(
-            [node] + [array_dict[name].ravel() for name in names[1:]]
-        ).transpose()
+        node = np.arange(1, mg.ncpl + 1)
+        columns = [node] + [array_dict[name].ravel() for name in names[1:]]
 
         names = enforce_10ch_limit(names)
 
@@ -184,17 +187,19 @@ def write_grid_shapefile(
             (enforce_10ch_limit([name])[0], array_dict[name].dtype)
             for name in names[1:]
         ]
-        node = list(range(1, mg.nnodes + 1))
-        at = np.vstack(
-            [node] + [array_dict[name].ravel() for name in names[1:]]
-        ).transpose()
+        node = np.arange(1, mg.nnodes + 1)
+        columns = [node] + [array_dict[name].ravel() for name in names[1:]]
 
         names = enforce_10ch_limit(names)
 
-    # flag nan values and explicitly set the dtypes
-    if at.dtype in [float, np.float32, np.float64]:
-        at[np.isnan(at)] = nan_val
-    at = np.array([tuple(i) for i in at], dtype=dtypes)
+    # fill the attribute table one field at a time, and flag nan values if
+    # all attributes are numeric
+    at = np.empty(node.shape[0], dtype=dtypes)
+    flag_nan = np.result_type(*columns) in [float, np.float32, np.float64]
+    for (name, dtype), column in zip(dtypes, columns):
+        if flag_nan and np.issubdtype(column.dtype, np.floating):
+            column = np.where(np.isnan(column), nan_val, column)
+        at[name] = column
 
     # write field information
     fieldinfo = {
@@ -203,12 +208,21 @@ def write_grid_shapefile(
     for n in names:
         w.field(n, *fieldinfo[n])
 
-    for i, r in enumerate(at):
-        # check if polygon is closed, if not close polygon for QGIS
-        if verts[i][-1] != verts[i][0]:
-            verts[i] = verts[i] + [verts[i][0]]
-        w.poly([verts[i]])
-        w.record(*r)
+    # write the cells in batches converted to python lists, so the values
+    # are not converted from numpy scalars one at a time
+    batchsize = 100000
+    for i0 in range(0, len(at), batchsize):
+        if isinstance(verts, np.ndarray):
+            batch_verts = verts[i0 : i0 + batchsize].tolist()
+        else:
+            batch_verts = verts[i0 : i0 + batchsize]
+        batch_at = at[i0 : i0 + batchsize].tolist()
+        for cell_verts, r in zip(batch_verts, batch_at):
+            # check if polygon is closed, if not close polygon for QGIS
+            if cell_verts[-1] != cell_verts[0]:
+                cell_verts = cell_verts + [cell_verts[0]]
+            w.poly([cell_verts])
+            w.record(*r)
 
     # close
     w.close()
@@ -360,10 +374,10 @@ def model_attributes_to_shapefile(
                     a.data_type == DataType.transientlist
                 ):  # elif isinstance(a, MfList):
                     try:
-                        list(a.masked_4D_arrays_itr())
+                        arrays = list(a.masked_4D_arrays_itr())
                     except:
                         continue
-                    for name, array in a.masked_4D_arrays_itr():
+                    for name, array in arrays:
                         for kper in range(array.shape[0]):
                             for k in range(array.shape[1]):
                                 n = shape_attr_name(name, length=4)
@@ -138,8 +138,7 @@ def ensemble_helper(
     return f_in, f_out
 
 
-def _add_output_nc_variable(
-    f,
+def _output_nc_steps(
     times,
     shape3d,
     out_obj,
@@ -149,69 +148,131 @@ def _add_output_nc_variable(
     mask_vals=(),
     mask_array3d=None,
 ):
-    if logger:
-        logger.log("creating array for {0}".format(var_name))
-
-    array = np.zeros(
-        (len(times), shape3d[0], shape3d[1], shape3d[2]), dtype=np.float32
-    )
-    array[:] = np.NaN
+    """
+    Generator that reads one output time step at a time as a masked
+    float32 array, with NaN in masked or missing cells
 
+    """
     if isinstance(out_obj, ZBNetOutput):
         a = np.asarray(out_obj.zone_array, dtype=np.float32)
         if mask_array3d is not None:
             a[mask_array3d] = np.NaN
-        for i, _ in enumerate(times):
-            array[i, :, :, :] = a
+        for mask_val in mask_vals:
+            a[np.where(a == mask_val)] = np.NaN
+        for _ in times:
+            yield a.copy()
+        return
 
-    else:
-        for i, t in enumerate(times):
-            if t in out_obj.recordarray["totim"]:
-                try:
-                    if text:
-                        a = out_obj.get_data(totim=t, full3D=True, text=text)
-                        if isinstance(a, list):
-                            a = a[0]
-                    else:
-                        a = out_obj.get_data(totim=t)
-                except Exception as e:
-                    estr = (
-                        "error getting data for {0} at time"
-                        " {1}:{2}".format(
-                            var_name + text.decode().strip().lower(), t, str(e)
-                        )
-                    )
-                    if logger:
-                        logger.warn(estr)
-                    else:
-                        print(estr)
-                    continue
-                if mask_array3d is not None and a.shape == mask_array3d.shape:
-                    a[mask_array3d] = np.NaN
-                try:
-                    array[i, :, :, :] = a.astype(np.float32)
-                except Exception as e:
-                    estr = (
-                        "error assigning {0} data to array for time"
-                        " {1}:{2}".format(
-                            var_name + text.decode().strip().lower(), t, str(e)
-                        )
+    for t in times:
+        array = np.empty(shape3d, dtype=np.float32)
+        array[:] = np.NaN
+        if t in out_obj.recordarray["totim"]:
+            try:
+                if text:
+                    a = out_obj.get_data(totim=t, full3D=True, text=text)
+                    if isinstance(a, list):
+                        a = a[0]
+                else:
+                    a = out_obj.get_data(totim=t)
+            except Exception as e:
+                estr = "error getting data for {0} at time {1}:{2}".format(
+                    var_name + text.decode().strip().lower(), t, str(e)
+                )
+                if logger:
+                    logger.warn(estr)
+                else:
+                    print(estr)
+                yield array
+                continue
+            if mask_array3d is not None and a.shape == mask_array3d.shape:
+                a[mask_array3d] = np.NaN
+            try:
+                array[:, :, :] = a.astype(np.float32)
+            except Exception as e:
+                estr = (
+                    "error assigning {0} data to array for time"
+                    " {1}:{2}".format(
+                        var_name + text.decode().strip().lower(), t, str(e)
                     )
-                    if logger:
-                        logger.warn(estr)
-                    else:
-                        print(estr)
-                    continue
+                )
+                if logger:
+                    logger.warn(estr)
+                else:
+                    print(estr)
+            for mask_val in mask_vals:
+                array[np.where(array == mask_val)] = np.NaN
+        yield array
 
-    if logger:
-        logger.log("creating array for {0}".format(var_name))
 
-    for mask_val in mask_vals:
-        array[np.where(array == mask_val)] = np.NaN
-    mx, mn = np.nanmax(array), np.nanmin(array)
-    array[np.isnan(array)] = netcdf.FILLVALUE
+def _add_output_nc_variable(
+    f,
+    times,
+    shape3d,
+    out_obj,
+    var_name,
+    logger=None,
+    text="",
+    mask_vals=(),
+    mask_array3d=None,
+    chunksizes=None,
+    complevel=4,
+):
+    """
+    Method to add a binary output record history to a netcdf file or dict.
+
+    NetCdf variables are streamed: a single time step is read from the
+    output file, masked and written into the (chunked, compressed)
+    variable before the next one is read, so the full
+    (time, layer, row, col) array is never held in memory.
+
+    Parameters
+    ----------
+    f : NetCdf object or dict
+    times : list
+        output times to export
+    shape3d : tuple
+        (nlay, nrow, ncol) shape of a single time step
+    out_obj : HeadFile, UcnFile, CellBudgetFile or ZBNetOutput
+        output file object
+    var_name : str
+        variable name
+    logger : None or Logger
+        logger instance
+    text : bytes
+        budget record text for CellBudgetFile objects
+    mask_vals : list
+        values to be masked out of the exported data
+    mask_array3d : np.ndarray
+        boolean array of inactive cells
+    chunksizes : tuple
+        netcdf chunk shape for the (time, layer, row, col) variable.
+        Default is None, which uses one time step per chunk.
+    complevel : int
+        zlib compression level (1-9). Default is 4.
+
+    """
+    steps = _output_nc_steps(
+        times,
+        shape3d,
+        out_obj,
+        var_name,
+        logger=logger,
+        text=text,
+        mask_vals=mask_vals,
+        mask_array3d=mask_array3d,
+    )
 
     if isinstance(f, dict):
+        if logger:
+            logger.log("creating array for {0}".format(var_name))
+        array = np.zeros(
+            (len(times), shape3d[0], shape3d[1], shape3d[2]), dtype=np.float32
+        )
+        for i, a in enumerate(steps):
+            array[i] = a
+        if logger:
+            logger.log("creating array for {0}".format(var_name))
+        array[np.isnan(array)] = netcdf.FILLVALUE
         if text:
             var_name = text.decode().strip().lower()
         f[var_name] = array
@@ -224,6 +285,14 @@ def _add_output_nc_variable(
 
     if text:
         var_name = text.decode().strip().lower()
+    dim_tuple = ("time",) + f.dimension_names
+    if chunksizes is None:
+        chunksizes = (1,) + tuple(
+            len(f.nc.dimensions[d]) for d in f.dimension_names
+        )
+
+    # min and max are placeholders until all time steps have been written
+    mn = mx = np.float32(np.NaN)
     attribs = {"long_name": var_name}
     attribs["coordinates"] = "time layer latitude longitude"
     attribs["min"] = mn
@@ -231,12 +300,13 @@ def _add_output_nc_variable(
     if units is not None:
         attribs["units"] = units
     try:
-        dim_tuple = ("time",) + f.dimension_names
         var = f.create_variable(
             var_name,
             attribs,
             precision_str=precision_str,
             dimensions=dim_tuple,
+            chunksizes=chunksizes,
+            complevel=complevel,
         )
     except Exception as e:
         estr = "error creating variable {0}:\n{1}".format(var_name, str(e))
@@ -244,17 +314,40 @@ def _add_output_nc_variable(
             logger.lraise(estr)
         else:
             raise Exception(estr)
+    if var is None:
+        # duplicate variable skipped by a forgiving NetCdf instance
+        return
 
-    try:
-        var[:] = array
-    except Exception as e:
-        estr = "error setting array to variable {0}:\n{1}".format(
-            var_name, str(e)
-        )
-        if logger:
-            logger.lraise(estr)
-        else:
-            raise Exception(estr)
+    if logger:
+        logger.log("writing array for {0}".format(var_name))
+    for i, array in enumerate(steps):
+        isnan = np.isnan(array)
+        if not isnan.all():
+            mn = np.fmin(mn, np.nanmin(array))
+            mx = np.fmax(mx, np.nanmax(array))
+        array[isnan] = netcdf.FILLVALUE
+        try:
+            var[i] = array
+        except Exception as e:
+            estr = "error setting array to variable {0}:\n{1}".format(
+                var_name, str(e)
+            )
+            if logger:
+                logger.lraise(estr)
+            else:
+                raise Exception(estr)
+    if logger:
+        logger.log("writing array for {0}".format(var_name))
+
+    for k, v in (("min", mn), ("max", mx)):
+        attribs[k] = v
+        try:
+            var.setncattr(k, v)
+        except:
+            f.logger.warn(
+                "error setting attribute"
+                + "{0} for variable {1}".format(k, var_name)
+            )
 
 
 def _add_output_nc_zonebudget_variable(f, array, var_name, flux, logger=None):
@@ -318,13 +411,20 @@ def output_helper(f, ml, oudic, **kwargs):
             zero based model layer which can be used in shapefile exporting
         kper : int
             zero based stress period which can be used for shapefile exporting
+        chunksizes : tuple
+            netcdf chunk shape for the (time, layer, row, col) output
+            variables. Default is None, which uses one time step per chunk.
+        complevel : int
+            netcdf zlib compression level (1-9). Default is 4.
 
     Returns
     -------
         None
     Note:
     ----
-        casts down double precision to single precision for netCDF files
+        casts down double precision to single precision for netCDF files.
+        netCDF output is streamed one time step at a time, so output
+        histories larger than memory can be exported.
 
     """
     assert isinstance(ml, (BaseModel, ModelInterface))
@@ -336,6 +436,8 @@ def output_helper(f, ml, oudic, **kwargs):
     mask_vals = []
     mflay = kwargs.pop("mflay", None)
     kper = kwargs.pop("kper", None)
+    chunksizes = kwargs.pop("chunksizes", None)
+    complevel = kwargs.pop("complevel", 4)
     if "masked_vals" in kwargs:
         mask_vals = kwargs.pop("masked_vals")
     if len(kwargs) > 0 and logger is not None:
@@ -438,6 +540,8 @@ def output_helper(f, ml, oudic, **kwargs):
                     logger=logger,
                     mask_vals=mask_vals,
                     mask_array3d=mask_array3d,
+                    chunksizes=chunksizes,
+                    complevel=complevel,
                 )
 
             elif isinstance(out_obj, HeadFile):
@@ -450,6 +554,8 @@ def output_helper(f, ml, oudic, **kwargs):
                     logger=logger,
                     mask_vals=mask_vals,
                     mask_array3d=mask_array3d,
+                    chunksizes=chunksizes,
+                    complevel=complevel,
                 )
 
             elif isinstance(out_obj, FormattedHeadFile):
@@ -462,6 +568,8 @@ def output_helper(f, ml, oudic, **kwargs):
                     logger=logger,
                     mask_vals=mask_vals,
                     mask_array3d=mask_array3d,
+                    chunksizes=chunksizes,
+                    complevel=complevel,
                 )
 
             elif isinstance(out_obj, CellBudgetFile):
@@ -477,6 +585,8 @@ def output_helper(f, ml, oudic, **kwargs):
                         text=text,
                         mask_vals=mask_vals,
                         mask_array3d=mask_array3d,
+                        chunksizes=chunksizes,
+                        complevel=complevel,
                     )
 
             else:
@@ -514,6 +624,8 @@ def output_helper(f, ml, oudic, **kwargs):
                 logger=logger,
                 mask_vals=mask_vals,
                 mask_array3d=mask_array3d,
+                chunksizes=chunksizes,
+                complevel=complevel,
             )
 
     elif isinstance(f, str) and f.endswith(".shp"):
@@ -308,11 +308,10 @@ class XmlWriterBinary(XmlWriterInterface):
         # https://vtk.org/Wiki/VTK_XML_Formats#Appended_Data_Section
         assert data.flags["C_CONTIGUOUS"] or data.flags["F_CONTIGUOUS"]
         assert data.ndim == 1
-        data_format = (
-            self.byte_order + str(data.size) + np_to_struct[data.dtype.name]
-        )
-        binary_data = struct.pack(data_format, *data)
-        self.f.write(binary_data)
+        # write the array buffer directly in the byte order of the file
+        dtype = data.dtype.newbyteorder(self.byte_order)
+        data = np.ascontiguousarray(data, dtype=dtype)
+        self.f.write(memoryview(data).cast("B"))
 
     def final(self):
         """
@@ -484,6 +483,9 @@ class Vtk(object):
 
         self.binary = binary
 
+        # cached vertices and connectivity of the unstructured grid
+        self._geometry = None
+
         return
 
     def _vtk_grid_type(self, vtk_grid_type="auto"):
@@ -790,8 +792,6 @@ class Vtk(object):
 
             # points
             xml.open_element("Points")
-            verts = np.array(list(verts.values()))
-            verts.reshape(npoints, 3)
             xml.write_array(verts, Name="points", NumberOfComponents="3")
             xml.close_element("Points")
 
@@ -799,17 +799,17 @@ class Vtk(object):
             xml.open_element("Cells")
 
             # connectivity
-            iverts = np.array(list(iverts.values()))
             xml.write_array(
                 iverts, Name="connectivity", NumberOfComponents="1"
             )
 
             # offsets
-            offsets = np.empty((iverts.shape[0]), np.int32)
-            icount = 0
-            for index, row in enumerate(iverts):
-                icount += len(row)
-                offsets[index] = icount
+            offsets = np.arange(
+                iverts.shape[1],
+                iverts.size + 1,
+                iverts.shape[1],
+                dtype=np.int32,
+            )
             xml.write_array(offsets, Name="offsets", NumberOfComponents="1")
 
             # types
@@ -958,7 +958,7 @@ class Vtk(object):
                         _, _, averts = self._get_3d_vertex_connectivity(
                             actwcells=actwcells3d, zvalues=a
                         )
-                        a = np.array(list(averts.values()))
+                        a = averts
                     else:
                         a = self.modelgrid.array_at_verts(a)
                         a = np.flip(a, axis=[0, 1])
@@ -977,7 +977,7 @@ class Vtk(object):
                         _, _, averts = self._get_3d_vertex_connectivity(
                             actwcells=actwcells3d, zvalues=a
                         )
-                        a = np.array(list(averts.values()))
+                        a = averts
                     else:
                         # flip "a" so coordinates increase along with indices
                         # as in vtk
@@ -1004,7 +1004,7 @@ class Vtk(object):
                             _, _, averts = self._get_3d_vertex_connectivity(
                                 actwcells=actwcells3d, zvalues=vcomp
                             )
-                            vcomp = np.array(list(averts.values()))
+                            vcomp = averts
                         else:
                             vcomp = self.modelgrid.array_at_verts(vcomp)
                             vcomp = np.flip(vcomp, axis=[0, 1])
@@ -1027,7 +1027,7 @@ class Vtk(object):
                             _, _, averts = self._get_3d_vertex_connectivity(
                                 actwcells=actwcells3d, zvalues=vcomp
                             )
-                            vcomp = np.array(list(averts.values()))
+                            vcomp = averts
                         else:
                             vcomp = np.flip(vcomp, axis=[0, 1])
                             # deal with true2d
@@ -1135,22 +1135,37 @@ class Vtk(object):
 
         Returns
         -------
-        vertsdict : dict
-            dictionary of verts
-        ivertsdict : dict
-            dictionary of iverts
-        zvertsdict : dict
-            dictionary of zverts
+        verts : ndarray
+            x, y, z of the vertices of each active cell, with a shape of
+            (ncells, npoints, 3)
+        iverts : ndarray
+            vertex numbers of each active cell, with a shape of
+            (ncells, npoints)
+        zverts : ndarray
+            z values of the vertices of each active cell, with a shape of
+            (ncells, npoints)
+
+        Notes
+        -----
+        The active cells and their vertex indices are cached, so repeated
+        calls with the same active cells (for example for every time step
+        of a head or cell by cell file) do not rebuild the geometry.
+
         """
         # set up active cells
         if actwcells is None:
             actwcells = self.ibound
 
-        ipoint = 0
-
-        vertsdict = {}
-        ivertsdict = {}
-        zvertsdict = {}
+        # get the cached geometry or build the vertex indices of the
+        # active cells
+        geom = self._geometry
+        if geom is None or not np.array_equal(geom["actwcells"], actwcells):
+            geom = self._build_vertex_indices(actwcells)
+            self._geometry = geom
+        elif zvalues is None and "verts" in geom:
+            return geom["verts"], geom["iverts"], geom["zverts"]
+        k, i, j = geom["cellids"]
+        vi, vj, vk = geom["vertexids"]
 
         # if smoothing interpolate the z values
         if self.smooth:
@@ -1166,120 +1181,70 @@ class Vtk(object):
         else:
             zVertices = None
 
-        # model cellid based on 1darray
-        # build the vertices
-        cellid = -1
-        for k in range(self.nlay):
-            for i in range(self.nrow):
-                for j in range(self.ncol):
-                    cellid += 1
-                    if actwcells[k, i, j] == 0:
-                        continue
-                    verts = []
-                    ivert = []
-                    zverts = []
-                    pts = self.modelgrid._cell_vert_list(i, j)
-                    pt0, pt1, pt2, pt3, pt0 = pts
-
-                    # determine z values
-                    if self.nz == 0 and zvalues is None:
-                        elev = np.nanmin(
-                            self.modelgrid.top_botm_withnan[k + 1, :, :]
-                        )
-                        zvals = [
-                            [elev, elev, elev, elev],
-                            [elev, elev, elev, elev],
-                        ]
-                    elif not self.smooth:
-                        zbot = self.modelgrid.top_botm[k + 1, i, j]
-                        ztop = self.modelgrid.top_botm[k, i, j]
-                        zvals = [
-                            [zbot, zbot, zbot, zbot],
-                            [ztop, ztop, ztop, ztop],
-                        ]
-                    else:
-                        zvals = [
-                            [
-                                zVertices[k + 1, i + 1, j],
-                                zVertices[k + 1, i + 1, j + 1],
-                                zVertices[k + 1, i, j],
-                                zVertices[k + 1, i, j + 1],
-                            ],
-                            [
-                                zVertices[k, i + 1, j],
-                                zVertices[k, i + 1, j + 1],
-                                zVertices[k, i, j],
-                                zVertices[k, i, j + 1],
-                            ],
-                        ]
-
-                    # fill in the output lists
-                    if self.nz == 0:
-                        verts.append([pt1[0], pt1[1], zvals[0][0]])
-                        verts.append([pt2[0], pt2[1], zvals[0][1]])
-                        verts.append([pt0[0], pt0[1], zvals[0][2]])
-                        verts.append([pt3[0], pt3[1], zvals[0][3]])
-                        ivert.extend(
-                            [ipoint, ipoint + 1, ipoint + 2, ipoint + 3]
-                        )
-                        zverts.extend(
-                            [
-                                zvals[0][0],
-                                zvals[0][1],
-                                zvals[0][2],
-                                zvals[0][3],
-                            ]
-                        )
-                        ipoint += 4
-                    elif self.ny == 0:
-                        verts.append([pt1[0], pt1[1], zvals[0][0]])
-                        verts.append([pt2[0], pt2[1], zvals[0][1]])
-                        verts.append([pt1[0], pt1[1], zvals[1][0]])
-                        verts.append([pt2[0], pt2[1], zvals[1][1]])
-                        ivert.extend(
-                            [ipoint, ipoint + 1, ipoint + 2, ipoint + 3]
-                        )
-                        zverts.extend(
-                            [
-                                zvals[0][0],
-                                zvals[0][1],
-                                zvals[1][0],
-                                zvals[1][1],
-                            ]
-                        )
-                        ipoint += 4
-                    elif self.nx == 0:
-                        verts.append([pt1[0], pt1[1], zvals[0][0]])
-                        verts.append([pt0[0], pt0[1], zvals[0][2]])
-                        verts.append([pt1[0], pt1[1], zvals[1][0]])
-                        verts.append([pt0[0], pt0[1], zvals[1][2]])
-                        ivert.extend(
-                            [ipoint, ipoint + 1, ipoint + 2, ipoint + 3]
-                        )
-                        zverts.extend(
-                            [
-                                zvals[0][0],
-                                zvals[0][2],
-                                zvals[1][0],
-                                zvals[1][2],
-                            ]
-                        )
-                        ipoint += 4
-                    else:
-                        for zvals_l in zvals:
-                            verts.append([pt1[0], pt1[1], zvals_l[0]])
-                            verts.append([pt2[0], pt2[1], zvals_l[1]])
-                            verts.append([pt0[0], pt0[1], zvals_l[2]])
-                            verts.append([pt3[0], pt3[1], zvals_l[3]])
-                            ivert.extend(
-                                [ipoint, ipoint + 1, ipoint + 2, ipoint + 3]
-                            )
-                            zverts.extend(zvals_l)
-                            ipoint += 4
-                    vertsdict[cellid] = verts
-                    ivertsdict[cellid] = ivert
-                    zvertsdict[cellid] = zverts
-        return vertsdict, ivertsdict, zvertsdict
+        # determine z values
+        if self.nz == 0 and zvalues is None:
+            elev = np.nanmin(self.modelgrid.top_botm_withnan[1:], axis=(1, 2))
+            zverts = np.broadcast_to(elev[k][:, None], vi.shape)
+        elif not self.smooth:
+            zverts = self.modelgrid.top_botm[vk, i[:, None], j[:, None]]
+        else:
+            zverts = zVertices[vk, vi, vj]
+
+        zverts = np.array(zverts)
+        if zvalues is not None:
+            # only the z values are used for point scalars
+            return None, geom["iverts"], zverts
+
+        # fill in the output arrays
+        xgrid, ygrid = self.modelgrid.xyzvertices[:2]
+        verts = np.stack((xgrid[vi, vj], ygrid[vi, vj], zverts), axis=-1)
+        geom["verts"] = verts
+        geom["zverts"] = zverts
+        return verts, geom["iverts"], zverts
+
+    def _build_vertex_indices(self, actwcells):
+        """
+        Builds the row, column, and layer indices of the vertices of the
+        active cells.
+
+        Parameters
+        ----------
+        actwcells : array
+            array of where data exists
+
+        Returns
+        -------
+        geom : dict
+            active cells, cell indices, vertex indices, and vertex numbers
+        """
+        # corners of a cell (row and column offsets in the vertex grid) and
+        # layer offset (bottom = 1, top = 0) of each vertex of a cell
+        if self.nz == 0:
+            corners, levels = [0, 1, 2, 3], [1, 1, 1, 1]
+        elif self.ny == 0:
+            corners, levels = [0, 1, 0, 1], [1, 1, 0, 0]
+        elif self.nx == 0:
+            corners, levels = [0, 2, 0, 2], [1, 1, 0, 0]
+        else:
+            corners, levels = [0, 1, 2, 3] * 2, [1, 1, 1, 1, 0, 0, 0, 0]
+        di = np.array([1, 1, 0, 0])[corners]
+        dj = np.array([0, 1, 0, 1])[corners]
+        dk = np.array(levels)
+
+        # active cells, in layer, row, column order
+        k, i, j = np.nonzero(actwcells)
+        ncells, npoints = k.shape[0], len(corners)
+        iverts = np.arange(ncells * npoints).reshape(ncells, npoints)
+        return {
+            "actwcells": np.array(actwcells),
+            "cellids": (k, i, j),
+            "vertexids": (
+                i[:, None] + di,
+                j[:, None] + dj,
+                k[:, None] + dk,
+            ),
+            "iverts": iverts,
+        }
 
 
 def _get_names(in_list):
@@ -1292,6 +1257,141 @@ def _get_names(in_list):
     return ot_list
 
 
+# per-process state of the worker processes that write vtk files
+_vtk_worker = None
+
+
+def _init_vtk_worker(vtkobj, reader_args):
+    """Set the Vtk object and open the head or budget file reader once for
+    each worker process."""
+    global _vtk_worker
+    reader = None
+    if reader_args is not None:
+        cls, args, kwargs = reader_args
+        reader = cls(*args, **kwargs)
+    _vtk_worker = (vtkobj, reader)
+
+
+def _write_vtk_step(args):
+    """Write the vtk file of a single time step in a worker process."""
+    step, task = args
+    vtkobj, reader = _vtk_worker
+    step(vtkobj, reader, *task)
+
+
+def _write_vtk_steps(
+    vtkobj, step, tasks, processes=None, reader=None, reader_args=None
+):
+    """
+    Write the vtk files of several time steps, one after the other or
+    concurrently in a pool of worker processes.
+
+    Parameters
+    ----------
+    vtkobj : Vtk
+        Vtk object used to write the files
+    step : function
+        module function called as step(vtkobj, reader, *task) to write the
+        vtk file of a time step
+    tasks : iterable of tuples
+        arguments of step for each time step
+    processes : int
+        number of worker processes, default is None (no worker processes)
+    reader : object
+        head or budget file reader used in this process
+    reader_args : tuple
+        (class, args, kwargs) used to open the reader in each worker
+        process
+    """
+    if processes is None or processes < 2:
+        for task in tasks:
+            step(vtkobj, reader, *task)
+        return
+
+    import copy
+    import multiprocessing
+
+    # the model is only used to set up the Vtk object, so do not send it
+    # to the worker processes
+    vtkobj = copy.copy(vtkobj)
+    vtkobj.model = None
+    vtkobj.arrays = {}
+    vtkobj.vectors = {}
+    pool = multiprocessing.Pool(
+        processes,
+        initializer=_init_vtk_worker,
+        initargs=(vtkobj, reader_args),
+    )
+    try:
+        for _ in pool.imap(_write_vtk_step, ((step, task) for task in tasks)):
+            pass
+    finally:
+        pool.close()
+        pool.join()
+    return
+
+
+def _write_cbc_step(
+    vtkobj, cbb, keylist, imeth_dict, shape, nanval, kstpkper_i, otfile
+):
+    """Write the cell by cell data of one time step to a vtk file."""
+    addarray = False
+    for name in keylist:
+
+        try:
+            rec = cbb.get_data(kstpkper=kstpkper_i, text=name, full3D=True)
+
+            if len(rec) > 0:
+                array = rec[0]  # need to fix for multiple pak
+                addarray = True
+
+        except ValueError:
+
+            rec = cbb.get_data(kstpkper=kstpkper_i, text=name)[0]
+
+            if imeth_dict[name] == 6:
+                array = np.full(shape, nanval)
+                # rec array
+                array.reshape(-1)[rec["node"] - 1] = rec["q"]
+
+                addarray = True
+            else:
+                raise Exception(
+                    "Data type not currently supported " "for cbc output"
+                )
+                # print('Data type not currently supported '
+                #       'for cbc output')
+
+        if addarray:
+
+            # set the data to no data value
+            if ma.is_masked(array):
+                array = np.where(array.mask, nanval, array)
+
+            # add array to vtk
+            vtkobj.add_array(name.strip(), array)  # need to adjust for
+
+    # write the vtk data to the output file
+    vtkobj.write(otfile)
+    return
+
+
+def _write_heads_step(vtkobj, hds, text, kstpkper_i, otfile):
+    """Write the heads of one time step to a vtk file."""
+    hdarr = hds.get_data(kstpkper_i)
+    vtkobj.add_array(text, hdarr)
+    # vtk.write(otfile, timeval=totim_dict[(kstp, kper)])
+    vtkobj.write(otfile)
+    return
+
+
+def _write_array_step(vtkobj, reader, name, a, array2d, otfile, timeval):
+    """Write an array of one stress period to a vtk file."""
+    vtkobj.add_array(name, a, array2d=array2d)
+    vtkobj.write(otfile, timeval=timeval)
+    return
+
+
 def export_cbc(
     model,
     cbcfile,
@@ -1306,6 +1406,7 @@ def export_cbc(
     vtk_grid_type="auto",
     true2d=False,
     binary=False,
+    processes=None,
 ):
     """
     Exports cell by cell file to vtk
@@ -1351,6 +1452,13 @@ def export_cbc(
         and the data will be exported as true 2d data, default is False.
     binary : bool
         if True the output file will be binary, default is False
+    processes : int, optional
+        number of worker processes that write the vtk files of different
+        time steps concurrently. Default is None, which writes the files
+        one after the other in this process. Each worker process opens
+        the cell by cell file once. On platforms that spawn new processes (e.g.
+        Windows) this function must be called from within an
+        ``if __name__ == "__main__":`` block.
     """
 
     mg = model.modelgrid
@@ -1422,8 +1530,8 @@ def export_cbc(
     )
 
     # export data
-    addarray = False
     count = 1
+    tasks = []
     for kstpkper_i in kstpkper:
         ot_base = "{}_CBC_KPER{}_KSTP{}".format(
             model_name, kstpkper_i[1] + 1, kstpkper_i[0] + 1
@@ -1435,47 +1543,23 @@ def export_cbc(
                 count, ot_base
             )
         )
-        for name in keylist:
-
-            try:
-                rec = cbb.get_data(kstpkper=kstpkper_i, text=name, full3D=True)
-
-                if len(rec) > 0:
-                    array = rec[0]  # need to fix for multiple pak
-                    addarray = True
-
-            except ValueError:
-
-                rec = cbb.get_data(kstpkper=kstpkper_i, text=name)[0]
-
-                if imeth_dict[name] == 6:
-                    array = np.full(shape, nanval)
-                    # rec array
-                    for [node, q] in zip(rec["node"], rec["q"]):
-                        lyr, row, col = np.unravel_index(node - 1, shape)
-
-                        array[lyr, row, col] = q
-
-                    addarray = True
-                else:
-                    raise Exception(
-                        "Data type not currently supported " "for cbc output"
-                    )
-                    # print('Data type not currently supported '
-                    #       'for cbc output')
-
-            if addarray:
-
-                # set the data to no data value
-                if ma.is_masked(array):
-                    array = np.where(array.mask, nanval, array)
+        tasks.append((keylist, imeth_dict, shape, nanval, kstpkper_i, otfile))
+        count += 1
 
-                # add array to vtk
-                vtk.add_array(name.strip(), array)  # need to adjust for
+    # write the vtk data to the output files
+    _write_vtk_steps(
+        vtk,
+        _write_cbc_step,
+        tasks,
+        processes=processes,
+        reader=cbb,
+        reader_args=(
+            bf.CellBudgetFile,
+            (cbcfile,),
+            {"precision": precision, "verbose": verbose},
+        ),
+    )
 
-        # write the vtk data to the output file
-        vtk.write(otfile)
-        count += 1
     # finish writing the pvd file
     pvdfile.write(
         """  </Collection>
@@ -1500,6 +1584,7 @@ def export_heads(
     vtk_grid_type="auto",
     true2d=False,
     binary=False,
+    processes=None,
 ):
     """
     Exports binary head file to vtk
@@ -1544,6 +1629,13 @@ def export_heads(
         and the data will be exported as true 2d data, default is False.
     binary : bool
         if True the output file will be binary, default is False
+    processes : int, optional
+        number of worker processes that write the vtk files of different
+        time steps concurrently. Default is None, which writes the files
+        one after the other in this process. Each worker process opens
+        the head file once. On platforms that spawn new processes (e.g.
+        Windows) this function must be called from within an
+        ``if __name__ == "__main__":`` block.
     """
 
     # setup output folder
@@ -1591,15 +1683,13 @@ def export_heads(
 
     # output data
     count = 0
+    tasks = []
     for kstpkper_i in kstpkper:
-        hdarr = hds.get_data(kstpkper_i)
-        vtk.add_array(text, hdarr)
         ot_base = ("{}_" + text + "_KPER{}_KSTP{}").format(
             model.name, kstpkper_i[1] + 1, kstpkper_i[0] + 1
         )
         otfile = os.path.join(otfolder, ot_base)
-        # vtk.write(otfile, timeval=totim_dict[(kstp, kper)])
-        vtk.write(otfile)
+        tasks.append((text, kstpkper_i, otfile))
         pvdfile.write(
             """<DataSet timestep="{}" group="" part="0"
          file="{}"/>\n""".format(
@@ -1608,6 +1698,20 @@ def export_heads(
         )
         count += 1
 
+    # write the vtk data to the output files
+    _write_vtk_steps(
+        vtk,
+        _write_heads_step,
+        tasks,
+        processes=processes,
+        reader=hds,
+        reader_args=(
+            HeadFile,
+            (hdsfile,),
+            {"text": text, "precision": precision, "verbose": verbose},
+        ),
+    )
+
     pvdfile.write(
         """  </Collection>
 </VTKFile>"""
@@ -1775,6 +1879,7 @@ def export_transient(
     true2d=False,
     binary=False,
     kpers=None,
+    processes=None,
 ):
     """
     Export transient 2d array to vtk
@@ -1816,6 +1921,12 @@ def export_transient(
     kpers : iterable of int
         Stress periods to export. If None (default), all stress periods will be
         exported.
+    processes : int, optional
+        number of worker processes that write the vtk files of different
+        stress periods concurrently. Default is None, which writes the
+        files one after the other in this process. On platforms that spawn
+        new processes (e.g. Windows) this function must be called from
+        within an ``if __name__ == "__main__":`` block.
     """
 
     if not os.path.exists(output_folder):
@@ -1843,28 +1954,23 @@ def export_transient(
     else:
         assert isinstance(kpers, list) or isinstance(kpers, np.ndarray)
 
-    if array2d:
+    def get_tasks():
+        # arrays are only formed when their stress period is written
         for kper in kpers:
-
-            t2d_array_kper = array[kper]
-            t2d_array_kper_shape = t2d_array_kper.shape
-            t2d_array_input = t2d_array_kper.reshape(
-                t2d_array_kper_shape[1], t2d_array_kper_shape[2]
-            )
-
-            vtk.add_array(name, t2d_array_input, array2d=True)
+            if array2d:
+                t2d_array_kper = array[kper]
+                t2d_array_kper_shape = t2d_array_kper.shape
+                a = t2d_array_kper.reshape(
+                    t2d_array_kper_shape[1], t2d_array_kper_shape[2]
+                )
+            else:
+                a = array[kper]
 
             otname = "{}".format(name) + separator + "0{}".format(kper + 1)
             otfile = os.path.join(output_folder, "{}".format(otname))
-            vtk.write(otfile, timeval=to_tim[kper])
-
-    else:
-        for kper in kpers:
-            vtk.add_array(name, array[kper])
+            yield name, a, array2d, otfile, to_tim[kper]
 
-            otname = "{}".format(name) + separator + "0{}".format(kper + 1)
-            otfile = os.path.join(output_folder, "{}".format(otname))
-            vtk.write(otfile, timeval=to_tim[kper])
+    _write_vtk_steps(vtk, _write_array_step, get_tasks(), processes=processes)
     return
 
 
@@ -12,7 +12,6 @@ import os
 import shutil
 import threading
 import warnings
-import queue as Queue
 
 from datetime import datetime
 from shutil import which
@@ -1354,6 +1353,7 @@ class BaseModel(ModelInterface):
         pause=False,
         report=False,
         normal_msg="normal termination",
+        timeout=None,
     ):
         """
         This method will run the model using subprocess.Popen.
@@ -1370,6 +1370,9 @@ class BaseModel(ModelInterface):
         normal_msg : str
             Normal termination message used to determine if the
             run terminated normally. (default is 'normal termination')
+        timeout : float, optional
+            Maximum run time in seconds.  The model is killed if it runs
+            longer than timeout.  (default is None)
 
         Returns
         -------
@@ -1387,6 +1390,7 @@ class BaseModel(ModelInterface):
             pause=pause,
             report=report,
             normal_msg=normal_msg,
+            timeout=timeout,
         )
 
     def load_results(self):
@@ -1654,6 +1658,7 @@ def run_model(
     normal_msg="normal termination",
     use_async=False,
     cargs=None,
+    timeout=None,
 ):
     """
     This function will run the model using subprocess.Popen.  It
@@ -1690,6 +1695,10 @@ def run_model(
     cargs : str or list of strings
         additional command line arguments to pass to the executable.
         Default is None
+    timeout : float
+        maximum run time in seconds.  The model is killed and the run is
+        not successful if it runs longer than timeout.  Default is None,
+        which does not limit the run time.
     Returns
     -------
     (success, buff)
@@ -1734,13 +1743,6 @@ def run_model(
             )
             raise Exception(s)
 
-    # simple little function for the thread to target
-    def q_output(output, q):
-        for line in iter(output.readline, b""):
-            q.put(line)
-            # time.sleep(1)
-            # output.close()
-
     # create a list of arguments to pass to Popen
     argv = [exe_name]
     if namefile is not None:
@@ -1756,42 +1758,38 @@ def run_model(
     # run the model with Popen
     proc = Popen(argv, stdout=PIPE, stderr=STDOUT, cwd=model_ws)
 
+    # kill the model if it runs longer than timeout
+    timed_out = threading.Event()
+    timer = None
+    if timeout is not None:
+
+        def kill():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, kill)
+        timer.daemon = True
+        timer.start()
+
+    # readline blocks until the model writes a line or exits, so stdout
+    # is streamed without polling the process
     if not use_async:
-        while True:
-            line = proc.stdout.readline().decode("utf-8")
-            if line == "" and proc.poll() is not None:
-                break
-            if line:
-                for msg in normal_msg:
-                    if msg in line.lower():
-                        success = True
-                        break
-                line = line.rstrip("\r\n")
-                if not silent:
-                    print(line)
-                if report:
-                    buff.append(line)
-            else:
-                break
-        return success, buff
-
-    # some tricks for the async stdout reading
-    q = Queue.Queue()
-    thread = threading.Thread(target=q_output, args=(proc.stdout, q))
-    thread.daemon = True
-    thread.start()
-
-    failed_words = ["fail", "error"]
-    last = datetime.now()
-    lastsec = 0.0
-    while True:
-        try:
-            line = q.get_nowait()
-        except Queue.Empty:
-            pass
-        else:
-            if line == "":
-                break
+        for line in iter(proc.stdout.readline, b""):
+            line = line.decode("utf-8")
+            for msg in normal_msg:
+                if msg in line.lower():
+                    success = True
+                    break
+            line = line.rstrip("\r\n")
+            if not silent:
+                print(line)
+            if report:
+                buff.append(line)
+    else:
+        failed_words = ["fail", "error"]
+        last = datetime.now()
+        lastsec = 0.0
+        for line in iter(proc.stdout.readline, b""):
             line = line.decode().lower().strip()
             if line != "":
                 now = datetime.now()
@@ -1806,20 +1804,96 @@ def run_model(
                     if fword in line:
                         success = False
                         break
-        if proc.poll() is not None:
-            break
+
+        for line in buff:
+            for msg in normal_msg:
+                if msg in line.lower():
+                    print("success")
+                    success = True
+                    break
+
     proc.wait()
-    thread.join(timeout=1)
-    buff.extend(proc.stdout.readlines())
     proc.stdout.close()
+    if timer is not None:
+        timer.cancel()
+    if timed_out.is_set():
+        success = False
+        line = "The model was stopped after {} seconds.".format(timeout)
+        if not silent:
+            print(line)
+        if report or use_async:
+            buff.append(line)
 
-    for line in buff:
-        for msg in normal_msg:
-            if msg in line.lower():
-                print("success")
-                success = True
-                break
-
-    if pause:
+    if use_async and pause:
         input("Press Enter to continue...")
     return success, buff
+
+
+def run_models(
+    runs,
+    max_workers=None,
+    timeout=None,
+    silent=True,
+    report=False,
+    normal_msg="normal termination",
+):
+    """
+    Run several models at the same time, for example the models of a
+    parameter sweep.
+
+    Parameters
+    ----------
+    runs : list
+        Models to run.  Each entry can be a model with a run_model() method
+        (for example a flopy.modflow.Modflow model), a
+        flopy.mf6.MFSimulation, or a dictionary of keyword arguments for
+        run_model() (for example {'exe_name': 'mf2005',
+        'namefile': 'model.nam', 'model_ws': 'run1'}).
+    max_workers : int
+        Maximum number of models that run at the same time.  Default is
+        None, which uses the number of processors.
+    timeout : float
+        Maximum run time in seconds of each model.  Models that run longer
+        are killed and are not successful.  Default is None.
+    silent : boolean
+        Do not echo run information to screen.  The output of models that
+        run at the same time is interleaved.  (default is True).
+    report : boolean
+        Save stdout lines of each run to a list (buff) (default is False).
+    normal_msg : str or list
+        Normal termination message used to determine if a run terminated
+        normally. (Default is 'normal termination')
+
+    Returns
+    -------
+    results : list of (success, buff)
+        The result of each run, in the same order as runs.
+
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if isinstance(normal_msg, str):
+        normal_msg = [normal_msg]
+
+    def run(item):
+        kwargs = {
+            "silent": silent,
+            "report": report,
+            "normal_msg": list(normal_msg),
+            "timeout": timeout,
+        }
+        if isinstance(item, dict):
+            kwargs.update(item)
+            return run_model(**kwargs)
+        elif hasattr(item, "run_simulation"):
+            return item.run_simulation(**kwargs)
+        return item.run_model(**kwargs)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    # each model runs in its own process, so the threads only wait on
+    # the output of the models
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run, item) for item in runs]
+        return [future.result() for future in futures]
@@ -713,6 +713,14 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
                     ex,
                 )
 
+            # simple lists are formatted a column at a time
+            fast_entry = self._get_file_entry_fast(
+                data_complete, storage, indent
+            )
+            if fast_entry is not None:
+                file_entry.extend(fast_entry)
+                data_lines = 0
+
             # loop through list line by line - assumes first data_item size
             # is representative
             self._crnt_line_num = 1
@@ -745,6 +753,157 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
         self._data_dimensions.unlock()
         return "".join(file_entry)
 
+    def _get_file_entry_fast(self, data_complete, storage, indent):
+        # Formats simple list data (numbers, strings and cellids with one
+        # column per data item) a column at a time.  Returns None for data
+        # that must be formatted line by line: records, keywords,
+        # keystrings, time series names, comments and missing values.
+        if (
+            storage.layer_storage.first_item().data_storage_type
+            != DataStorageType.internal_array
+            or not isinstance(data_complete, np.ndarray)
+            or data_complete.dtype.names is None
+            or len(data_complete) == 0
+        ):
+            return None
+        for comment in storage.comments.values():
+            if comment.text:
+                return None
+
+        data_items = self._get_simple_data_items(data_complete, storage)
+        if data_items is None:
+            return None
+        columns = []
+        for name, data_item in zip(data_complete.dtype.names, data_items):
+            column = self._format_column(data_complete[name], data_item)
+            if column is None:
+                return None
+            columns.append(column)
+        return [
+            "{}{}\n".format(indent, indent.join(text_line))
+            for text_line in zip(*columns)
+        ]
+
+    def _get_simple_data_items(self, data_complete, storage):
+        # Returns the data item structure of each recarray column, in the
+        # order _get_file_entry_record writes them, or None if the
+        # structure is not a flat list of single-column data items
+        data_dim = self._data_dimensions
+        num_columns = len(data_complete.dtype.names)
+        data_items = []
+        for data_item in self.structure.data_item_structures:
+            if data_item.is_aux:
+                aux_var_names = data_dim.package_dim.get_aux_variables()
+                if aux_var_names is not None:
+                    for aux_var_name in aux_var_names[0]:
+                        if aux_var_name.lower() != "auxiliary":
+                            data_items.append(data_item)
+            elif data_item.type == DatumType.record:
+                return None
+            elif (
+                not data_item.is_boundname or data_dim.package_dim.boundnames()
+            ) and (
+                not data_item.optional
+                or data_item.name_length < 5
+                or not data_item.is_mname
+                or not storage.in_model
+            ):
+                if len(data_items) >= num_columns:
+                    if data_item.optional:
+                        break
+                    return None
+                if (
+                    data_item.type
+                    not in (
+                        DatumType.double_precision,
+                        DatumType.integer,
+                        DatumType.string,
+                    )
+                    or data_item.tagged
+                    or data_item.support_negative_index
+                    or (data_item.possible_cellid and not data_item.is_cellid)
+                ):
+                    return None
+                if data_item.shape and not (
+                    data_item.is_cellid and data_item.shape[0] == "ncelldim"
+                ):
+                    return None
+                data_items.append(data_item)
+        if len(data_items) != num_columns:
+            return None
+        return data_items
+
+    def _format_column(self, values, data_item):
+        # Formats a recarray column the way to_string formats each of its
+        # values, or returns None if the column can not be formatted as a
+        # whole
+        sim_data = self._simulation_data
+        if data_item.type == DatumType.double_precision:
+            if values.dtype.kind not in "fiu":
+                # time series names or missing values
+                return None
+            values = values.astype(np.float64)
+            if np.isnan(values).any():
+                return None
+            abs_values = np.abs(values)
+            sci_note = (
+                (abs_values > sim_data._sci_note_upper_thres)
+                | (abs_values < sim_data._sci_note_lower_thres)
+            ) & (abs_values != 0)
+            reg_format = sim_data.reg_format_str.format
+            sci_format = sim_data.sci_format_str.format
+            return [
+                reg_format(val) if sci else sci_format(val)
+                for val, sci in zip(values.tolist(), sci_note.tolist())
+            ]
+        elif data_item.is_cellid:
+            if values.dtype.kind in "iu":
+                return (values.astype(np.int64) + 1).astype(str).tolist()
+            cellids = values.tolist()
+            if not isinstance(cellids[0], tuple):
+                return None
+            cellid_size = len(cellids[0])
+            data_dim = self._data_dimensions
+            if data_dim.get_model_dim(None).model_name is not None:
+                model_grid = data_dim.get_model_grid()
+                if cellid_size != model_grid.get_num_spatial_coordinates():
+                    return None
+            for cellid in cellids:
+                if not isinstance(cellid, tuple) or len(cellid) != cellid_size:
+                    return None
+            cellids = np.array(cellids)
+            if cellids.dtype.kind not in "iu":
+                return None
+            cellid_format = " ".join(["{}"] * cellid_size).format
+            return [
+                cellid_format(*cellid)
+                for cellid in (cellids.astype(np.int64) + 1).tolist()
+            ]
+        elif data_item.type == DatumType.integer:
+            if values.dtype.kind not in "iu":
+                return None
+            values = values.astype(np.int64)
+            if data_item.numeric_index:
+                values = values + 1
+            return values.astype(str).tolist()
+        else:
+            values = values.tolist()
+            for val in values:
+                if val is None or (isinstance(val, float) and math.isnan(val)):
+                    return None
+            # strings such as boundnames repeat, format each one once
+            string_vals = {
+                val: to_string(
+                    val,
+                    DatumType.string,
+                    sim_data,
+                    self._data_dimensions,
+                    data_item=data_item,
+                )
+                for val in set(values)
+            }
+            return [string_vals[val] for val in values]
+
     def _get_file_entry_record(
         self,
         data_complete,
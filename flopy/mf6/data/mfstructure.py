@@ -4,14 +4,20 @@ mfstructure module.  Contains classes related to package structure
 
 """
 import os
+import glob
+import hashlib
+import pickle
+import sys
 import traceback
 import ast
 import keyword
 from enum import Enum
 from textwrap import TextWrapper
 from collections import OrderedDict
+from collections.abc import MutableMapping
 import numpy as np
 from ..mfbase import PackageContainer, StructException
+from ...version import __version__
 
 
 numeric_index_text = (
@@ -2115,6 +2121,65 @@ class MFInputFileStructure(object):
             return None
 
 
+class MFInputFileStructureDict(MutableMapping):
+    """
+    Ordered dictionary of MFInputFileStructure objects keyed by package type.
+    Structures added with add_lazy are only built from their dfn
+    information the first time they are accessed, so that only the
+    structures of the packages that are actually used are built.
+
+    Methods
+    -------
+    add_lazy : (key : string, dfn_file : Dfn, path : tuple, common :
+            OrderedDict, model_file : bool)
+        Adds the structure of a package, to be built when first accessed
+    set_read_as_arrays : (key : string)
+        Tags the structure of a package as the READASARRAYS version of a
+        package
+    """
+
+    def __init__(self):
+        self._structs = OrderedDict()
+        # arguments of MFInputFileStructure for structures not built yet
+        self._pending = {}
+        self._read_as_arrays = set()
+
+    def add_lazy(self, key, dfn_file, path, common, model_file):
+        self._structs[key] = None
+        self._pending[key] = (dfn_file, path, common, model_file)
+
+    def set_read_as_arrays(self, key):
+        if key in self._pending:
+            self._read_as_arrays.add(key)
+        else:
+            self._structs[key].read_as_arrays = True
+
+    def __getitem__(self, key):
+        if key in self._pending:
+            struct = MFInputFileStructure(*self._pending.pop(key))
+            if key in self._read_as_arrays:
+                struct.read_as_arrays = True
+            self._structs[key] = struct
+        return self._structs[key]
+
+    def __setitem__(self, key, value):
+        self._pending.pop(key, None)
+        self._structs[key] = value
+
+    def __delitem__(self, key):
+        self._pending.pop(key, None)
+        del self._structs[key]
+
+    def __contains__(self, key):
+        return key in self._structs
+
+    def __iter__(self):
+        return iter(self._structs)
+
+    def __len__(self):
+        return len(self._structs)
+
+
 class MFModelStructure(object):
     """
     Defines the structure of a MF6 model and its packages
@@ -2130,7 +2195,7 @@ class MFModelStructure(object):
         simulation structure validity
     name_file_struct_obj : MFInputFileStructure
         describes the structure of the simulation name file
-    package_struct_objs : OrderedDict
+    package_struct_objs : MFInputFileStructureDict
         describes the structure of the simulation packages
     model_type : string
         dictionary containing simulation package structure
@@ -2161,7 +2226,7 @@ class MFModelStructure(object):
         # add name file structure
         self.model_type = model_type
         self.name_file_struct_obj = None
-        self.package_struct_objs = OrderedDict()
+        self.package_struct_objs = MFInputFileStructureDict()
         self.utl_struct_objs = utl_struct_objs
 
     def add_namefile(self, dfn_file, common):
@@ -2170,8 +2235,8 @@ class MFModelStructure(object):
         )
 
     def add_package(self, dfn_file, common):
-        self.package_struct_objs[dfn_file.package_type] = MFInputFileStructure(
-            dfn_file, (self.model_type,), common, True
+        self.package_struct_objs.add_lazy(
+            dfn_file.package_type, dfn_file, (self.model_type,), common, True
         )
 
     def get_package_struct(self, package_type):
@@ -2217,11 +2282,11 @@ class MFSimulationStructure(object):
     ----------
     name_file_struct_obj : MFInputFileStructure
         describes the structure of the simulation name file
-    package_struct_objs : OrderedDict
+    package_struct_objs : MFInputFileStructureDict
         describes the structure of the simulation packages
     model_struct_objs : OrderedDict
         describes the structure of the supported model types
-    utl_struct_objs : OrderedDict
+    utl_struct_objs : MFInputFileStructureDict
         describes the structure of the supported utility packages
     common : OrderedDict
         common file information
@@ -2265,8 +2330,8 @@ class MFSimulationStructure(object):
     def __init__(self):
         # initialize
         self.name_file_struct_obj = None
-        self.package_struct_objs = OrderedDict()
-        self.utl_struct_objs = OrderedDict()
+        self.package_struct_objs = MFInputFileStructureDict()
+        self.utl_struct_objs = MFInputFileStructureDict()
         self.model_struct_objs = OrderedDict()
         self.common = None
         self.model_type = ""
@@ -2327,13 +2392,13 @@ class MFSimulationStructure(object):
         )
 
     def add_util(self, dfn_file):
-        self.utl_struct_objs[dfn_file.package_type] = MFInputFileStructure(
-            dfn_file, (), self.common, True
+        self.utl_struct_objs.add_lazy(
+            dfn_file.package_type, dfn_file, (), self.common, True
         )
 
     def add_package(self, dfn_file, model_file=True):
-        self.package_struct_objs[dfn_file.package_type] = MFInputFileStructure(
-            dfn_file, (), self.common, model_file
+        self.package_struct_objs.add_lazy(
+            dfn_file.package_type, dfn_file, (), self.common, model_file
         )
 
     def store_common(self, dfn_file):
@@ -2384,19 +2449,16 @@ class MFSimulationStructure(object):
             return None
 
     def tag_read_as_arrays(self):
-        for key, package_struct in self.package_struct_objs.items():
+        for key in self.package_struct_objs:
             if key[0:-1] in self.package_struct_objs and key[-1] == "a":
-                package_struct.read_as_arrays = True
+                self.package_struct_objs.set_read_as_arrays(key)
         for model_key, model_struct in self.model_struct_objs.items():
-            for (
-                key,
-                package_struct,
-            ) in model_struct.package_struct_objs.items():
+            for key in model_struct.package_struct_objs:
                 if (
                     key[0:-1] in model_struct.package_struct_objs
                     and key[-1] == "a"
                 ):
-                    package_struct.read_as_arrays = True
+                    model_struct.package_struct_objs.set_read_as_arrays(key)
 
 
 class MFStructure(object):
@@ -2416,9 +2478,20 @@ class MFStructure(object):
     dimension_dict : dict
         Dictionary mapping paths to dimension information to the dataitem whose
         dimension information is being described
+    cache_dir : str
+        Folder of the on-disk structure cache.  When set, the fully built
+        structure is pickled to this folder the first time it is built and
+        later processes load it from there instead of processing the dfn
+        information again.  The cache file name contains a hash of the flopy
+        version, the python version and the dfn and package files, so the
+        cache is rebuilt when any of these change.  Defaults to the
+        FLOPY_MF6_STRUCTURE_CACHE environment variable, or None (no cache).
+        Only point this to a folder that you trust, because loading a
+        pickle file can execute arbitrary code.
     """
 
     _instance = None
+    cache_dir = os.environ.get("FLOPY_MF6_STRUCTURE_CACHE")
 
     def __new__(cls, internal_request=False, load_from_dfn_files=False):
         if cls._instance is None:
@@ -2432,8 +2505,11 @@ class MFStructure(object):
             cls._instance.load_from_dfn_files = load_from_dfn_files
             cls._instance.flopy_dict = {}
 
-            # Read metadata from file
-            cls._instance.valid = cls._instance.__load_structure()
+            # Read metadata from the structure cache or from file
+            if not cls._instance.__load_cache():
+                cls._instance.valid = cls._instance.__load_structure()
+                if cls._instance.valid:
+                    cls._instance.__save_cache()
         elif not cls._instance.valid and not internal_request:
             if cls._instance.__load_structure():
                 cls._instance.valid = True
@@ -2470,6 +2546,87 @@ class MFStructure(object):
 
         return True
 
+    def __cache_path(self):
+        key = hashlib.sha1()
+        key.update(
+            "{} {} {} {}".format(
+                __version__,
+                sys.version_info[:2],
+                pickle.HIGHEST_PROTOCOL,
+                self.load_from_dfn_files,
+            ).encode()
+        )
+        # structure code, dfn files and the generated package classes
+        data_path = os.path.dirname(os.path.realpath(__file__))
+        file_paths = [os.path.realpath(__file__)]
+        file_paths += sorted(glob.glob(os.path.join(data_path, "dfn", "*")))
+        file_paths += sorted(PackageContainer.get_package_file_paths())
+        for file_path in file_paths:
+            stat = os.stat(file_path)
+            key.update(
+                "{} {} {}".format(
+                    os.path.basename(file_path), stat.st_size, stat.st_mtime
+                ).encode()
+            )
+        return os.path.join(
+            self.cache_dir, "mfstructure_{}.pkl".format(key.hexdigest())
+        )
+
+    def __load_cache(self):
+        if not self.cache_dir:
+            return False
+        try:
+            with open(self.__cache_path(), "rb") as f:
+                (
+                    self.sim_struct,
+                    self.dimension_dict,
+                    self.flopy_dict,
+                ) = pickle.load(f)
+        except Exception:
+            # missing, outdated or unreadable cache
+            return False
+        self.valid = True
+        return True
+
+    def __save_cache(self):
+        if not self.cache_dir:
+            return
+        # build the structure of all packages before storing it
+        sim_struct = self.sim_struct
+        struct_dicts = [sim_struct.package_struct_objs]
+        struct_dicts.append(sim_struct.utl_struct_objs)
+        for model_struct in sim_struct.model_struct_objs.values():
+            struct_dicts.append(model_struct.package_struct_objs)
+        for struct_dict in struct_dicts:
+            for key in struct_dict:
+                struct_dict[key]
+        tmp_path = None
+        try:
+            if not os.path.isdir(self.cache_dir):
+                os.makedirs(self.cache_dir)
+            cache_path = self.__cache_path()
+            # write to a temporary file first, so other processes never
+            # read a partially written cache file
+            tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+            with open(tmp_path, "wb") as f:
+                pickle.dump(
+                    (sim_struct, self.dimension_dict, self.flopy_dict),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, cache_path)
+            tmp_path = None
+        except Exception:
+            # the cache is optional, continue without it
+            pass
+        finally:
+            # remove a partially written cache file
+            if tmp_path is not None and os.path.isfile(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
     def __load_flopy(self):
         current_variable = None
         var_info = {}
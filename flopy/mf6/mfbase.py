@@ -496,11 +496,17 @@ class PackageContainer(object):
         self.package_name_dict = {}
         self.package_key_dict = {}
 
+    # package and model classes by package abbreviation and model type,
+    # built from the flopy.mf6.modflow modules on first use
+    modflow_packages = None
+    packages_by_abbr = None
+    modflow_models = None
+
     @staticmethod
-    def package_factory(package_type, model_type):
-        package_abbr = "{}{}".format(model_type, package_type)
-        package_utl_abbr = "utl{}".format(package_type)
-        package_list = []
+    def _build_registry():
+        packages = []
+        packages_by_abbr = {}
+        models = {}
         # iterate through python files
         package_file_paths = PackageContainer.get_package_file_paths()
         for package_file_path in package_file_paths:
@@ -513,36 +519,37 @@ class PackageContainer(object):
                     )
                     if value is not None:
                         abbr = value.package_abbr
-                        if package_type is None:
-                            # don't store packages "group" classes
-                            if len(abbr) <= 8 or abbr[-8:] != "packages":
-                                package_list.append(value)
-                        else:
-                            # check package type
-                            if (
-                                value.package_abbr == package_abbr
-                                or value.package_abbr == package_utl_abbr
-                            ):
-                                return value
+                        # don't store packages "group" classes
+                        if len(abbr) <= 8 or abbr[-8:] != "packages":
+                            packages.append(value)
+                        if abbr not in packages_by_abbr:
+                            packages_by_abbr[abbr] = value
+                    value = PackageContainer.get_module_val(
+                        module, item, "model_type"
+                    )
+                    if value is not None and value.model_type not in models:
+                        models[value.model_type] = value
+        PackageContainer.modflow_packages = packages
+        PackageContainer.packages_by_abbr = packages_by_abbr
+        PackageContainer.modflow_models = models
+
+    @staticmethod
+    def package_factory(package_type, model_type):
+        if PackageContainer.packages_by_abbr is None:
+            PackageContainer._build_registry()
         if package_type is None:
-            return package_list
-        else:
-            return None
+            return list(PackageContainer.modflow_packages)
+        package_abbr = "{}{}".format(model_type, package_type)
+        package_utl_abbr = "utl{}".format(package_type)
+        if package_abbr in PackageContainer.packages_by_abbr:
+            return PackageContainer.packages_by_abbr[package_abbr]
+        return PackageContainer.packages_by_abbr.get(package_utl_abbr)
 
     @staticmethod
     def model_factory(model_type):
-        package_file_paths = PackageContainer.get_package_file_paths()
-        for package_file_path in package_file_paths:
-            module = PackageContainer.get_module(package_file_path)
-            if module is not None:
-                # iterate imported items
-                for item in dir(module):
-                    value = PackageContainer.get_module_val(
-                        module, item, "model_type"
-                    )
-                    if value is not None and value.model_type == model_type:
-                        return value
-        return None
+        if PackageContainer.modflow_models is None:
+            PackageContainer._build_registry()
+        return PackageContainer.modflow_models.get(model_type)
 
     @staticmethod
     def get_module_val(module, item, attrb):
@@ -1427,6 +1427,7 @@ class MFSimulation(PackageContainer):
         normal_msg="normal termination",
         use_async=False,
         cargs=None,
+        timeout=None,
     ):
         """Run the simulation.
 
@@ -1449,6 +1450,9 @@ class MFSimulation(PackageContainer):
             cargs : (str or list of strings)
                 additional command line arguments to pass to the executable.
                 default is None
+            timeout : (float)
+                maximum run time in seconds.  the simulation is killed if it
+                runs longer than timeout.  default is None
 
         Returns
         --------
@@ -1475,6 +1479,7 @@ class MFSimulation(PackageContainer):
             normal_msg=normal_msg,
             use_async=use_async,
             cargs=cargs,
+            timeout=timeout,
         )
 
     def delete_output_files(self):
@@ -1,5 +1,6 @@
 import os
 import numpy as np
+from numpy.lib.mixins import NDArrayOperatorsMixin
 from ...utils import binaryfile as bf
 
 
@@ -47,6 +48,172 @@ class MFOutput:
         return self.data
 
 
+class MFOutputArray(NDArrayOperatorsMixin):
+    """
+    Lazy array of the records in a binary output file. The record index
+    of the file is kept, the file itself is only open while records are
+    read, and only the records selected by the first (time) index are read
+    from the file.  Other ndarray attributes and methods are applied to all
+    of the records in the file.
+
+    Parameters
+    ----------
+    bindata : HeadFile, UcnFile or CellBudgetFile
+        open binary output file
+    text : str
+        budget record name for CellBudgetFile data (default is None)
+    full3D : bool
+        return budget records as full three dimensional arrays. If None,
+        full three dimensional arrays are returned unless the records are
+        written with imeth 6 (default is None)
+    flatten : bool
+        flatten each record to one dimension (default is False)
+
+    Examples
+    --------
+    >>> heads = sim.simulation_data.mfdata[('flow15', 'HDS', 'HEAD')]
+    >>> heads.shape
+    >>> last = heads[-1]
+    >>> layer = heads[:, 0, :, :]
+    >>> all_heads = np.array(heads)
+    >>> hmax = heads.max()
+    """
+
+    def __init__(self, bindata, text=None, full3D=None, flatten=False):
+        self._bindata = bindata
+        self._text = text
+        self._flatten = flatten
+        if text is None:
+            self._records = list(bindata.times)
+        else:
+            self._records = list(bindata.get_indices(text))
+            if full3D is None:
+                imeth = bindata.recordarray["imeth"][self._records]
+                full3D = not np.any(imeth == 6)
+        self._full3D = full3D
+        self._record0 = None
+        bindata.close()
+
+    def _read_records(self, irecs):
+        # open the binary file only while the records are read
+        self._bindata.file = open(self._bindata.filename, "rb")
+        try:
+            return [self._read_record(idx) for idx in irecs]
+        finally:
+            self._bindata.close()
+
+    def _read_record(self, idx):
+        # read a single record from the open binary file
+        if self._text is None:
+            data = np.array(self._bindata.get_data(totim=self._records[idx]))
+            data[data == -9999] = np.nan
+        else:
+            data = np.asarray(
+                self._bindata.get_record(
+                    self._records[idx], full3D=self._full3D
+                )
+            )
+        if self._flatten:
+            data = data.reshape(-1)
+        return data
+
+    def _first_record(self):
+        if self._record0 is None:
+            self._record0 = self._read_records([0])[0]
+        return self._record0
+
+    @property
+    def shape(self):
+        if len(self._records) == 0:
+            return (0,)
+        return (len(self._records),) + self._first_record().shape
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    @property
+    def dtype(self):
+        if len(self._records) == 0:
+            return np.dtype(float)
+        return self._first_record().dtype
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        for idx in range(len(self._records)):
+            yield self._read_records([idx])[0]
+
+    def __getattr__(self, name):
+        # apply other ndarray attributes and methods, such as max(),
+        # reshape() and T, to all of the records
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(np.asarray(self), name)
+
+    def __getitem__(self, index):
+        if not isinstance(index, tuple):
+            index = (index,)
+        if len(index) == 0 or not self._is_record_index(index[0]):
+            # boolean masks and other indexes that do not only select
+            # records are applied to all of the records
+            return np.asarray(self)[index]
+        irecs = np.arange(len(self._records))[index[0]]
+        if irecs.ndim == 0:
+            data = self._read_records([int(irecs)])[0]
+        elif irecs.size == 0:
+            data = np.empty((0,) + self.shape[1:], dtype=self.dtype)
+        else:
+            data = np.array(self._read_records(irecs))
+        if irecs.ndim > 0:
+            index = (slice(None),) + index[1:]
+        else:
+            index = index[1:]
+        return data[index]
+
+    @staticmethod
+    def _is_record_index(index):
+        # integers, slices and one dimensional integer arrays only select
+        # records
+        if isinstance(index, (bool, np.bool_)):
+            return False
+        if isinstance(index, (int, np.integer, slice)):
+            return True
+        if isinstance(index, (list, np.ndarray)):
+            index = np.asarray(index)
+            return index.ndim == 1 and index.dtype.kind in "iu"
+        return False
+
+    def __array__(self, dtype=None, copy=None):
+        data = np.array(self._read_records(range(len(self))))
+        if dtype is not None:
+            data = data.astype(dtype)
+        return data
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs = [
+            np.asarray(x) if isinstance(x, MFOutputArray) else x
+            for x in inputs
+        ]
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def __repr__(self):
+        return "MFOutputArray(file={}, text={}, shape={})".format(
+            self._bindata.filename, self._text, self.shape
+        )
+
+    def close(self):
+        """
+        Close the binary output file.
+        """
+        self._bindata.close()
+
+
 class MFOutputRequester:
     """
     MFOutputRequest class is a helper function to enable the user to query
@@ -108,13 +275,9 @@ class MFOutputRequester:
         bindata = self._get_binary_file_object(path, bintype, key)
 
         if bintype == "CBC":
-            try:
-                return np.array(bindata.get_data(text=key[-1], full3D=True))
-            except ValueError:
-                # imeth == 6
-                return np.array(bindata.get_data(text=key[-1], full3D=False))
+            return MFOutputArray(bindata, text=key[-1])
         else:
-            return np.array(bindata.get_alldata())
+            return MFOutputArray(bindata)
 
     def _querybinarydata_vertices(self, mfdict, key):
         # Basic definition to get output data from binary output files for
@@ -126,26 +289,14 @@ class MFOutputRequester:
 
         if bintype == "CBC":
             if key[-1] == "FLOW-JA-FACE":
-                data = np.array(bindata.get_data(text=key[-1]))
                 # uncomment line to remove extra dimensions from data
                 # data data.shape = (len(times), -1)
-                return data
+                return MFOutputArray(bindata, text=key[-1], full3D=False)
 
             else:
-                try:
-                    data = np.array(
-                        bindata.get_data(text=key[-1], full3D=True)
-                    )
-                except ValueError:
-                    # imeth == 6
-                    data = np.array(
-                        bindata.get_data(text=key[-1], full3D=False)
-                    )
+                data = MFOutputArray(bindata, text=key[-1])
         else:
-            data = np.array(bindata.get_alldata())
-
-        # uncomment line to remove extra dimensions from data
-        # data = _reshape_binary_data(data, 'V')
+            data = MFOutputArray(bindata)
         return data
 
     def _querybinarydata_unstructured(self, key):
@@ -155,22 +306,11 @@ class MFOutputRequester:
 
         bindata = self._get_binary_file_object(path, bintype, key)
 
-        if bintype == "CBC":
-            try:
-                data = np.array(bindata.get_data(text=key[-1], full3D=True))
-            except ValueError:
-                data = np.array(bindata.get_data(text=key[-1], full3D=False))
-        else:
-            data = bindata.get_alldata()
-
         # remove un-needed dimensions
-        data = _reshape_binary_data(data, "U")
-
-        if key[-1] == "FLOW-JA-FACE":
-            return data
-
+        if bintype == "CBC":
+            return MFOutputArray(bindata, text=key[-1], flatten=True)
         else:
-            return data
+            return MFOutputArray(bindata, flatten=True)
 
     def _get_binary_file_object(self, path, bintype, key):
         # simple method that trys to open the binary file object using Flopy
@@ -374,21 +514,3 @@ class MFOutputRequester:
             for key in keys:
                 print(key)
         return x
-
-
-def _reshape_binary_data(data, dtype=None):
-    # removes unnecessary dimensions from data returned by
-    # flopy.utils.binaryfile
-    time = len(data)
-    data = np.array(data)
-    if dtype is None:
-        return data
-    elif dtype == "V":
-        nodes = len(data[0][0][0])
-        data.shape = (time, -1, nodes)
-    elif dtype == "U":
-        data.shape = (time, -1)
-    else:
-        err = "Invalid dtype flag supplied, valid are dtype='U', dtype='V'"
-        raise Exception(err)
-    return data
@@ -1,5 +1,12 @@
+import os
 import numpy as np
 import csv
+from collections import OrderedDict
+
+# parsed observation files, keyed by path.  Only the most recently used
+# files are kept
+_observation_cache = OrderedDict()
+_observation_cache_size = 16
 
 
 def try_float(data):
@@ -83,23 +90,77 @@ class Observations:
             data = [[try_float(point) for point in line] for line in reader]
         return np.array(data)
 
-    def _array_to_dict(self, data, key=None):
-        # convert np.array to dictionary of observation names and data
-        data = data.T
-        data = {
-            line[0]: [try_float(point) for point in line[1:]] for line in data
+    def _load(self):
+        # parse the observation file once into a column store of header
+        # names and a (ntimes, ncolumns) float array.  The parsed file is
+        # cached and only read again when its modification time or size
+        # changes.  A file rewritten with the same size within the
+        # resolution of the file system timestamps is not detected
+        fi = os.path.abspath(self.Obsname)
+        stat = os.stat(fi)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = _observation_cache.get(fi)
+        if cached is not None and cached["stamp"] == stamp:
+            _observation_cache.move_to_end(fi)
+            return cached
+
+        with open(fi) as f:
+            header = next(csv.reader(f))
+            try:
+                values = np.loadtxt(f, delimiter=",", dtype=float, ndmin=2)
+            except ValueError:
+                values = None
+        if values is None:
+            # entries that are not numbers, use the general reader
+            data = self._reader(fi)
+            header = data[0].tolist()
+            values = data[1:].astype(float)
+        elif values.size == 0:
+            values = np.empty((0, len(header)), dtype=float)
+        values.flags.writeable = False
+
+        cached = {
+            "stamp": stamp,
+            "header": header,
+            "values": values,
+            "columns": {name: idx for idx, name in enumerate(header)},
+            "str_data": None,
         }
-        if key is None:
-            return data
-        else:
-            return data[key]
+        _observation_cache.pop(fi, None)
+        _observation_cache[fi] = cached
+        while len(_observation_cache) > _observation_cache_size:
+            _observation_cache.popitem(last=False)
+        return cached
+
+    def _get_str_data(self):
+        # observation file data as an array of strings that includes the
+        # header line
+        cached = self._load()
+        if cached["str_data"] is None:
+            str_data = np.array([cached["header"]] + cached["values"].tolist())
+            str_data.flags.writeable = False
+            cached["str_data"] = str_data
+        return cached["str_data"]
+
+    def _get_column(self, key):
+        # read-only view of the data for observation key
+        cached = self._load()
+        return cached["values"][:, cached["columns"][key]]
+
+    def _get_time_index(self, totim):
+        idx = np.where(self._get_column("time") == totim)[0]
+        if idx.size == 0:
+            err = (
+                "Invalid totim value provided: obs.get_times() "
+                "returns a list of valid times for totim = <>"
+            )
+            raise ValueError(err)
+        return int(idx[0])
 
     def list_records(self):
         # requester option to list all records (observation names) within an
         # observation file
-        data_str = self._reader(self.Obsname)
-        data = self._array_to_dict(data_str)
-        for key in data:
+        for key in self._load()["columns"]:
             print(key)
 
     def get_data(self, key=None, idx=None, totim=None):
@@ -118,65 +179,40 @@ class Observations:
         -------
         data: (list) observation file data in list
         """
-        data = self._reader(self.Obsname)
-
         # check if user supplied observation key, default is to return
         # all observations
         if key is None:
-            header = data[0]
+            data = self._get_str_data()
             if idx is not None:
                 data = data[idx, :]
             elif totim is not None:
-                try:
-                    times = self.get_times()
-                    idx = times.index(totim)
-                    data = data[idx, :]
-                except ValueError:
-                    err = (
-                        "Invalid totim value provided: obs.get_times() "
-                        "returns a list of valid times for totim = <>"
-                    )
-                    raise ValueError(err)
-            else:
-                pass
+                idx = self._get_time_index(totim)
+                data = data[idx, :]
+            data = data.copy()
 
         else:
-            data = self._array_to_dict(data, key)
+            data = self._get_column(key)
             if idx is not None:
                 data = data[idx]
             elif totim is not None:
-                try:
-                    times = self.get_times()
-                    idx = times.index(totim)
-                    data = data[idx]
-                except ValueError:
-                    err = (
-                        "Invalid totim value provided: obs.get_times() "
-                        "returns a list of valid times for totim = <>"
-                    )
-                    raise ValueError(err)
-            else:
-                pass
+                idx = self._get_time_index(totim)
+                data = data[idx]
+            data = data.tolist()
         return data
 
     def get_times(self):
         return self.get_data(key="time")
 
     def get_nrecords(self):
-        data_str = self._reader(self.Obsname)
-        return len(self._array_to_dict(data_str))
+        return len(self._load()["columns"])
 
     def get_ntimes(self):
-        return len(self.get_times())
+        return self._load()["values"].shape[0]
 
     def get_nobs(self):
-        x = self.get_data().shape
-        prod = 1
-        for i in x:
-            prod *= i
+        ntimes, ncolumns = self._load()["values"].shape
         nrecords = self.get_nrecords()
-        ntimes = self.get_ntimes()
-        nobs = prod - ntimes - nrecords
+        nobs = (ntimes + 1) * ncolumns - ntimes - nrecords
         return nobs
 
     def get_dataframe(
@@ -213,9 +249,13 @@ class Observations:
             print("this feature requires pandas")
             return None
 
-        data_str = self._reader(self.Obsname)
-        data = self._array_to_dict(data_str)
-        time = data["time"]
+        # views of the cached observation columns
+        cached = self._load()
+        data = {
+            key: cached["values"][:, icol]
+            for key, icol in cached["columns"].items()
+        }
+        time = data["time"].tolist()
 
         if start_datetime is not None:
             time = self._get_datetime(time, start_datetime, timeunit)
@@ -371,6 +411,10 @@ class Observations:
         -------
         xarray.DataArray: (NxN) dimensions are totim, header == keys*
         """
+        if key is None and idx is None and totim is None:
+            # strip time off of the cached data
+            return np.array(self._load()["values"][:, 1:])
+
         data = self.get_data(key=key, idx=idx, totim=totim)
         # create x-array coordinates from time and header
         totim = data.T[0][1:].astype(float)
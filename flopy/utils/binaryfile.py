@@ -9,6 +9,9 @@ important classes that can be accessed by the user.
 
 """
 from __future__ import print_function
+import os
+import time
+import itertools
 import numpy as np
 import warnings
 from collections import OrderedDict
@@ -272,6 +275,70 @@ def get_headfile_precision(filename):
     return result
 
 
+# version of the layout of the sidecar index cache files
+INDEX_CACHE_VERSION = 2
+
+
+def _get_index_cache_key(filename, *args):
+    """
+    Create the key that identifies a sidecar index cache for a binary file.
+    The key changes if the size or modification time of the file changes.
+
+    """
+    stat = os.stat(filename)
+    key = (INDEX_CACHE_VERSION, stat.st_size, stat.st_mtime_ns) + args
+    return repr(key)
+
+
+def _get_index_cache_path(filename):
+    """
+    Return the path of the sidecar index cache for a binary file.
+
+    """
+    return "{}.idx.npz".format(filename)
+
+
+def _load_index_cache(filename, key):
+    """
+    Load the sidecar index cache for a binary file.  None is returned if the
+    cache does not exist, cannot be read, or is stale.
+
+    """
+    fpth = _get_index_cache_path(filename)
+    if not os.path.isfile(fpth):
+        return None
+    try:
+        with np.load(fpth, allow_pickle=False) as f:
+            if str(f["key"]) != key:
+                return None
+            return {name: f[name] for name in f.files}
+    except Exception:
+        return None
+
+
+def _save_index_cache(filename, key, **arrays):
+    """
+    Save the sidecar index cache for a binary file.  A warning is issued if
+    the cache cannot be written.
+
+    """
+    fpth = _get_index_cache_path(filename)
+    tpth = fpth + ".tmp"
+    try:
+        with open(tpth, "wb") as f:
+            np.savez(f, key=np.array(key), **arrays)
+        os.replace(tpth, fpth)
+    except Exception as e:
+        # the cache is optional, remove a partially written cache file
+        if os.path.isfile(tpth):
+            try:
+                os.remove(tpth)
+            except OSError:
+                pass
+        msg = "Could not write index cache {}: {}".format(fpth, e)
+        warnings.warn(msg)
+
+
 class BinaryLayerFile(LayerFile):
     """
     The BinaryLayerFile class is the super class from which specific derived
@@ -280,6 +347,8 @@ class BinaryLayerFile(LayerFile):
     """
 
     def __init__(self, filename, precision, verbose, kwargs):
+        self._memmap = None
+        self.cache_index = kwargs.pop("cache_index", False)
         super(BinaryLayerFile, self).__init__(
             filename, precision, verbose, kwargs
         )
@@ -297,6 +366,25 @@ class BinaryLayerFile(LayerFile):
         to the position in the binary file.
 
         """
+        if self.cache_index:
+            key = _get_index_cache_key(
+                self.filename, type(self).__name__, self.text, self.precision
+            )
+            cache = _load_index_cache(self.filename, key)
+            if cache is not None:
+                self.recordarray = cache["recordarray"]
+                self.iposarray = cache["iposarray"]
+                self.times = list(cache["times"])
+                self.kstpkper = [tuple(k) for k in cache["kstpkper"]]
+                (
+                    self.nrow,
+                    self.ncol,
+                    self.nlay,
+                    self.totalbytes,
+                    self._scanpos,
+                ) = cache["dims"]
+                return
+
         header = self._get_header()
         self.nrow = header["nrow"]
         self.ncol = header["ncol"]
@@ -309,33 +397,182 @@ class BinaryLayerFile(LayerFile):
         self.file.seek(0, 2)
         self.totalbytes = self.file.tell()
         self.file.seek(0, 0)
-        ipos = 0
-        while ipos < self.totalbytes:
+        if self._index_records(0) == 0:
+            msg = "No complete {} records found in {}".format(
+                self.text.decode(), self.filename
+            )
+            raise Exception(msg)
+
+        if self.cache_index:
+            _save_index_cache(
+                self.filename,
+                key,
+                recordarray=self.recordarray,
+                iposarray=self.iposarray,
+                times=np.array(
+                    self.times, dtype=self.recordarray["totim"].dtype
+                ),
+                kstpkper=np.array(self.kstpkper, dtype=np.int32).reshape(
+                    -1, 2
+                ),
+                dims=np.array(
+                    [
+                        self.nrow,
+                        self.ncol,
+                        self.nlay,
+                        self.totalbytes,
+                        self._scanpos,
+                    ],
+                    dtype=np.int64,
+                ),
+            )
+        return
+
+    def _index_records(self, ipos):
+        """
+        Add the records from byte position ipos to the end of the file to
+        the recordarray and iposarray.  An incomplete record at the end of
+        the file, for example one that is still being written by a running
+        model, is not added.
+
+        Returns
+        -------
+        nrecords : int
+            Number of records added to the index.
+
+        """
+        hdrbytes = self.header_dtype.itemsize
+        headers = []
+        iposarray = []
+        self.file.seek(ipos, 0)
+        while ipos + hdrbytes <= self.totalbytes:
             header = self._get_header()
-            self.recordarray.append(header)
+            databytes = self.get_databytes(header)
+            if ipos + hdrbytes + databytes > self.totalbytes:
+                break
+            datapos = ipos + hdrbytes
+            ipos = int(datapos + databytes)
+            self.file.seek(ipos, 0)
             if self.text.upper() not in header["text"]:
                 continue
-            if ipos == 0:
-                self.times.append(header["totim"])
+            headers.append(header)
+            iposarray.append(datapos)
+            totim = header["totim"]
+            if len(self.times) == 0 or totim != self.times[-1]:
+                self.times.append(totim)
                 kstpkper = (header["kstp"], header["kper"])
                 self.kstpkper.append(kstpkper)
-            else:
-                totim = header["totim"]
-                if totim != self.times[-1]:
-                    self.times.append(totim)
-                    kstpkper = (header["kstp"], header["kper"])
-                    self.kstpkper.append(kstpkper)
-            ipos = self.file.tell()
-            self.iposarray.append(ipos)
-            databytes = self.get_databytes(header)
-            self.file.seek(databytes, 1)
-            ipos = self.file.tell()
+        self._scanpos = ipos
 
         # self.recordarray contains a recordarray of all the headers.
-        self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
-        self.iposarray = np.array(self.iposarray)
-        self.nlay = np.max(self.recordarray["ilay"])
-        return
+        self.recordarray = np.concatenate(
+            (
+                np.asarray(self.recordarray, dtype=self.header_dtype),
+                np.array(headers, dtype=self.header_dtype),
+            )
+        )
+        self.iposarray = np.concatenate(
+            (
+                np.asarray(self.iposarray, dtype=np.int64),
+                np.array(iposarray, dtype=np.int64),
+            )
+        )
+        if self.recordarray.shape[0] > 0:
+            self.nlay = np.max(self.recordarray["ilay"])
+        return len(headers)
+
+    def refresh(self):
+        """
+        Add records that have been written to the file since it was last
+        indexed.  Only the bytes appended to the file are read, so this
+        method can be used to follow the output of a running model.
+
+        Returns
+        -------
+        nrecords : int
+            Number of records added to the index.
+
+        Examples
+        --------
+
+        >>> import flopy.utils.binaryfile as bf
+        >>> hdobj = bf.HeadFile('model.hds')
+        >>> nrecords = hdobj.refresh()
+
+        """
+        self.file.seek(0, 2)
+        self.totalbytes = self.file.tell()
+        nrecords = self._index_records(self._scanpos)
+        if nrecords > 0:
+            self._memmap = None
+        return nrecords
+
+    def follow(self, interval=1.0, timeout=None):
+        """
+        Generator that yields the data for each time in the file, including
+        times that are written to the file by a running model after the
+        generator has been created.
+
+        Parameters
+        ----------
+        interval : float
+            Number of seconds to wait before checking the file for new
+            records. (Default is 1.)
+        timeout : float
+            Number of seconds to wait for new records before the generator
+            stops.  If None, the generator waits for new records until it is
+            closed. (Default is None.)
+
+        Yields
+        ------
+        kstpkper : tuple of ints
+            Zero-based time step and stress period (kstp, kper).
+        totim : float
+            The simulation time.
+        data : numpy array
+            Array with size (nlay, nrow, ncol).
+
+        Notes
+        -----
+        Data for a time are yielded once all of the layers for the time
+        have been written.  When the generator times out, data for the
+        last time in the file are yielded even if they are incomplete.
+
+        Examples
+        --------
+
+        >>> import flopy.utils.binaryfile as bf
+        >>> hdobj = bf.HeadFile('model.hds')
+        >>> for kstpkper, totim, head in hdobj.follow(timeout=60.):
+        ...     print(totim, head.max())
+
+        """
+        itim = 0
+        nlayrec = None
+        wait = 0.0
+        while True:
+            ntimes = len(self.times)
+            finished = timeout is not None and wait >= timeout
+            while itim < ntimes:
+                totim = self.times[itim]
+                nrec = np.count_nonzero(self.recordarray["totim"] == totim)
+                if itim < ntimes - 1:
+                    # a time is complete once the next time is written
+                    if nlayrec is None:
+                        nlayrec = nrec
+                elif not finished and (nlayrec is None or nrec < nlayrec):
+                    break
+                kstp, kper = self.kstpkper[itim]
+                data = self.get_data(totim=totim)
+                yield (kstp - 1, kper - 1), totim, data
+                itim += 1
+            if finished:
+                return
+            if self.refresh() > 0:
+                wait = 0.0
+                continue
+            time.sleep(interval)
+            wait += interval
 
     def get_databytes(self, header):
         """
@@ -404,26 +641,180 @@ class BinaryLayerFile(LayerFile):
         # Initialize result array and put times in first column
         result = self._init_result(nstation)
 
-        istat = 1
-        for k, i, j in kijlist:
-            ioffset = (i * self.ncol + j) * self.realtype(1).nbytes
-            for irec, header in enumerate(self.recordarray):
-                ilay = (
-                    header["ilay"] - 1
-                )  # change ilay from header to zero-based
-                if ilay != k:
+        kij = np.array(kijlist, dtype=np.int64).reshape(-1, 3)
+
+        # gather all of the cells at once from a regular file layout
+        if self._memmap is None:
+            self._memmap = self._build_memmap()
+        if self._memmap is not None:
+            result[:, 1:] = self._memmap[:, kij[:, 0], kij[:, 1], kij[:, 2]]
+            return result
+
+        # map each time to a row in the result array
+        itimes = {}
+        for itim, totim in enumerate(result[:, 0]):
+            itimes.setdefault(totim, itim)
+
+        # read the requested cells from each record in a single pass
+        nodes = kij[:, 1] * self.ncol + kij[:, 2]
+        data = np.memmap(self.filename, dtype=np.uint8, mode="r")
+        ilays = self.recordarray["ilay"] - 1
+        for k in np.unique(kij[:, 0]):
+            istat = np.where(kij[:, 0] == k)[0]
+            for irec in np.where(ilays == k)[0]:
+                itim = itimes.get(self.recordarray["totim"][irec])
+                if itim is None:
                     continue
                 ipos = int(self.iposarray[irec])
+                databytes = int(self.get_databytes(self.recordarray[irec]))
+                values = data[ipos : ipos + databytes].view(self.realtype)
+                result[itim, istat + 1] = values[nodes[istat]]
+        return result
 
-                # Calculate offset necessary to reach intended cell
-                self.file.seek(ipos + int(ioffset), 0)
+    def get_memmap(self):
+        """
+        Get a read-only, memory-mapped view of all of the data in the file.
+        Data are only read from disk when the view is sliced, so the view
+        can be used to access small parts of very large files.
 
-                # Find the time index and then put value into result in the
-                # correct location.
-                itim = np.where(result[:, 0] == header["totim"])[0]
-                result[itim, istat] = binaryread(self.file, self.realtype)
-            istat += 1
-        return result
+        Returns
+        ----------
+        data : numpy memmap
+            Read-only array with shape (ntimes, nlay, nrow, ncol) that is
+            backed by the binary file.
+
+        See Also
+        --------
+
+        Notes
+        -----
+        A memory-mapped view can only be created if every time in the file
+        contains a record for every layer, all records have the same size,
+        and the records are stored sequentially by time and layer.
+
+        Examples
+        --------
+
+        >>> import flopy.utils.binaryfile as bf
+        >>> hdobj = bf.HeadFile('model.hds')
+        >>> hds = hdobj.get_memmap()
+        >>> h = hds[-1, 0, 10, :]
+
+        """
+        if self._memmap is None:
+            self._memmap = self._build_memmap()
+            if self._memmap is None:
+                msg = (
+                    "{} records are not regularly spaced and ".format(
+                        self.filename
+                    )
+                    + "cannot be memory-mapped"
+                )
+                raise Exception(msg)
+        return self._memmap
+
+    def _build_memmap(self):
+        """
+        Build a strided (ntimes, nlay, nrow, ncol) view of the file from the
+        header index.  None is returned if the file layout is not regular.
+
+        """
+        nrec = self.recordarray.shape[0]
+        ntimes = len(self.times)
+        nlay = int(self.nlay)
+        if nrec == 0 or nrec != ntimes * nlay:
+            return None
+
+        header = self.recordarray[0]
+        nrow = int(header["nrow"])
+        ncol = int(header["ncol"])
+        if (
+            np.any(self.recordarray["nrow"] != nrow)
+            or np.any(self.recordarray["ncol"] != ncol)
+            or np.any(self.recordarray["text"] != header["text"])
+        ):
+            return None
+
+        # records must be stored by time and then by layer
+        ilay = np.tile(np.arange(1, nlay + 1), ntimes)
+        if not np.array_equal(self.recordarray["ilay"], ilay):
+            return None
+
+        # every record must be a header followed by a layer of data
+        hdrbytes = self.header_dtype.itemsize
+        recbytes = hdrbytes + int(self.get_databytes(header))
+        ipos = hdrbytes + np.arange(nrec, dtype=np.int64) * recbytes
+        if (
+            not np.array_equal(self.iposarray, ipos)
+            or nrec * recbytes > self.totalbytes
+        ):
+            return None
+
+        dtype = np.dtype(
+            [
+                ("header", self.header_dtype),
+                ("data", self.realtype, (nrow, ncol)),
+            ]
+        )
+        records = np.memmap(
+            self.filename, dtype=dtype, mode="r", shape=(nrec,)
+        )
+        return records["data"].reshape((ntimes, nlay, nrow, ncol))
+
+    def get_alldata(self, mflay=None, nodata=-9999):
+        """
+        Get all of the data from the file.
+
+        Parameters
+        ----------
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included. (Default is None.)
+
+        nodata : float
+           The nodata value in the data array.  All array values that have the
+           nodata value will be assigned np.nan.
+
+        Returns
+        ----------
+        data : numpy array
+            Array has size (ntimes, nlay, nrow, ncol) if mflay is None or it
+            has size (ntimes, nrow, ncol) if mlay is specified.
+
+        See Also
+        --------
+
+        Notes
+        -----
+        Data are copied directly from a memory-mapped view of the file if
+        the file layout is regular (see get_memmap).
+
+        Examples
+        --------
+
+        """
+        if self._memmap is None:
+            self._memmap = self._build_memmap()
+        if self._memmap is None:
+            return super(BinaryLayerFile, self).get_alldata(
+                mflay=mflay, nodata=nodata
+            )
+
+        if mflay is None:
+            rv = np.array(self._memmap)
+        else:
+            rv = np.array(self._memmap[:, mflay])
+        rv[rv == nodata] = np.nan
+        return rv
+
+    def close(self):
+        """
+        Close the file handle and release the memory-mapped view.
+
+        """
+        self._memmap = None
+        super(BinaryLayerFile, self).close()
+        return
 
 
 class HeadFile(BinaryLayerFile):
@@ -440,6 +831,10 @@ class HeadFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    cache_index : bool
+        Save the record index to a sidecar file (filename + '.idx.npz') and
+        reuse it when the file is opened again.  The index is rebuilt if the
+        size or modification time of the file has changed.  Default is False.
 
     Attributes
     ----------
@@ -510,6 +905,10 @@ class UcnFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    cache_index : bool
+        Save the record index to a sidecar file (filename + '.idx.npz') and
+        reuse it when the file is opened again.  The index is rebuilt if the
+        size or modification time of the file has changed.  Default is False.
 
     Attributes
     ----------
@@ -582,6 +981,10 @@ class CellBudgetFile(object):
         'single' or 'double'.  Default is 'single'.
     verbose : bool
         Write information to the screen.  Default is False.
+    cache_index : bool
+        Save the record index to a sidecar file (filename + '.idx.npz') and
+        reuse it when the file is opened again.  The index is rebuilt if the
+        size or modification time of the file has changed.  Default is False.
 
     Attributes
     ----------
@@ -663,14 +1066,31 @@ class CellBudgetFile(object):
                 )
         if "modelgrid" in kwargs.keys():
             self.modelgrid = kwargs.pop("modelgrid")
+        self.cache_index = kwargs.pop("cache_index", False)
         if len(kwargs.keys()) > 0:
             args = ",".join(kwargs.keys())
             raise Exception("LayerFile error: unrecognized kwargs: " + args)
 
+        self._index_cache = None
+        if self.cache_index:
+            self._index_cache = _load_index_cache(
+                self.filename,
+                _get_index_cache_key(self.filename, type(self).__name__),
+            )
+
         if precision == "auto":
-            success = self._set_precision("single")
-            if not success:
-                success = self._set_precision("double")
+            precisions = ["single", "double"]
+            if self._index_cache is not None:
+                # try the precision of the cached index first
+                if str(self._index_cache["precision"]) == "double":
+                    precisions.reverse()
+            # incomplete records at the end of the file are only accepted
+            # if neither precision can read all of the records
+            success = False
+            for strict, prec in itertools.product((True, False), precisions):
+                success = self._set_precision(prec, strict=strict)
+                if success:
+                    break
             if not success:
                 s = "Budget precision could not be auto determined"
                 raise BudgetIndexError(s)
@@ -710,7 +1130,7 @@ class CellBudgetFile(object):
         self.paknamlist = []
         self.nrecords = 0
 
-    def _set_precision(self, precision="single"):
+    def _set_precision(self, precision="single", strict=False):
         """
         Method to set the budget precsion from a CBC file. Enables
         Auto precision code to work
@@ -719,6 +1139,9 @@ class CellBudgetFile(object):
         ----------
         precision : str
             budget file precision (accepts 'single' or 'double')
+        strict : bool
+            If True, an incomplete record at the end of the file is
+            treated as a precision error.
         """
         success = True
         h1dt = [
@@ -759,7 +1182,7 @@ class CellBudgetFile(object):
         self.header_dtype = np.dtype(hdt)
 
         try:
-            self._build_index()
+            self._build_index(strict=strict)
         except BudgetIndexError:
             success = False
             self.__reset()
@@ -787,14 +1210,41 @@ class CellBudgetFile(object):
         kstp_len = sum(kstp_len[: kstp + 1])
         return kper_len + kstp_len
 
-    def _build_index(self):
+    def _build_index(self, strict=False):
         """
-        Build the ordered dictionary, which maps the header information
+        Build the recordarray and iposarray, which maps the header information
         to the position in the binary file.
+
+        Parameters
+        ----------
+        strict : bool
+            If True, raise a BudgetIndexError if the last record in the file
+            is incomplete.  Otherwise the incomplete record is not indexed.
         """
-        asciiset = " "
-        for i in range(33, 127):
-            asciiset += chr(i)
+        if self.realtype == np.float64:
+            precision = "double"
+        else:
+            precision = "single"
+        cache = self._index_cache
+        if cache is not None and str(cache["precision"]) == precision:
+            self.recordarray = cache["recordarray"]
+            self.iposheader = cache["iposheader"]
+            self.iposarray = cache["iposarray"]
+            self.times = list(cache["times"])
+            self.kstpkper = [tuple(k) for k in cache["kstpkper"]]
+            self.textlist = list(cache["textlist"])
+            self.imethlist = list(cache["imethlist"])
+            self.paknamlist = list(cache["paknamlist"])
+            (
+                self.nrow,
+                self.ncol,
+                self.nlay,
+                self.nper,
+                self.nrecords,
+                self.totalbytes,
+                self._scanpos,
+            ) = cache["dims"]
+            return
 
         header = self._get_header()
         self.nrow = header["nrow"]
@@ -808,24 +1258,79 @@ class CellBudgetFile(object):
         self.file.seek(0, 2)
         self.totalbytes = self.file.tell()
         self.file.seek(0, 0)
-        self.recorddict = OrderedDict()
-        ipos = 0
+        self._index_records(0, strict=strict)
+
+        if self.cache_index:
+            _save_index_cache(
+                self.filename,
+                _get_index_cache_key(self.filename, type(self).__name__),
+                precision=np.array(precision),
+                recordarray=self.recordarray,
+                iposheader=self.iposheader,
+                iposarray=self.iposarray,
+                times=np.array(
+                    self.times, dtype=self.recordarray["totim"].dtype
+                ),
+                kstpkper=np.array(self.kstpkper, dtype=np.int32).reshape(
+                    -1, 2
+                ),
+                textlist=np.array(self.textlist, dtype="S16"),
+                imethlist=np.array(self.imethlist, dtype=np.int32),
+                paknamlist=np.array(self.paknamlist, dtype="S16"),
+                dims=np.array(
+                    [
+                        self.nrow,
+                        self.ncol,
+                        self.nlay,
+                        self.nper,
+                        self.nrecords,
+                        self.totalbytes,
+                        self._scanpos,
+                    ],
+                    dtype=np.int64,
+                ),
+            )
+        return
+
+    def _index_records(self, ipos, strict=False):
+        """
+        Add the records from byte position ipos to the end of the file to
+        the recordarray, iposheader and iposarray.  An incomplete record at
+        the end of the file, for example one that is still being written by
+        a running model, is not added unless strict is True, in which case a
+        BudgetIndexError is raised.
+
+        Returns
+        -------
+        nrecords : int
+            Number of records added to the index.
+
+        """
+        asciiset = " "
+        for i in range(33, 127):
+            asciiset += chr(i)
+
+        # sets of the unique values in the ordered lists for fast lookup
+        times = set(self.times)
+        kstpkpers = set(self.kstpkper)
+        texts = set(self.textlist)
+        paknams = set(self.paknamlist)
+        totims = {}
+
+        headers = []
+        iposheader = []
+        iposarray = []
+        self.file.seek(ipos, 0)
         while ipos < self.totalbytes:
-            self.iposheader.append(ipos)
-            header = self._get_header()
-            self.nrecords += 1
-            totim = header["totim"]
-            if totim == 0:
-                totim = self._totim_from_kstpkper(
-                    (header["kstp"] - 1, header["kper"] - 1)
-                )
-                header["totim"] = totim
-            if totim >= 0 and totim not in self.times:
-                self.times.append(totim)
-            kstpkper = (header["kstp"], header["kper"])
-            if kstpkper not in self.kstpkper:
-                self.kstpkper.append(kstpkper)
-            if header["text"] not in self.textlist:
+            try:
+                header = self._get_header()
+            except BudgetIndexError:
+                if strict:
+                    raise
+                break
+            datapos = self.file.tell()
+
+            if header["text"] not in texts:
                 # check the precision of the file using text records
                 try:
                     tlist = [header["text"], header["modelnam"]]
@@ -838,11 +1343,41 @@ class CellBudgetFile(object):
 
                 except:
                     raise BudgetIndexError("Improper precision")
+
+            # skip over the data to the next record
+            try:
+                self._skip_record(header)
+            except BudgetIndexError:
+                if strict:
+                    raise
+                break
+            if self.file.tell() > self.totalbytes:
+                if strict:
+                    raise BudgetIndexError("Incomplete record")
+                break
+
+            totim = header["totim"]
+            kstpkper = (header["kstp"], header["kper"])
+            if totim == 0:
+                if kstpkper not in totims:
+                    totims[kstpkper] = self._totim_from_kstpkper(
+                        (kstpkper[0] - 1, kstpkper[1] - 1)
+                    )
+                totim = totims[kstpkper]
+                header["totim"] = totim
+            if totim >= 0 and totim not in times:
+                times.add(totim)
+                self.times.append(totim)
+            if kstpkper not in kstpkpers:
+                kstpkpers.add(kstpkper)
+                self.kstpkper.append(kstpkper)
+            if header["text"] not in texts:
+                texts.add(header["text"])
                 self.textlist.append(header["text"])
                 self.imethlist.append(header["imeth"])
-            if header["paknam"] not in self.paknamlist:
+            if header["paknam"] not in paknams:
+                paknams.add(header["paknam"])
                 self.paknamlist.append(header["paknam"])
-            ipos = self.file.tell()
 
             if self.verbose:
                 for itxt in [
@@ -865,7 +1400,7 @@ class CellBudgetFile(object):
                     if isinstance(s, bytes):
                         s = s.decode()
                     print(itxt + ": " + str(s))
-                print("file position: ", ipos)
+                print("file position: ", datapos)
                 if (
                     int(header["imeth"]) != 5
                     and int(header["imeth"]) != 6
@@ -874,24 +1409,120 @@ class CellBudgetFile(object):
                     print("")
 
             # store record and byte position mapping
-            self.recorddict[
-                tuple(header)
-            ] = ipos  # store the position right after header2
-            self.recordarray.append(header)
-            self.iposarray.append(
-                ipos
-            )  # store the position right after header2
-
-            # skip over the data to the next record and set ipos
-            self._skip_record(header)
+            headers.append(header)
+            iposheader.append(ipos)
+            iposarray.append(datapos)  # store the position right after header2
             ipos = self.file.tell()
+        self._scanpos = ipos
+        self.nrecords += len(headers)
 
         # convert to numpy arrays
-        self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
-        self.iposheader = np.array(self.iposheader, dtype=np.int64)
-        self.iposarray = np.array(self.iposarray, dtype=np.int64)
-        self.nper = self.recordarray["kper"].max()
-        return
+        self.recordarray = np.concatenate(
+            (
+                np.asarray(self.recordarray, dtype=self.header_dtype),
+                np.array(headers, dtype=self.header_dtype),
+            )
+        )
+        self.iposheader = np.concatenate(
+            (
+                np.asarray(self.iposheader, dtype=np.int64),
+                np.array(iposheader, dtype=np.int64),
+            )
+        )
+        self.iposarray = np.concatenate(
+            (
+                np.asarray(self.iposarray, dtype=np.int64),
+                np.array(iposarray, dtype=np.int64),
+            )
+        )
+        if self.recordarray.shape[0] > 0:
+            self.nper = self.recordarray["kper"].max()
+        return len(headers)
+
+    def refresh(self):
+        """
+        Add records that have been written to the file since it was last
+        indexed.  Only the bytes appended to the file are read, so this
+        method can be used to follow the output of a running model.
+
+        Returns
+        -------
+        nrecords : int
+            Number of records added to the index.
+
+        Examples
+        --------
+
+        >>> import flopy.utils.binaryfile as bf
+        >>> cbb = bf.CellBudgetFile('mymodel.cbb')
+        >>> nrecords = cbb.refresh()
+
+        """
+        self.file.seek(0, 2)
+        self.totalbytes = self.file.tell()
+        return self._index_records(self._scanpos)
+
+    def follow(self, text=None, full3D=False, interval=1.0, timeout=None):
+        """
+        Generator that yields each record in the file, including records
+        that are written to the file by a running model after the generator
+        has been created.
+
+        Parameters
+        ----------
+        text : str
+            The text identifier for the records to return.  Examples include
+            'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.  If None,
+            all records are returned. (Default is None.)
+        full3D : boolean
+            If true, then return the record as a three dimensional numpy
+            array, even for those list-style records written as part of a
+            'COMPACT BUDGET' MODFLOW budget file.  (Default is False.)
+        interval : float
+            Number of seconds to wait before checking the file for new
+            records. (Default is 1.)
+        timeout : float
+            Number of seconds to wait for new records before the generator
+            stops.  If None, the generator waits for new records until it is
+            closed. (Default is None.)
+
+        Yields
+        ------
+        kstpkper : tuple of ints
+            Zero-based time step and stress period (kstp, kper).
+        totim : float
+            The simulation time.
+        data : a single data record
+            The record, as returned by get_record.
+
+        Examples
+        --------
+
+        >>> import flopy.utils.binaryfile as bf
+        >>> cbb = bf.CellBudgetFile('mymodel.cbb')
+        >>> for kstpkper, totim, q in cbb.follow('RIVER LEAKAGE', timeout=60.):
+        ...     print(totim, q['q'].sum())
+
+        """
+        if isinstance(text, bytes):
+            text = text.decode()
+        idx = 0
+        wait = 0.0
+        while True:
+            while idx < self.recordarray.shape[0]:
+                header = self.recordarray[idx]
+                if text is None or text.upper() in header["text"].decode():
+                    kstpkper = (header["kstp"] - 1, header["kper"] - 1)
+                    data = self.get_record(idx, full3D=full3D)
+                    yield kstpkper, header["totim"], data
+                idx += 1
+            if self.refresh() > 0:
+                wait = 0.0
+                continue
+            if timeout is not None and wait >= timeout:
+                return
+            time.sleep(interval)
+            wait += interval
 
     def _skip_record(self, header):
         """
@@ -907,7 +1538,7 @@ class CellBudgetFile(object):
         elif imeth == 1:
             nbytes = nrow * ncol * nlay * self.realtype(1).nbytes
         elif imeth == 2:
-            nlist = binaryread(self.file, np.int32)[0]
+            nlist = self._read_int()
             nbytes = nlist * (np.int32(1).nbytes + self.realtype(1).nbytes)
         elif imeth == 3:
             nbytes = nrow * ncol * self.realtype(1).nbytes
@@ -915,12 +1546,12 @@ class CellBudgetFile(object):
         elif imeth == 4:
             nbytes = nrow * ncol * self.realtype(1).nbytes
         elif imeth == 5:
-            nauxp1 = binaryread(self.file, np.int32)[0]
+            nauxp1 = self._read_int()
             naux = nauxp1 - 1
 
-            for i in range(naux):
-                temp = binaryread(self.file, str, charlen=16)
-            nlist = binaryread(self.file, np.int32)[0]
+            # skip the auxiliary variable names
+            self.file.seek(naux * 16, 1)
+            nlist = self._read_int()
             if self.verbose:
                 print("naux: ", naux)
                 print("nlist: ", nlist)
@@ -932,12 +1563,12 @@ class CellBudgetFile(object):
             )
         elif imeth == 6:
             # read rest of list data
-            nauxp1 = binaryread(self.file, np.int32)[0]
+            nauxp1 = self._read_int()
             naux = nauxp1 - 1
 
-            for i in range(naux):
-                temp = binaryread(self.file, str, charlen=16)
-            nlist = binaryread(self.file, np.int32)[0]
+            # skip the auxiliary variable names
+            self.file.seek(naux * 16, 1)
+            nlist = self._read_int()
             if self.verbose:
                 print("naux: ", naux)
                 print("nlist: ", nlist)
@@ -953,32 +1584,63 @@ class CellBudgetFile(object):
             self.file.seek(nbytes, 1)
         return
 
+    @property
+    def recorddict(self):
+        """
+        Get the byte position right after header2 of each record, keyed on
+        the tuple of the record header.
+
+        Returns
+        -------
+        recorddict : OrderedDict
+
+        """
+        return OrderedDict(
+            (tuple(header), int(ipos))
+            for header, ipos in zip(self.recordarray, self.iposarray)
+        )
+
+    def _read_int(self):
+        """
+        Read a single integer using the buffered file object.
+
+        """
+        buf = self.file.read(4)
+        if len(buf) < 4:
+            raise BudgetIndexError("Incomplete record")
+        return int(np.frombuffer(buf, np.int32)[0])
+
     def _get_header(self):
         """
         Read the file header
 
         """
-        header1 = binaryread(self.file, self.header1_dtype, (1,))
-        nlay = header1["nlay"]
+        # headers are read through the buffered file object, which is much
+        # faster than many small numpy reads when indexing large files
+        nbytes = self.header1_dtype.itemsize
+        buf = self.file.read(nbytes)
+        if len(buf) < nbytes:
+            raise BudgetIndexError("Incomplete header")
+        header1 = np.frombuffer(buf, self.header1_dtype)[0].item()
+        nlay = header1[-1]
         if nlay < 0:
             # fill header2 by first reading imeth, delt, pertim and totim
             # and then adding modelnames and paknames if imeth = 6
-            temp = binaryread(self.file, self.header2_dtype0, (1,))
-            header2 = np.array(
-                [(0, 0.0, 0.0, 0.0, "", "", "", "")], dtype=self.header2_dtype
-            )
-            for name in temp.dtype.names:
-                header2[name] = temp[name]
-            if int(header2["imeth"]) == 6:
-                header2["modelnam"] = binaryread(self.file, str, charlen=16)
-                header2["paknam"] = binaryread(self.file, str, charlen=16)
-                header2["modelnam2"] = binaryread(self.file, str, charlen=16)
-                header2["paknam2"] = binaryread(self.file, str, charlen=16)
+            nbytes = self.header2_dtype0.itemsize
+            buf = self.file.read(nbytes)
+            if len(buf) < nbytes:
+                raise BudgetIndexError("Incomplete header")
+            header2 = np.frombuffer(buf, self.header2_dtype0)[0].item()
+            if header2[0] == 6:
+                buf = self.file.read(64)
+                if len(buf) < 64:
+                    raise BudgetIndexError("Incomplete header")
+                header2 += (buf[0:16], buf[16:32], buf[32:48], buf[48:64])
+            else:
+                header2 += (b"", b"", b"", b"")
         else:
-            header2 = np.array(
-                [(0, 0.0, 0.0, 0.0, "", "", "", "")], dtype=self.header2_dtype
-            )
-        fullheader = join_struct_arrays([header1, header2])
+            header2 = (0, 0.0, 0.0, 0.0, b"", b"", b"", b"")
+        fullheader = np.array([header1 + header2], dtype=self.header_dtype)
         return fullheader[0]
 
     def _find_text(self, text):
@@ -1333,7 +1995,7 @@ class CellBudgetFile(object):
 
         return recordlist
 
-    def get_ts(self, idx, text=None, times=None):
+    def get_ts(self, idx, text=None, times=None, max_workers=None):
         """
         Get a time series from the binary budget file.
 
@@ -1348,6 +2010,10 @@ class CellBudgetFile(object):
             'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.
         times : iterable of floats
             List of times to from which to get time series.
+        max_workers : int
+            Number of threads used to read the budget records.  Each thread
+            reads a contiguous block of time steps using its own file
+            handle.  (Default is None, which reads the records serially.)
 
         Returns
         ----------
@@ -1364,6 +2030,12 @@ class CellBudgetFile(object):
         The layer, row, and column values must be zero-based, and must be
         within the following ranges: 0 <= k < nlay; 0 <= i < nrow; 0 <= j < ncol
 
+        Only the values for the requested cells are read from each record.
+        Cells that are not in a list-style record are set to nan, which is
+        the value the masked cells of the full 3D array were converted to
+        in earlier versions. Values of cells that occur more than once in a
+        list-style record are summed in the precision of the file.
+
         Examples
         --------
 
@@ -1401,49 +2073,164 @@ class CellBudgetFile(object):
         for idx, t in enumerate(timesint):
             result[idx, 0] = t
 
-        for itim, k in enumerate(kk):
-            try:
-                v = self.get_data(kstpkper=k, text=text, full3D=True)
-                # skip missing data - required for storage
-                if len(v) > 0:
-                    v = v[0]
-                    istat = 1
-                    for k, i, j in kijlist:
-                        result[itim, istat] = v[k, i, j].copy()
-                        istat += 1
-            except ValueError:
-                v = self.get_data(kstpkper=k, text=text)
-                # skip missing data - required for storage
-                if len(v) > 0:
-                    if self.modelgrid is None:
-                        s = (
-                            "A modelgrid instance must be provided during "
-                            "instantiation to get IMETH=6 timeseries data"
+        # group the records with the requested text by time step
+        text16 = self._find_text(text)
+        itimes = {}
+        for itim, (kstp, kper) in enumerate(self.kstpkper):
+            itimes[(int(kstp), int(kper))] = itim
+        records = {}
+        irecs = np.where(self.recordarray["text"] == text16)[0]
+        for irec, kstp, kper in zip(
+            irecs,
+            self.recordarray["kstp"][irecs].tolist(),
+            self.recordarray["kper"][irecs].tolist(),
+        ):
+            records.setdefault(itimes[(kstp, kper)], []).append(irec)
+
+        # only the first record for each time step is used unless the
+        # records are imeth 6 lists, which can be split across packages
+        bulk, other = [], []
+        for itim, irecs in records.items():
+            imeth = self.recordarray["imeth"][irecs[0]]
+            if imeth != 6:
+                records[itim] = irecs[:1]
+            if imeth in (0, 1, 2, 5, 6):
+                bulk.append(itim)
+            else:
+                other.append(itim)
+
+        kij = np.array(kijlist, dtype=np.int64).reshape(-1, 3)
+        node6 = None
+        if any(
+            self.recordarray["imeth"][records[itim][0]] == 6 for itim in bulk
+        ):
+            if self.modelgrid is None:
+                s = (
+                    "A modelgrid instance must be provided during "
+                    "instantiation to get IMETH=6 timeseries data"
+                )
+                raise AssertionError(s)
+            if self.modelgrid.grid_type == "structured":
+                node6 = (
+                    kij[:, 0] * self.modelgrid.nrow + kij[:, 1]
+                ) * self.modelgrid.ncol + kij[:, 2]
+            else:
+                node6 = kij[:, 0] * self.modelgrid.ncpl + kij[:, 2]
+
+        if max_workers is None or max_workers < 2 or len(bulk) < 2:
+            for itim in bulk:
+                self._read_ts_records(
+                    self.file, records[itim], kij, node6, result[itim, 1:]
+                )
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            # each thread reads a contiguous block of time steps with its
+            # own file handle, so the reads stay mostly sequential
+            def read_block(itims):
+                with open(self.filename, "rb") as f:
+                    for itim in itims:
+                        self._read_ts_records(
+                            f, records[itim], kij, node6, result[itim, 1:]
                         )
-                        raise AssertionError(s)
-
-                    if self.modelgrid.grid_type == "structured":
-                        ndx = [
-                            lrc[0]
-                            * (self.modelgrid.nrow * self.modelgrid.ncol)
-                            + lrc[1] * self.modelgrid.ncol
-                            + (lrc[2] + 1)
-                            for lrc in kijlist
-                        ]
-                    else:
-                        ndx = [
-                            lrc[0] * self.modelgrid.ncpl + (lrc[-1] + 1)
-                            for lrc in kijlist
-                        ]
-
-                    for vv in v:
-                        field = vv.dtype.names[2]
-                        dix = np.where(np.isin(vv["node"], ndx))[0]
-                        if len(dix) > 0:
-                            result[itim, 1:] = vv[field][dix]
+
+            blocks = np.array_split(np.array(bulk), max_workers)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(read_block, block)
+                    for block in blocks
+                    if len(block) > 0
+                ]
+                for future in futures:
+                    future.result()
+
+        # remaining record types are read as full 3D arrays
+        for itim in other:
+            v = self.get_record(records[itim][0], full3D=True)
+            v = v[kij[:, 0], kij[:, 1], kij[:, 2]].astype(self.realtype)
+            result[itim, 1:] = np.ma.filled(v, np.nan)
 
         return result
 
+    def _read_ts_records(self, f, irecs, kij, node6, values):
+        """
+        Read the values of the kij cells from one or more budget records
+        with imeth 0, 1, 2, 5, or 6 and store them in values.
+
+        """
+        itemsize = np.dtype(self.realtype).itemsize
+        for irec in irecs:
+            header = self.recordarray[irec]
+            imeth = header["imeth"]
+            nrow = int(header["nrow"])
+            ncol = int(header["ncol"])
+            nodes = (kij[:, 0] * nrow + kij[:, 1]) * ncol + kij[:, 2]
+            f.seek(int(self.iposarray[irec]), 0)
+
+            # full arrays - only read the span that contains the cells
+            if imeth in (0, 1):
+                nlay = abs(int(header["nlay"]))
+                if np.any(kij >= (nlay, nrow, ncol)):
+                    errmsg = (
+                        "Invalid cell index. Cells must be within the "
+                        "shape of the {} record: {}".format(
+                            header["text"].decode().strip(),
+                            (nlay, nrow, ncol),
+                        )
+                    )
+                    raise IndexError(errmsg)
+                n0 = int(nodes.min())
+                count = int(nodes.max()) - n0 + 1
+                f.seek(n0 * itemsize, 1)
+                data = self._read_ts_array(f, self.realtype, count)
+                values[:] = data[nodes - n0]
+                continue
+
+            # list data
+            naux = 0
+            if imeth in (5, 6):
+                naux = self._read_ts_array(f, np.int32, 1)[0] - 1
+                f.seek(naux * 16, 1)
+            fields = [("node", np.int32)]
+            if imeth == 6:
+                fields.append(("node2", np.int32))
+                nodes = node6
+            fields.append(("q", self.realtype))
+            for i in range(naux):
+                fields.append(("aux{}".format(i), self.realtype))
+            nlist = self._read_ts_array(f, np.int32, 1)[0]
+            data = self._read_ts_array(f, np.dtype(fields), nlist)
+
+            # match the list nodes to the cells
+            unodes, inv = np.unique(nodes, return_inverse=True)
+            dnodes = data["node"].astype(np.int64) - 1
+            loc = np.searchsorted(unodes, dnodes)
+            loc[loc == unodes.size] = 0
+            hit = unodes[loc] == dnodes
+            loc = loc[hit]
+            found = np.zeros(unodes.size, dtype=bool)
+            found[loc] = True
+            if imeth == 6:
+                # later entries replace earlier entries
+                uvalues = np.zeros(unodes.size, dtype=self.realtype)
+                uvalues[loc] = data["q"][hit]
+                mask = found[inv]
+                values[mask] = uvalues[inv][mask]
+            else:
+                # duplicate nodes are summed, as in create3D
+                uvalues = np.zeros(unodes.size, dtype=self.realtype)
+                np.add.at(uvalues, loc, data["q"][hit])
+                values[:] = np.where(found, uvalues, np.nan)[inv]
+
+    @staticmethod
+    def _read_ts_array(f, dtype, count):
+        dtype = np.dtype(dtype)
+        nbytes = int(count) * dtype.itemsize
+        b = f.read(nbytes)
+        if len(b) < nbytes:
+            raise BudgetIndexError("Incomplete record")
+        return np.frombuffer(b, dtype, int(count))
+
     def _build_kijlist(self, idx):
         if isinstance(idx, list):
             kijlist = idx
@@ -1831,6 +2618,10 @@ class HeadUFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    cache_index : bool
+        Save the record index to a sidecar file (filename + '.idx.npz') and
+        reuse it when the file is opened again.  The index is rebuilt if the
+        size or modification time of the file has changed.  Default is False.
 
     Attributes
     ----------
@@ -1975,3 +2766,7 @@ class HeadUFile(BinaryLayerFile):
         """
         msg = "HeadUFile: get_ts() is not implemented"
         raise NotImplementedError(msg)
+
+    def _build_memmap(self):
+        # layers in unstructured head files can have different sizes
+        return None
@@ -129,13 +129,16 @@ class GridIntersect:
             self.method = method
         self.rtree = rtree
 
+        # grid cell polygons, built once and reused for every intersection
+        self._gridshape_list = None
+
         if self.method == "vertex":
             # set method to get gridshapes depending on grid type
             self._set_method_get_gridshapes()
 
             # build STR-tree if specified
             if self.rtree:
-                self.strtree = STRtree(self._get_gridshapes())
+                self.strtree = STRtree(self._get_gridshape_list())
 
         elif self.method == "structured" and mfgrid.grid_type == "structured":
             pass
@@ -207,6 +210,85 @@ class GridIntersect:
 
         return rec
 
+    def intersect_batch(self, shapes, processes=None, **kwargs):
+        """
+        Method to intersect many shapes with a model grid and combine the
+        results in a single record array.
+
+        Parameters
+        ----------
+        shapes : iterable
+            shapes to intersect. Each shape can be a shapely.geometry,
+            geojson object, shapefile.Shape, or flopy geometry object. All
+            shapes must result in the same type of intersection (points,
+            linestrings or polygons).
+        processes : int, optional
+            number of worker processes. Default is None, which intersects
+            the shapes in this process. Each worker process builds its own
+            copy of the grid shapes and STR-tree once. On platforms that
+            spawn new processes (e.g. Windows) this method must be called
+            from within an ``if __name__ == "__main__":`` block.
+        sort_by_cellid : bool
+            Sort results by cellid
+        keepzerolengths : bool
+            boolean method to keep zero length intersections for
+            linestring intersection
+
+        Returns
+        -------
+        numpy.recarray
+            a record array containing information about the intersections.
+            The shpids field contains the zero-based position of the shape
+            in shapes for each intersection.
+        """
+        shps = [GeoSpatialUtil(shp).shapely for shp in shapes]
+
+        if processes is None or processes < 2 or len(shps) < 2:
+            recs = [self.intersect(shp, **kwargs) for shp in shps]
+        else:
+            import multiprocessing
+
+            # contiguous chunks of shapes, several per worker process
+            nchunk = min(len(shps), 4 * processes)
+            bounds = np.linspace(0, len(shps), nchunk + 1).astype(int)
+            chunks = [
+                (shps[i0:i1], kwargs) for i0, i1 in zip(bounds, bounds[1:])
+            ]
+            pool = multiprocessing.Pool(
+                processes,
+                initializer=_init_batch_worker,
+                initargs=(self.mfgrid, self.method, self.rtree),
+            )
+            try:
+                recs = []
+                for chunk_recs in pool.map(_intersect_batch_chunk, chunks):
+                    recs.extend(chunk_recs)
+            finally:
+                pool.close()
+                pool.join()
+
+        # combine the results of all shapes
+        if len(recs) == 0:
+            return np.recarray(
+                0, names=["shpids", "cellids"], formats=["i8", "O"]
+            )
+        names = list(recs[0].dtype.names)
+        for rec in recs[1:]:
+            if list(rec.dtype.names) != names:
+                raise TypeError(
+                    "All shapes in a batch must result in the "
+                    "same type of intersection"
+                )
+        nrec = [len(rec) for rec in recs]
+        formats = ["i8"] + [recs[0].dtype[name] for name in names]
+        batch = np.recarray(
+            sum(nrec), names=["shpids"] + names, formats=formats
+        )
+        batch.shpids = np.repeat(np.arange(len(recs)), nrec)
+        for name in names:
+            batch[name] = np.concatenate([rec[name] for rec in recs])
+        return batch
+
     def _set_method_get_gridshapes(self):
         """internal method, set self._get_gridshapes to the certain method for
         obtaining gridcells."""
@@ -324,6 +406,19 @@ class GridIntersect:
         """
         return list(self._vtx_grid_to_shape_generator())
 
+    def _get_gridshape_list(self):
+        """internal method, list of shapely polygons for the grid cells. The
+        list is only built once.
+
+        Returns
+        -------
+        list :
+            list of shapely Polygons
+        """
+        if self._gridshape_list is None:
+            self._gridshape_list = list(self._get_gridshapes())
+        return self._gridshape_list
+
     def query_grid(self, shp):
         """Perform spatial query on grid with shapely geometry. If no spatial
         query is possible returns all grid cells.
@@ -342,7 +437,7 @@ class GridIntersect:
             result = self.strtree.query(shp)
         else:
             # no spatial query
-            result = self._get_gridshapes()
+            result = self._get_gridshape_list()
         return result
 
     @staticmethod
@@ -1251,6 +1346,7 @@ class GridIntersect:
         rectangle = ((minx, miny), (maxx, maxy))
         nodes = self._intersect_rectangle_structured(rectangle)
 
+        Xe, Ye = self.mfgrid.xyedges
         for (i, j) in nodes:
             if (
                 self.mfgrid.angrot != 0.0
@@ -1258,13 +1354,10 @@ class GridIntersect:
                 or self.mfgrid.yoffset != 0.0
             ):
                 cell_coords = [
-                    (self.mfgrid.xyedges[0][j], self.mfgrid.xyedges[1][i]),
-                    (self.mfgrid.xyedges[0][j + 1], self.mfgrid.xyedges[1][i]),
-                    (
-                        self.mfgrid.xyedges[0][j + 1],
-                        self.mfgrid.xyedges[1][i + 1],
-                    ),
-                    (self.mfgrid.xyedges[0][j], self.mfgrid.xyedges[1][i + 1]),
+                    (Xe[j], Ye[i]),
+                    (Xe[j + 1], Ye[i]),
+                    (Xe[j + 1], Ye[i + 1]),
+                    (Xe[j], Ye[i + 1]),
                 ]
             else:
                 cell_coords = self.mfgrid.get_cell_vertices(i, j)
@@ -1523,6 +1616,24 @@ class GridIntersect:
         return ax
 
 
+# per-process GridIntersect used by GridIntersect.intersect_batch
+_batch_gridintersect = None
+
+
+def _init_batch_worker(mfgrid, method, rtree):
+    """Build the GridIntersect object (grid shapes and STR-tree) once for
+    each worker process of GridIntersect.intersect_batch."""
+    global _batch_gridintersect
+    _batch_gridintersect = GridIntersect(mfgrid, method=method, rtree=rtree)
+
+
+def _intersect_batch_chunk(args):
+    """Intersect a chunk of shapes in a worker process of
+    GridIntersect.intersect_batch."""
+    shps, kwargs = args
+    return [_batch_gridintersect.intersect(shp, **kwargs) for shp in shps]
+
+
 class ModflowGridIndices:
     """Collection of methods that can be used to find cell indices for a
     structured, but irregularly spaced MODFLOW grid."""
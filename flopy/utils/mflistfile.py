@@ -6,6 +6,7 @@ recarrays, which can then be easily plotted.
 """
 
 import collections
+import mmap
 import os
 import re
 from datetime import timedelta
@@ -660,43 +661,56 @@ class ListBudget(object):
         return
 
     def _get_index(self, maxentries):
-        # --parse through the file looking for matches and parsing ts and sp
+        # --search the memory-mapped file for the budget key and parse ts
+        #   and sp; lines between budget tables are never decoded
         idxs = []
-        l_count = 1
+        if self._mm is None:
+            return idxs
+        mm = self._mm
+        key = self.budgetkey.encode("ascii")
+        pos = 0
         while True:
-            seekpoint = self.f.tell()
-            line = self.f.readline()
-            if line == "":
+            ipos = mm.find(key, pos)
+            if ipos < 0:
                 break
-            if self.budgetkey in line:
-                for l in range(self.tssp_lines):
-                    line = self.f.readline()
-                try:
-                    ts, sp = self._get_ts_sp(line)
-                except:
-                    print(
-                        "unable to cast ts,sp on line number",
-                        l_count,
-                        " line: ",
-                        line,
-                    )
-                    break
-                # print('info found for timestep stress period',ts,sp)
+            seekpoint = mm.rfind(b"\n", 0, ipos) + 1
+            pos = ipos
+            for l in range(self.tssp_lines + 1):
+                eol = mm.find(b"\n", pos)
+                if eol < 0:
+                    eol = len(mm)
+                line = mm[pos:eol].decode("ascii", errors="replace")
+                pos = eol + 1
+            try:
+                ts, sp = self._get_ts_sp(line)
+            except:
+                print(
+                    "unable to cast ts,sp on line number",
+                    mm[:seekpoint].count(b"\n") + 1,
+                    " line: ",
+                    line,
+                )
+                break
+            # print('info found for timestep stress period',ts,sp)
 
-                idxs.append([ts, sp, seekpoint])
+            idxs.append([ts, sp, seekpoint])
 
-                if maxentries and len(idxs) >= maxentries:
-                    break
+            if maxentries and len(idxs) >= maxentries:
+                break
 
         return idxs
 
-    def _seek_to_string(self, s):
+    def _seek_to_string(self, s, start=None):
         """
         Parameters
         ----------
         s : str
             Seek through the file to the next occurrence of s.  Return the
             seek location when found.
+        start : int
+            byte location to start searching from in the memory-mapped
+            file. If None, the file is read line by line from the current
+            location. (default is None)
 
         Returns
         -------
@@ -704,13 +718,26 @@ class ListBudget(object):
             Next location of the string
 
         """
-        while True:
-            seekpoint = self.f.tell()
-            line = self.f.readline()
-            if line == "":
-                break
-            if s in line:
-                break
+        if start is None or self._mm is None:
+            while True:
+                seekpoint = self.f.tell()
+                line = self.f.readline()
+                if line == "":
+                    break
+                if s in line:
+                    break
+            return seekpoint
+        # --find s in the memory-mapped file and position the file after
+        #   the line that contains it
+        mm = self._mm
+        pos = mm.find(s.encode("ascii"), start)
+        if pos < 0:
+            seekpoint = len(mm)
+            self.f.seek(seekpoint)
+        else:
+            seekpoint = mm.rfind(b"\n", 0, pos) + 1
+            self.f.seek(seekpoint)
+            self.f.readline()
         return seekpoint
 
     def _get_ts_sp(self, line):
@@ -766,6 +793,21 @@ class ListBudget(object):
         return incdict, cumdict
 
     def _load(self, maxentries=None):
+        # memory map the file so the budget tables can be located without
+        # reading every line of the list file
+        self._mm = None
+        if os.path.getsize(self.file_name) > 0:
+            with open(self.file_name, "rb") as f:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._load_entries(maxentries)
+        finally:
+            if self._mm is not None:
+                self._mm.close()
+                self._mm = None
+        return
+
+    def _load_entries(self, maxentries=None):
         self._build_index(maxentries)
         incdict, cumdict = self._set_entries()
         if incdict is None and cumdict is None:
@@ -778,7 +820,9 @@ class ListBudget(object):
                 cumdict[entry].append(tcum[entry])
 
             # Get the time for this record
-            seekpoint = self._seek_to_string("TIME SUMMARY AT END")
+            seekpoint = self._seek_to_string(
+                "TIME SUMMARY AT END", start=seekpoint
+            )
             tslen, sptim, tt = self._get_totim(ts, sp, seekpoint)
             totim.append(tt)
 
@@ -831,7 +875,7 @@ class ListBudget(object):
                 return self.null_entries
 
             # --if there are two '=' in this line, then it is a budget line
-            if len(re.findall("=", line)) == 2:
+            if line.count("=") == 2:
                 break
 
         tag = "IN"
@@ -848,7 +892,7 @@ class ListBudget(object):
                     sp,
                 )
                 return self.null_entries
-            if len(re.findall("=", line)) == 2:
+            if line.count("=") == 2:
                 try:
                     entry, flux, cumu = self._parse_budget_line(line)
                 except Exception:
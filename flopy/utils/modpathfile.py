@@ -7,15 +7,113 @@ important classes that can be accessed by the user.
 
 """
 
+import os
 import itertools
-import collections
 import warnings
 import numpy as np
 
 from numpy.lib.recfunctions import append_fields, stack_arrays
 
 from ..utils.flopy_io import loadtxt
-from ..utils.recarray_utils import ra_slice
+
+
+def _get_cache_file(fname, cache):
+    """
+    Return the path of the binary cache of a MODPATH output file, or None
+    if the cache is not used.
+    """
+    if cache is None or cache is False:
+        return None
+    elif cache is True:
+        return "{}.npy".format(fname)
+    return cache
+
+
+def _load_cache(cachefile, fname, names):
+    """
+    Memory-map the binary cache of a MODPATH output file.  None is returned
+    if the cache does not exist, is older than the output file, or does
+    not contain the fields in names.
+    """
+    if not os.path.isfile(cachefile):
+        return None
+    if os.path.getmtime(cachefile) < os.path.getmtime(fname):
+        return None
+    try:
+        data = np.load(cachefile, mmap_mode="c")
+    except (IOError, ValueError):
+        return None
+    if data.dtype.names is None or not set(names) <= set(data.dtype.names):
+        return None
+    return data
+
+
+def _save_cache(cachefile, data):
+    """
+    Save the data of a MODPATH output file to a binary cache.
+    """
+    tmpfile = "{}.tmp".format(cachefile)
+    try:
+        with open(tmpfile, "wb") as f:
+            np.save(f, data)
+        os.replace(tmpfile, cachefile)
+    except (IOError, OSError) as e:
+        warnings.warn(
+            "could not write MODPATH cache file {}: {}".format(cachefile, e)
+        )
+    return
+
+
+def _sort_index(keys):
+    """
+    Build an index of keys, as the sorted keys and the positions of the
+    sorted keys in keys.
+    """
+    order = np.argsort(keys, kind="stable")
+    return keys[order], order
+
+
+def _index_lookup(index, values):
+    """
+    Return the sorted positions of the keys of an index that are equal to
+    any of values.
+    """
+    keys, order = index
+    values = np.unique(values)
+    start = np.searchsorted(keys, values, side="left")
+    count = np.searchsorted(keys, values, side="right") - start
+    pos = np.repeat(start - np.cumsum(count) + count, count)
+    pos += np.arange(pos.shape[0])
+    return np.sort(order[pos])
+
+
+def _index_range(index, minval=None, maxval=None):
+    """
+    Return the sorted positions of the keys of an index that are in the
+    closed interval [minval, maxval].
+    """
+    keys, order = index
+    start, stop = 0, keys.shape[0]
+    if minval is not None:
+        start = np.searchsorted(keys, minval, side="left")
+    if maxval is not None:
+        stop = np.searchsorted(keys, maxval, side="right")
+    return np.sort(order[start:stop])
+
+
+def _cell_keys(k, i, j, shape):
+    """
+    Convert zero-based layer, row, and column indices to a single key.
+    Cells outside of shape get a key of -1.
+    """
+    k, i, j = (np.asarray(v, dtype=np.int64) for v in (k, i, j))
+    nlay, nrow, ncol = shape
+    keys = (k * nrow + i) * ncol + j
+    valid = (
+        (k >= 0) & (k < nlay) & (i >= 0) & (i < nrow) & (j >= 0) & (j < ncol)
+    )
+    keys[~valid] = -1
+    return keys
 
 
 class PathlineFile:
@@ -28,6 +126,17 @@ class PathlineFile:
         Name of the pathline file
     verbose : bool
         Write information to the screen.  Default is False.
+    load_data : bool
+        Read the pathline data when the object is created.  If False, the
+        data are read the first time they are needed, and iter_data() can
+        be used to process the pathlines of MODPATH 7 files one particle at
+        a time without reading the whole file.  Default is True.
+
+    Notes
+    -----
+    The pathline data are stored sorted by particle id, together with the
+    offset of the first pathline point of each particle, so selecting the
+    pathline of a particle does not require a scan of all pathline points.
 
     Examples
     --------
@@ -50,7 +159,10 @@ class PathlineFile:
         "sequencenumber",
     ]
 
-    def __init__(self, filename, verbose=False):
+    # number of pathline points parsed at once in MODPATH 7 files
+    _blocksize = 2 ** 18
+
+    def __init__(self, filename, verbose=False, load_data=True):
         """
         Class constructor.
 
@@ -64,28 +176,60 @@ class PathlineFile:
         # set output dtype
         self.outdtype = self._get_outdtype()
 
-        # set data dtype and read pathline data
+        # set data dtype
         if self.version == 7:
-            self.dtype, self._data = self._get_mp7data()
+            self.dtype = self._get_mp7_dtypes()[1]
         else:
             self.dtype = self._get_dtypes()
-            self._data = loadtxt(
-                self.file, dtype=self.dtype, skiprows=self.skiprows
-            )
 
-        # convert layer, row, and column indices; particle id and group; and
-        #  line segment indices to zero-based
-        for n in self.kijnames:
-            if n in self._data.dtype.names:
-                self._data[n] -= 1
+        # read pathline data
+        self._data = None
+        self.nid = None
+        self._offsets = None
+        if load_data:
+            self._load_data()
+        else:
+            self.file.close()
+        return
 
-        # set number of particle ids
-        self.nid = np.unique(self._data["particleid"])
+    def _load_data(self):
+        """
+        Read the pathline data, sort it by particle id and set the offsets
+        of the pathline points of each particle.
+        """
+        if self.file.closed:
+            self.file = open(self.fname, "r")
+        if self.version == 7:
+            self.dtype, data = self._get_mp7data()
+        else:
+            data = loadtxt(self.file, dtype=self.dtype, skiprows=self.skiprows)
+            data = self._to_zero_based(data)
+
+        # sort the pathline points by particle, keeping the order of the
+        # points of each particle
+        particleid = data["particleid"]
+        if np.any(particleid[1:] < particleid[:-1]):
+            data = data[np.argsort(particleid, kind="stable")]
+        self._data = data
+
+        # set particle ids and the offsets of their pathline points
+        self.nid, offsets = np.unique(data["particleid"], return_index=True)
+        self._offsets = np.append(offsets, data.shape[0])
 
         # close the input file
         self.file.close()
         return
 
+    def _to_zero_based(self, data):
+        """
+        Convert layer, row, and column indices; particle id and group; and
+        line segment indices to zero-based.
+        """
+        for n in self.kijnames:
+            if n in data.dtype.names:
+                data[n] -= 1
+        return data
+
     def _build_index(self):
         """
         Set position of the start of the pathline data.
@@ -182,7 +326,11 @@ class PathlineFile:
         )
         return outdtype
 
-    def _get_mp7data(self):
+    def _get_mp7_dtypes(self):
+        """
+        Build the numpy dtypes of the pathline points in a MODPATH 7
+        pathline file and of the pathline data.
+        """
         dtyper = np.dtype(
             [
                 ("node", np.int32),
@@ -217,55 +365,69 @@ class PathlineFile:
                 ("timestep", np.int32),
             ]
         )
-        idx = 0
-        part_dict = collections.OrderedDict()
-        ndata = 0
+        return dtyper, dtype
+
+    def _iter_mp7_blocks(self, f):
+        """
+        Read the pathline data in a MODPATH 7 pathline file in blocks of
+        whole particles with about _blocksize pathline points.  Yields the
+        zero-based pathline data of each block, with the pathline points of
+        each particle in consecutive rows.
+        """
+        dtyper, dtype = self._get_mp7_dtypes()
+        for n in range(self.skiprows):
+            f.readline()
+        headers = []
+        lines = []
         while True:
-            if idx == 0:
-                for n in range(self.skiprows):
-                    line = self.file.readline()
             # read header line
-            try:
-                line = self.file.readline().strip()
-                if self.verbose:
-                    print(line)
-                if len(line) < 1:
-                    break
-            except:
+            line = f.readline().strip()
+            if self.verbose:
+                print(line)
+            if len(line) > 0:
+                header = [int(s) for s in line.split()[:4]]
+                headers.append(header)
+                # read the pathline points of the particle
+                lines.extend(itertools.islice(f, header[3]))
+            if len(lines) >= self._blocksize or (
+                len(line) < 1 and len(headers) > 0
+            ):
+                headers = np.array(headers, dtype=int)
+                values = np.array(" ".join(lines).split(), dtype=float)
+                values = values.reshape(-1, len(dtyper.names))
+                data = np.zeros(values.shape[0], dtype=dtype)
+                # fill constant items for particle
+                # particleid is not necessarily unique for all pathlines -
+                # use sequencenumber which is unique
+                (
+                    sequencenumber,
+                    group,
+                    particleid,
+                    pathlinecount,
+                ) = headers.T
+                data["particleid"] = np.repeat(sequencenumber, pathlinecount)
+                # set particlegroup and sequence number
+                data["particlegroup"] = np.repeat(group, pathlinecount)
+                data["sequencenumber"] = data["particleid"]
+                # save particleidloc to particleid
+                data["particleidloc"] = np.repeat(particleid, pathlinecount)
+                # fill particle data
+                for i, name in enumerate(dtyper.names):
+                    data[name] = values[:, i]
+                yield self._to_zero_based(data)
+                headers = []
+                lines = []
+            if len(line) < 1:
                 break
-            t = [int(s) for j, s in enumerate(line.split()) if j < 4]
-            sequencenumber, group, particleid, pathlinecount = t[0:4]
-            ndata += pathlinecount
-            # read in the particle data
-            d = np.loadtxt(
-                itertools.islice(self.file, 0, pathlinecount), dtype=dtyper
-            )
-            key = (idx, sequencenumber, group, particleid, pathlinecount)
-            part_dict[key] = d.copy()
-            idx += 1
-
-        # create data array
-        data = np.zeros(ndata, dtype=dtype)
-
-        # fill data
-        ipos0 = 0
-        for key, value in part_dict.items():
-            idx, sequencenumber, group, particleid, pathlinecount = key[0:5]
-            ipos1 = ipos0 + pathlinecount
-            # fill constant items for particle
-            # particleid is not necessarily unique for all pathlines - use
-            # sequencenumber which is unique
-            data["particleid"][ipos0:ipos1] = sequencenumber
-            # set particlegroup and sequence number
-            data["particlegroup"][ipos0:ipos1] = group
-            data["sequencenumber"][ipos0:ipos1] = sequencenumber
-            # save particleidloc to particleid
-            data["particleidloc"][ipos0:ipos1] = particleid
-            # fill particle data
-            for name in value.dtype.names:
-                data[name][ipos0:ipos1] = value[name]
-            ipos0 = ipos1
 
+    def _get_mp7data(self):
+        dtype = self._get_mp7_dtypes()[1]
+        self.file.seek(0)
+        data = list(self._iter_mp7_blocks(self.file))
+        if len(data) > 0:
+            data = np.concatenate(data)
+        else:
+            data = np.zeros(0, dtype=dtype)
         return dtype, data
 
     def get_maxid(self):
@@ -278,6 +440,8 @@ class PathlineFile:
             Maximum pathline number.
 
         """
+        if self._data is None:
+            self._load_data()
         return self._data["particleid"].max()
 
     def get_maxtime(self):
@@ -290,6 +454,8 @@ class PathlineFile:
             Maximum pathline time.
 
         """
+        if self._data is None:
+            self._load_data()
         return self._data["time"].max()
 
     def get_data(self, partid=0, totim=None, ge=True):
@@ -330,19 +496,20 @@ class PathlineFile:
         >>> p1 = pthobj.get_data(partid=1)
 
         """
-        # idx = self._data['particleid'] == partid
+        if self._data is None:
+            self._load_data()
+        # pathline points of the particle
+        ipos = np.searchsorted(self.nid, partid)
+        if ipos < self.nid.shape[0] and self.nid[ipos] == partid:
+            ta = self._data[self._offsets[ipos] : self._offsets[ipos + 1]]
+        else:
+            ta = self._data[0:0]
         if totim is not None:
             if ge:
-                idx = (self._data["time"] >= totim) & (
-                    self._data["particleid"] == partid
-                )
+                ta = ta[ta["time"] >= totim]
             else:
-                idx = (self._data["time"] <= totim) & (
-                    self._data["particleid"] == partid
-                )
-        else:
-            idx = self._data["particleid"] == partid
-        self._ta = self._data[idx]
+                ta = ta[ta["time"] <= totim]
+        self._ta = ta
         names = ["x", "y", "z", "time", "k", "particleid"]
         return np.rec.fromarrays(
             (self._ta[name] for name in names), dtype=self.outdtype
@@ -384,13 +551,87 @@ class PathlineFile:
         >>> p = pthobj.get_alldata()
 
         """
-        # plist = []
-        # for partid in self.nid:
-        #     plist.append(self.get_data(partid=partid, totim=totim, ge=ge))
-        return [
-            self.get_data(partid=partid, totim=totim, ge=ge)
-            for partid in self.nid
-        ]
+        if self._data is None:
+            self._load_data()
+        if self.nid.shape[0] == 0:
+            return []
+        data = self._data
+        offsets = self._offsets
+        if totim is not None:
+            if ge:
+                idx = data["time"] >= totim
+            else:
+                idx = data["time"] <= totim
+            data = data[idx]
+            # number of selected pathline points up to the end of each
+            # particle
+            offsets = np.append(0, np.cumsum(idx)[offsets[1:] - 1])
+        names = ["x", "y", "z", "time", "k", "particleid"]
+        ra = np.rec.fromarrays(
+            (data[name] for name in names), dtype=self.outdtype
+        )
+        return np.split(ra, offsets[1:-1])
+
+    def iter_data(self, totim=None, ge=True):
+        """
+        Iterate over the pathlines in the pathline file, one particle at a
+        time.  The pathline data of MODPATH 7 files are read in blocks of
+        particles if they have not been loaded, so the whole file is never
+        held in memory.  Other pathline files are read completely first,
+        because their pathline points are not grouped by particle.
+
+        Parameters
+        ----------
+        totim : float
+            The simulation time. All pathline points for particle partid
+            that are greater than or equal to (ge=True) or less than or
+            equal to (ge=False) totim will be returned. Default is None
+        ge : bool
+            Boolean that determines if pathline times greater than or equal
+            to or less than or equal to totim is used to create a subset
+            of pathlines. Default is True.
+
+        Yields
+        ------
+        ra : numpy record array
+            A numpy recarray with the x, y, z, time, k, and particleid of
+            a pathline, in the same form as returned by get_data.
+
+        Examples
+        --------
+
+        >>> import flopy
+        >>> pthobj = flopy.utils.PathlineFile('model.mppth',
+        ...                                   load_data=False)
+        >>> for p in pthobj.iter_data():
+        ...     print(p.particleid[0], p.time.max())
+
+        """
+        if self._data is not None or self.version != 7:
+            for ra in self.get_alldata(totim=totim, ge=ge):
+                yield ra
+            return
+
+        names = ["x", "y", "z", "time", "k", "particleid"]
+        with open(self.fname, "r") as f:
+            for data in self._iter_mp7_blocks(f):
+                # start of the pathline points of each particle
+                offsets = np.flatnonzero(
+                    np.diff(data["sequencenumber"], prepend=-1)
+                )
+                offsets = np.append(offsets, data.shape[0])
+                if totim is not None:
+                    if ge:
+                        idx = data["time"] >= totim
+                    else:
+                        idx = data["time"] <= totim
+                    data = data[idx]
+                    offsets = np.append(0, np.cumsum(idx)[offsets[1:] - 1])
+                ra = np.rec.fromarrays(
+                    (data[name] for name in names), dtype=self.outdtype
+                )
+                for ra_particle in np.split(ra, offsets[1:-1]):
+                    yield ra_particle
 
     def get_destination_pathline_data(self, dest_cells, to_recarray=False):
         """
@@ -423,8 +664,9 @@ class PathlineFile:
 
         """
 
-        # create local copy of _data
-        ra = np.array(self._data)
+        if self._data is None:
+            self._load_data()
+        ra = self._data
 
         # find the intersection of pathlines and dest_cells
         # convert dest_cells to same dtype for comparison
@@ -454,21 +696,25 @@ class PathlineFile:
 
         dest_cells = np.array(dest_cells, dtype=raslice.dtype)
         inds = np.in1d(raslice, dest_cells)
-        epdest = ra[inds].copy().view(np.recarray)
+
+        # particles with pathline points in dest_cells
+        ipos = np.unique(
+            np.searchsorted(self._offsets, np.flatnonzero(inds), side="right")
+            - 1
+        )
 
         if to_recarray:
-            # use particle ids to get the rest of the paths
-            inds = np.in1d(ra["particleid"], epdest.particleid)
-            pthldes = ra[inds].copy()
+            # use the particle offsets to get the rest of the paths
+            count = self._offsets[ipos + 1] - self._offsets[ipos]
+            rows = np.repeat(
+                self._offsets[ipos] - np.cumsum(count) + count, count
+            ) + np.arange(count.sum())
+            pthldes = ra[rows]
             pthldes.sort(order=["particleid", "time"])
             pthldes = pthldes.view(np.recarray)
         else:
-
-            # get list of unique particleids in selection
-            partids = np.unique(epdest["particleid"])
-
             # build list of unique particleids in selection
-            pthldes = [self.get_data(partid) for partid in partids]
+            pthldes = [self.get_data(partid) for partid in self.nid[ipos]]
 
         return pthldes
 
@@ -520,15 +766,13 @@ class PathlineFile:
 
         pth = pathline_data
         if pth is None:
+            if self._data is None:
+                self._load_data()
             pth = self._data.view(np.recarray)
         else:
             # convert pathline list to a single recarray
             if isinstance(pth, list):
-                s = pth[0]
-                print(s.dtype)
-                for n in range(1, len(pth)):
-                    s = stack_arrays((s, pth[n]))
-                pth = s.view(np.recarray)
+                pth = stack_arrays(pth, usemask=False).view(np.recarray)
 
         pth = pth.copy()
         pth.sort(order=["particleid", "time"])
@@ -555,7 +799,9 @@ class PathlineFile:
         if epsg is None:
             epsg = mg.epsg
 
-        particles = np.unique(pth.particleid)
+        # pathline points of each particle
+        particles, offsets = np.unique(pth.particleid, return_index=True)
+        offsets = np.append(offsets, pth.shape[0])
         geoms = []
 
         # create dtype with select attributes in pth
@@ -581,8 +827,8 @@ class PathlineFile:
                 loc_inds = -1
 
             pthdata = []
-            for pid in particles:
-                ra = pth[pth.particleid == pid]
+            for ipos, pid in enumerate(particles):
+                ra = pth[offsets[ipos] : offsets[ipos + 1]]
 
                 x, y = geometry.transform(
                     ra.x, ra.y, mg.xoffset, mg.yoffset, mg.angrot_radians
@@ -612,8 +858,8 @@ class PathlineFile:
             dtype = pth.dtype
             # pthdata = np.empty((0, len(dtype)), dtype=dtype).view(np.recarray)
             pthdata = []
-            for pid in particles:
-                ra = pth[pth.particleid == pid]
+            for ipos, pid in enumerate(particles):
+                ra = pth[offsets[ipos] : offsets[ipos + 1]]
                 if isinstance(mg, StructuredGrid):
                     x, y = geometry.transform(
                         ra.x, ra.y, mg.xoffset, mg.yoffset, mg.angrot_radians
@@ -649,6 +895,19 @@ class EndpointFile:
         Name of the endpoint file
     verbose : bool
         Write information to the screen.  Default is False.
+    cache : bool or str
+        Keep a binary copy of the endpoint data in a .npy file, which is
+        memory-mapped instead of reading the endpoint file again when the
+        endpoint file has not changed.  If True, the cache file is the
+        endpoint file name with a .npy extension added, otherwise cache is
+        the path of the cache file.  Default is False.
+
+    Notes
+    -----
+    Indexes of the endpoints by particle id, particle group, cell, and time
+    are built the first time they are used, so repeated queries with
+    get_data, get_group_data, get_time_data, and
+    get_destination_endpoint_data do not scan all endpoints.
 
     Examples
     --------
@@ -676,7 +935,7 @@ class EndpointFile:
         "zone",
     ]
 
-    def __init__(self, filename, verbose=False):
+    def __init__(self, filename, verbose=False, cache=False):
         """
         Class constructor.
 
@@ -685,17 +944,31 @@ class EndpointFile:
         self.verbose = verbose
         self._build_index()
         self.dtype = self._get_dtypes()
-        self._data = loadtxt(
-            self.file, dtype=self.dtype, skiprows=self.skiprows
-        )
-        # add particleid if required
-        self._add_particleid()
+        self._indexes = {}
 
-        # convert layer, row, and column indices; particle id and group; and
-        #  line segment indices to zero-based
-        for n in self.kijnames:
-            if n in self._data.dtype.names:
-                self._data[n] -= 1
+        # read the endpoint data from the binary cache, if it is current
+        self._data = None
+        cachefile = _get_cache_file(filename, cache)
+        if cachefile is not None:
+            self._data = _load_cache(cachefile, filename, self.dtype.names)
+            if self._data is not None and self.verbose:
+                print("reading cached endpoint data from {}".format(cachefile))
+
+        if self._data is None:
+            self._data = loadtxt(
+                self.file, dtype=self.dtype, skiprows=self.skiprows
+            )
+            # add particleid if required
+            self._add_particleid()
+
+            # convert layer, row, and column indices; particle id and group;
+            #  and line segment indices to zero-based
+            for n in self.kijnames:
+                if n in self._data.dtype.names:
+                    self._data[n] -= 1
+
+            if cachefile is not None:
+                _save_cache(cachefile, self._data)
 
         # set number of particle ids
         self.nid = np.unique(self._data["particleid"]).shape[0]
@@ -868,7 +1141,9 @@ class EndpointFile:
 
             # for numpy version 1.14 and higher
             if v[0] > 1 or (v[0] == 1 and v[1] > 13):
-                self._data = append_fields(self._data, "particleid", pids)
+                self._data = append_fields(
+                    self._data, "particleid", pids, usemask=False
+                )
             # numpy versions prior to 1.14
             else:
                 if self.verbose:
@@ -913,6 +1188,40 @@ class EndpointFile:
                 self._data = data.copy()
         return
 
+    def _get_index(self, key):
+        """
+        Get the index of the endpoints by particleid, particlegroup, cell
+        ("cell" or "cell0" for versions < 7), node ("node" or "node0" for
+        version 7), time, or traveltime.
+        """
+        if key not in self._indexes:
+            if key == "traveltime":
+                keys = self._data["time"] - self._data["time0"]
+            elif key in ("cell", "cell0"):
+                names = ["k", "i", "j"]
+                if key == "cell0":
+                    names = [name + "0" for name in names]
+                keys = _cell_keys(
+                    *(self._data[name] for name in names),
+                    shape=self._get_cell_shape()
+                )
+            else:
+                keys = self._data[key]
+            self._indexes[key] = _sort_index(keys)
+        return self._indexes[key]
+
+    def _get_cell_shape(self):
+        """
+        Get the number of layers, rows, and columns spanned by the starting
+        and ending cells of the endpoints.
+        """
+        shape = []
+        for name in ("k", "i", "j"):
+            shape.append(
+                max(self._data[name].max(), self._data[name + "0"].max()) + 1
+            )
+        return tuple(shape)
+
     def get_maxid(self):
         """
         Get the maximum endpoint particle id in the file endpoint file
@@ -923,7 +1232,7 @@ class EndpointFile:
             Maximum endpoint particle id.
 
         """
-        return np.unique(self._data["particleid"]).max()
+        return self._data["particleid"].max()
 
     def get_maxtime(self):
         """
@@ -980,7 +1289,7 @@ class EndpointFile:
         >>> e1 = endobj.get_data(partid=1)
 
         """
-        idx = self._data["particleid"] == partid
+        idx = _index_lookup(self._get_index("particleid"), partid)
         ra = self._data[idx]
         return ra
 
@@ -1013,6 +1322,74 @@ class EndpointFile:
         """
         return self._data.view(np.recarray).copy()
 
+    def get_group_data(self, particlegroup):
+        """
+        Get endpoint data from the endpoint file for one or more particle
+        groups.
+
+        Parameters
+        ----------
+        particlegroup : int or list of ints
+            The zero-based particle group(s).
+
+        Returns
+        ----------
+        ra : numpy record array
+            A numpy recarray with the endpoint particle data of the
+            particles in particlegroup.
+
+        Examples
+        --------
+
+        >>> import flopy
+        >>> endobj = flopy.utils.EndpointFile('model.mpend')
+        >>> e = endobj.get_group_data(particlegroup=0)
+
+        """
+        if "particlegroup" not in self._data.dtype.names:
+            msg = "could not extract 'particlegroup' key from endpoint data"
+            raise KeyError(msg)
+        idx = _index_lookup(self._get_index("particlegroup"), particlegroup)
+        return self._data[idx].view(np.recarray)
+
+    def get_time_data(self, mintime=None, maxtime=None, traveltime=False):
+        """
+        Get endpoint data from the endpoint file for the endpoints with a
+        time between mintime and maxtime.
+
+        Parameters
+        ----------
+        mintime : float
+            Minimum endpoint time.  If None, there is no minimum time.
+            Default is None.
+        maxtime : float
+            Maximum endpoint time.  If None, there is no maximum time.
+            Default is None.
+        traveltime : bool
+            Use the travel time (time - time0) of the particles instead of
+            the endpoint time.  Default is False.
+
+        Returns
+        ----------
+        ra : numpy record array
+            A numpy recarray with the endpoint particle data of the
+            particles with an endpoint time or travel time between mintime
+            and maxtime.
+
+        Examples
+        --------
+
+        >>> import flopy
+        >>> endobj = flopy.utils.EndpointFile('model.mpend')
+        >>> e = endobj.get_time_data(maxtime=3650., traveltime=True)
+
+        """
+        key = "time"
+        if traveltime:
+            key = "traveltime"
+        idx = _index_range(self._get_index(key), mintime, maxtime)
+        return self._data[idx].view(np.recarray)
+
     def get_destination_endpoint_data(self, dest_cells, source=False):
         """
         Get endpoint data for set of destination cells.
@@ -1041,19 +1418,15 @@ class EndpointFile:
 
         """
 
-        # create local copy of _data
-        ra = self.get_alldata()
-
         # find the intersection of endpoints and dest_cells
         # convert dest_cells to same dtype for comparison
+        names = self._data.dtype.names
         if self.version < 7:
             if source:
                 keys = ["k0", "i0", "j0"]
             else:
                 keys = ["k", "i", "j"]
-            try:
-                raslice = ra_slice(ra, keys)
-            except:
+            if not set(keys + ["k0", "i0", "j0"]) <= set(names):
                 msg = (
                     "could not extract"
                     + "'"
@@ -1067,9 +1440,7 @@ class EndpointFile:
                 keys = ["node0"]
             else:
                 keys = ["node"]
-            try:
-                raslice = ra_slice(ra, keys)
-            except:
+            if keys[0] not in names:
                 msg = (
                     "could not extract '{}' ".format(keys[0])
                     + "key from endpoint data"
@@ -1079,18 +1450,26 @@ class EndpointFile:
                 allint = all(isinstance(el, int) for el in dest_cells)
                 # convert to a list of tuples
                 if allint:
-                    t = []
-                    for el in dest_cells:
-                        t.append((el,))
-                        dest_cells = t
+                    dest_cells = [(el,) for el in dest_cells]
         dtype = []
         for key in keys:
             dtype.append((key, np.int32))
         dtype = np.dtype(dtype)
-        dest_cells = np.array(dest_cells, dtype=dtype)
+        dest_cells = np.array(dest_cells, dtype=dtype).ravel()
 
-        inds = np.in1d(raslice, dest_cells)
-        epdest = ra[inds].copy().view(np.recarray)
+        # look up the endpoints in the cell or node index
+        if self.version < 7:
+            index = "cell0" if source else "cell"
+            cells = _cell_keys(
+                *(dest_cells[key] for key in keys),
+                shape=self._get_cell_shape()
+            )
+            cells = cells[cells >= 0]
+        else:
+            index = keys[0]
+            cells = dest_cells[index]
+        inds = _index_lookup(self._get_index(index), cells)
+        epdest = self._data[inds].view(np.recarray)
         return epdest
 
     def write_shapefile(
@@ -1193,6 +1572,18 @@ class TimeseriesFile:
         Name of the timeseries file
     verbose : bool
         Write information to the screen.  Default is False.
+    cache : bool or str
+        Keep a binary copy of the timeseries data in a .npy file, which is
+        memory-mapped instead of reading the timeseries file again when the
+        timeseries file has not changed.  If True, the cache file is the
+        timeseries file name with a .npy extension added, otherwise cache
+        is the path of the cache file.  Default is False.
+
+    Notes
+    -----
+    Indexes of the timeseries points by particle id, particle group, cell,
+    and time are built the first time they are used, so repeated queries
+    do not scan all timeseries points.
 
     Examples
     --------
@@ -1215,7 +1606,7 @@ class TimeseriesFile:
         "timepointindex",
     ]
 
-    def __init__(self, filename, verbose=False):
+    def __init__(self, filename, verbose=False, cache=False):
         """
         Class constructor.
 
@@ -1231,17 +1622,32 @@ class TimeseriesFile:
 
         # set dtype
         self.dtype = self._get_dtypes()
+        self._indexes = {}
+
+        # read the timeseries data from the binary cache, if it is current
+        self._data = None
+        cachefile = _get_cache_file(filename, cache)
+        if cachefile is not None:
+            self._data = _load_cache(cachefile, filename, self.dtype.names)
+            if self._data is not None and self.verbose:
+                print(
+                    "reading cached timeseries data from {}".format(cachefile)
+                )
 
-        # read data
-        self._data = loadtxt(
-            self.file, dtype=self.dtype, skiprows=self.skiprows
-        )
+        if self._data is None:
+            # read data
+            self._data = loadtxt(
+                self.file, dtype=self.dtype, skiprows=self.skiprows
+            )
 
-        # convert layer, row, and column indices; particle id and group; and
-        #  line segment indices to zero-based
-        for n in self.kijnames:
-            if n in self._data.dtype.names:
-                self._data[n] -= 1
+            # convert layer, row, and column indices; particle id and group;
+            #  and line segment indices to zero-based
+            for n in self.kijnames:
+                if n in self._data.dtype.names:
+                    self._data[n] -= 1
+
+            if cachefile is not None:
+                _save_cache(cachefile, self._data)
 
         # set number of particle ids
         self.nid = np.unique(self._data["particleid"])
@@ -1382,6 +1788,35 @@ class TimeseriesFile:
         )
         return outdtype
 
+    def _get_index(self, key):
+        """
+        Get the index of the timeseries points by particleid,
+        particlegroup, cell (versions < 7), node (version 7), or time.
+        """
+        if key not in self._indexes:
+            if key == "cell":
+                keys = _cell_keys(
+                    *(self._data[name] for name in ("k", "i", "j")),
+                    shape=self._get_cell_shape()
+                )
+            else:
+                keys = self._data[key]
+            self._indexes[key] = _sort_index(keys)
+        return self._indexes[key]
+
+    def _get_cell_shape(self):
+        """
+        Get the number of layers, rows, and columns spanned by the
+        timeseries points.
+        """
+        return tuple(self._data[name].max() + 1 for name in ("k", "i", "j"))
+
+    def _to_outdtype(self, data):
+        names = ["x", "y", "z", "time", "k", "particleid"]
+        return np.rec.fromarrays(
+            (data[name] for name in names), dtype=self.outdtype
+        )
+
     def get_maxid(self):
         """
         Get the maximum timeseries number in the file timeseries file
@@ -1445,22 +1880,15 @@ class TimeseriesFile:
         >>> ts1 = tsobj.get_data(partid=1)
 
         """
+        idx = _index_lookup(self._get_index("particleid"), partid)
+        ta = self._data[idx]
         if totim is not None:
             if ge:
-                idx = (self._data["time"] >= totim) & (
-                    self._data["particleid"] == partid
-                )
+                ta = ta[ta["time"] >= totim]
             else:
-                idx = (self._data["time"] <= totim) & (
-                    self._data["particleid"] == partid
-                )
-        else:
-            idx = self._data["particleid"] == partid
-        self._ta = self._data[idx]
-        names = ["x", "y", "z", "time", "k", "particleid"]
-        return np.rec.fromarrays(
-            (self._ta[name] for name in names), dtype=self.outdtype
-        )
+                ta = ta[ta["time"] <= totim]
+        self._ta = ta
+        return self._to_outdtype(ta)
 
     def get_alldata(self, totim=None, ge=True):
         """
@@ -1499,10 +1927,86 @@ class TimeseriesFile:
         >>> ts = tsobj.get_alldata()
 
         """
-        return [
-            self.get_data(partid=partid, totim=totim, ge=ge)
-            for partid in self.nid
-        ]
+        if self.nid.shape[0] == 0:
+            return []
+
+        # timeseries points of all particles, grouped by particle
+        keys, order = self._get_index("particleid")
+        counts = np.diff(
+            np.append(np.searchsorted(keys, self.nid), keys.shape[0])
+        )
+        ra = self._to_outdtype(self._data[order])
+        if totim is not None:
+            if ge:
+                idx = ra["time"] >= totim
+            else:
+                idx = ra["time"] <= totim
+            counts = np.add.reduceat(
+                idx.astype(np.int64), np.cumsum(counts) - counts
+            )
+            ra = ra[idx]
+        return np.split(ra, np.cumsum(counts)[:-1])
+
+    def get_group_data(self, particlegroup):
+        """
+        Get timeseries data from the timeseries file for one or more
+        particle groups.
+
+        Parameters
+        ----------
+        particlegroup : int or list of ints
+            The zero-based particle group(s).
+
+        Returns
+        ----------
+        ra : numpy record array
+            A numpy recarray with the timeseries data of the particles in
+            particlegroup.
+
+        Examples
+        --------
+
+        >>> import flopy
+        >>> tsobj = flopy.utils.TimeseriesFile('model.timeseries')
+        >>> ts = tsobj.get_group_data(particlegroup=0)
+
+        """
+        if "particlegroup" not in self._data.dtype.names:
+            msg = "could not extract 'particlegroup' key from timeseries data"
+            raise KeyError(msg)
+        idx = _index_lookup(self._get_index("particlegroup"), particlegroup)
+        return self._data[idx].view(np.recarray)
+
+    def get_time_data(self, mintime=None, maxtime=None):
+        """
+        Get timeseries data from the timeseries file for the timeseries
+        points with a time between mintime and maxtime.
+
+        Parameters
+        ----------
+        mintime : float
+            Minimum time.  If None, there is no minimum time.  Default is
+            None.
+        maxtime : float
+            Maximum time.  If None, there is no maximum time.  Default is
+            None.
+
+        Returns
+        ----------
+        ra : numpy record array
+            A numpy recarray with the timeseries data of all particles with
+            a time between mintime and maxtime.
+
+        Examples
+        --------
+
+        >>> import flopy
+        >>> tsobj = flopy.utils.TimeseriesFile('model.timeseries')
+        >>> ts = tsobj.get_time_data(mintime=365., maxtime=365.)
+
+        """
+        idx = _index_range(self._get_index("time"), mintime, maxtime)
+        return self._data[idx].view(np.recarray)
 
     def get_destination_timeseries_data(self, dest_cells):
         """
@@ -1529,41 +2033,45 @@ class TimeseriesFile:
 
         """
 
-        # create local copy of _data
-        ra = np.array(self._data)
-
         # find the intersection of timeseries and dest_cells
         # convert dest_cells to same dtype for comparison
+        names = self._data.dtype.names
         if self.version < 7:
-            try:
-                raslice = ra[["k", "i", "j"]]
-            except:
+            keys = ["k", "i", "j"]
+            if not set(keys) <= set(names):
                 msg = (
                     "could not extract 'k', 'i', and 'j' keys "
                     + "from timeseries data"
                 )
                 raise KeyError(msg)
         else:
-            try:
-                raslice = ra[["node"]]
-            except:
+            keys = ["node"]
+            if "node" not in names:
                 msg = "could not extract 'node' key from timeseries data"
                 raise KeyError(msg)
             if isinstance(dest_cells, (list, tuple)):
                 allint = all(isinstance(el, int) for el in dest_cells)
                 # convert to a list of tuples
                 if allint:
-                    t = []
-                    for el in dest_cells:
-                        t.append((el,))
-                        dest_cells = t
+                    dest_cells = [(el,) for el in dest_cells]
 
-        dest_cells = np.array(dest_cells, dtype=raslice.dtype)
-        inds = np.in1d(raslice, dest_cells)
-        epdest = ra[inds].copy().view(np.recarray)
+        dtype = np.dtype([(key, self._data.dtype[key]) for key in keys])
+        dest_cells = np.array(dest_cells, dtype=dtype).ravel()
+        if self.version < 7:
+            index = "cell"
+            cells = _cell_keys(
+                *(dest_cells[key] for key in keys),
+                shape=self._get_cell_shape()
+            )
+            cells = cells[cells >= 0]
+        else:
+            index = "node"
+            cells = dest_cells[index]
+        inds = _index_lookup(self._get_index(index), cells)
 
         # use particle ids to get the rest of the timeseries
-        inds = np.in1d(ra["particleid"], epdest.particleid)
-        tsdes = ra[inds].copy()
+        partids = self._data["particleid"][inds]
+        inds = _index_lookup(self._get_index("particleid"), partids)
+        tsdes = self._data[inds]
         tsdes.sort(order=["particleid", "time"])
         return tsdes.view(np.recarray)
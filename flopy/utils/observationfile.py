@@ -214,23 +214,83 @@ class ObsFiles(FlopyBinaryData):
         df = pd.DataFrame(self.data[i0:i1], index=dti, columns=obsname)
         return df
 
-    def _read_data(self):
+    def _get_obsname_columns(self, obsname=None):
+        """
+        Get the names of the totim and observation columns to load.
+
+        Parameters
+        ----------
+        obsname : string or list of strings
+            Names of the observations to load. If obsname is None, all
+            observations are loaded. (default is None)
+
+        Returns
+        -------
+        names : list of strings
+            totim and the unique obsname column names, or None if all of
+            the columns are loaded
 
+        """
+        if obsname is None:
+            return None
+        if not isinstance(obsname, (list, tuple)):
+            obsname = [obsname]
+        # drop repeated names, a structured array cannot hold them twice
+        names = ["totim"]
+        for name in obsname:
+            if name not in names:
+                names.append(name)
+        ierr = 0
+        for name in names:
+            if name not in self.dtype.names:
+                ierr += 1
+                print("Error: {} is not a valid column name".format(name))
+        if ierr > 0:
+            raise Exception("Error: {} names did not match".format(ierr))
+        return names
+
+    def _read_data(self, obsname=None):
+        """
+        Read all of the fixed-width records that follow the header in a
+        single read.
+
+        Parameters
+        ----------
+        obsname : string or list of strings
+            Names of the observations to load. If obsname is not None,
+            the file is memory mapped and only the totim and obsname
+            columns are copied. (default is None)
+
+        """
         if self.data is not None:
             return
 
-        while True:
-            try:
-                r = self.read_record(count=1)
-                if self.data is None:
-                    self.data = r.copy()
-                elif r.size == 0:
-                    break
-                else:
-                    # should be hstack based on (https://mail.scipy.org/pipermail/numpy-discussion/2010-June/051107.html)
-                    self.data = np.hstack((self.data, r))
-            except:
-                break
+        # number of complete records after the header
+        ipos = self.file.tell()
+        self.file.seek(0, 2)
+        nrecords = (self.file.tell() - ipos) // self.dtype.itemsize
+        self.file.seek(ipos)
+
+        names = self._get_obsname_columns(obsname)
+        if names is None:
+            self.data = self.read_record(count=nrecords)
+            return
+
+        self.nobs = len(names) - 1
+        self.data = np.empty(
+            nrecords, dtype=[(name, self.dtype[name]) for name in names]
+        )
+        if nrecords > 0:
+            records = np.memmap(
+                self.file,
+                dtype=self.dtype,
+                mode="r",
+                offset=ipos,
+                shape=(nrecords,),
+            )
+            for name in names:
+                self.data[name] = records[name]
+            del records
         return
 
     def _build_dtype(self):
@@ -263,8 +323,12 @@ class Mf6Obs(ObsFiles):
     verbose : boolean
         If true, print additional information to to the screen during the
         extraction.  (default is False)
-    hydlbl_len : int
-        Length of hydmod labels. (default is 20)
+    isBinary : boolean
+        If true, the observation file is a binary file, otherwise it is a
+        comma-separated text file. (default is True)
+    obsname : string or list of strings
+        Names of the observations to load. If obsname is None, all
+        observations are loaded. (default is None)
 
     Returns
     -------
@@ -272,7 +336,7 @@ class Mf6Obs(ObsFiles):
 
     """
 
-    def __init__(self, filename, verbose=False, isBinary=True):
+    def __init__(self, filename, verbose=False, isBinary=True, obsname=None):
         """
         Class constructor.
 
@@ -313,7 +377,7 @@ class Mf6Obs(ObsFiles):
             self._build_index()
 
             self.data = None
-            self._read_data()
+            self._read_data(obsname)
         else:
             # --open binary head file
             self.file = open(filename, "r")
@@ -339,9 +403,20 @@ class Mf6Obs(ObsFiles):
             self._build_index()
 
             # read ascii data
-            self.data = np.loadtxt(
-                self.file, dtype=self.dtype, delimiter=",", ndmin=1
-            )
+            names = self._get_obsname_columns(obsname)
+            if names is None:
+                self.data = np.loadtxt(
+                    self.file, dtype=self.dtype, delimiter=",", ndmin=1
+                )
+            else:
+                self.nobs = len(names) - 1
+                self.data = np.loadtxt(
+                    self.file,
+                    dtype=[(name, self.dtype[name]) for name in names],
+                    delimiter=",",
+                    ndmin=1,
+                    usecols=[self.dtype.names.index(name) for name in names],
+                )
         return
 
     def _build_dtype(self):
@@ -374,6 +449,9 @@ class HydmodObs(ObsFiles):
         extraction.  (default is False)
     hydlbl_len : int
         Length of hydmod labels. (default is 20)
+    obsname : string or list of strings
+        Names of the observations to load. If obsname is None, all
+        observations are loaded. (default is None)
 
     Returns
     -------
@@ -381,7 +459,7 @@ class HydmodObs(ObsFiles):
 
     """
 
-    def __init__(self, filename, verbose=False, hydlbl_len=20):
+    def __init__(self, filename, verbose=False, hydlbl_len=20, obsname=None):
         """
         Class constructor.
 
@@ -419,7 +497,7 @@ class HydmodObs(ObsFiles):
         self._build_index()
 
         self.data = None
-        self._read_data()
+        self._read_data(obsname)
 
     def _build_dtype(self):
 
@@ -451,6 +529,9 @@ class SwrObs(ObsFiles):
         'single' or 'double'.  Default is 'double'.
     verbose : bool
         Write information to the screen.  Default is False.
+    obsname : string or list of strings
+        Names of the observations to load. If obsname is None, all
+        observations are loaded.  Default is None.
 
     Attributes
     ----------
@@ -472,7 +553,9 @@ class SwrObs(ObsFiles):
 
     """
 
-    def __init__(self, filename, precision="double", verbose=False):
+    def __init__(
+        self, filename, precision="double", verbose=False, obsname=None
+    ):
         """
         Class constructor.
 
@@ -503,7 +586,7 @@ class SwrObs(ObsFiles):
 
         # read data
         self.data = None
-        self._read_data()
+        self._read_data(obsname)
 
     def _build_dtype(self):
         vdata = [("totim", self.floattype)]
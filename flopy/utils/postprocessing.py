@@ -1,5 +1,8 @@
 import numpy as np
 
+# number of head values processed at once by _iter_heads
+_HEAD_CHUNK_SIZE = 2 ** 24
+
 
 def get_transmissivities(
     heads,
@@ -123,6 +126,68 @@ def get_transmissivities(
     return T
 
 
+def _iter_heads(heads, per_idx=None):
+    """
+    Iterate over the heads for the requested stress periods in chunks,
+    so that large or memory-mapped head arrays are never copied into
+    memory at once.
+
+    Parameters
+    ----------
+    heads : 3 or 4-D np.ndarray or flopy.utils.HeadFile
+        Heads array or binary head file.
+    per_idx : int or sequence of ints
+        stress periods to return. If None,
+        returns all stress periods (default is None).
+
+    Returns
+    -------
+    shape : tuple
+        (nper, nlay, nrow, ncol) of the requested stress periods
+    dtype : np.dtype
+        data type of the heads
+    chunks : generator
+        yields (slice, 4-D np.ndarray) tuples of the position of each
+        chunk in the requested stress periods and its heads
+
+    """
+    totims = None
+    if hasattr(heads, "get_times"):
+        try:
+            heads = heads.get_memmap()
+        except Exception:
+            # read the stress periods from the file one at a time
+            totims = heads.get_times()
+            shape = (len(totims), heads.nlay, heads.nrow, heads.ncol)
+            dtype = np.dtype(heads.realtype)
+    if totims is None:
+        heads = np.asanyarray(heads)
+        if heads.ndim < 4:
+            heads = heads.reshape((1,) * (4 - heads.ndim) + heads.shape)
+        shape = heads.shape
+        dtype = heads.dtype
+
+    nper = shape[0]
+    if per_idx is None:
+        per_idx = list(range(nper))
+    elif np.isscalar(per_idx):
+        per_idx = [per_idx]
+    nchunk = max(1, _HEAD_CHUNK_SIZE // int(np.prod(shape[1:])))
+
+    def chunks():
+        for i0 in range(0, len(per_idx), nchunk):
+            idx = per_idx[i0 : i0 + nchunk]
+            if totims is None:
+                chunk = heads[idx]
+            else:
+                chunk = np.array(
+                    [heads.get_data(totim=totims[per]) for per in idx]
+                )
+            yield slice(i0, i0 + len(idx)), chunk
+
+    return (len(per_idx),) + tuple(shape[1:]), dtype, chunks()
+
+
 def get_water_table(heads, nodata, per_idx=None):
     """
     Get a 2D array representing the water table elevation for each
@@ -130,8 +195,9 @@ def get_water_table(heads, nodata, per_idx=None):
 
     Parameters
     ----------
-    heads : 3 or 4-D np.ndarray
-        Heads array.
+    heads : 3 or 4-D np.ndarray or flopy.utils.HeadFile
+        Heads array or binary head file.  Head files with a regular
+        layout are read through a memory-mapped view.
     nodata : real
         HDRY value indicating dry cells.
     per_idx : int or sequence of ints
@@ -141,28 +207,21 @@ def get_water_table(heads, nodata, per_idx=None):
     Returns
     -------
     wt : 2 or 3-D np.ndarray of water table elevations
-        for each stress period.
+        for each stress period. If per_idx is empty, an empty array
+        with shape (0, nrow, ncol) is returned.
 
     """
-    heads = np.array(heads, ndmin=4)
-    nper, nlay, nrow, ncol = heads.shape
-    if per_idx is None:
-        per_idx = list(range(nper))
-    elif np.isscalar(per_idx):
-        per_idx = [per_idx]
-    wt = []
-    for per in per_idx:
-        wt_per = []
-        for i in range(nrow):
-            for j in range(ncol):
-                for k in range(nlay):
-                    if heads[per, k, i, j] != nodata:
-                        wt_per.append(heads[per, k, i, j])
-                        break
-                    elif k == nlay - 1:
-                        wt_per.append(nodata)
-        assert len(wt_per) == nrow * ncol
-        wt.append(np.reshape(wt_per, (nrow, ncol)))
+    shape, dtype, chunks = _iter_heads(heads, per_idx)
+    nper, nlay, nrow, ncol = shape
+    wt = np.empty((nper, nrow, ncol), dtype=dtype)
+    for idx, hds in chunks:
+        hds = np.ma.getdata(hds)
+        # first layer in each column that is not nodata
+        wet = hds != nodata
+        k = np.argmax(wet, axis=1)[:, np.newaxis]
+        wt_per = np.take_along_axis(hds, k, axis=1)[:, 0]
+        wt_per[~np.any(wet, axis=1)] = nodata
+        wt[idx] = wt_per
     return np.squeeze(wt)
 
 
@@ -173,8 +232,9 @@ def get_saturated_thickness(heads, m, nodata, per_idx=None):
 
     Parameters
     ----------
-    heads : 3 or 4-D np.ndarray
-        Heads array.
+    heads : 3 or 4-D np.ndarray or flopy.utils.HeadFile
+        Heads array or binary head file.  Head files with a regular
+        layout are read through a memory-mapped view.
     m : flopy.modflow.Modflow object
         Must have a flopy.modflow.ModflowDis object attached.
     nodata : real
@@ -186,17 +246,11 @@ def get_saturated_thickness(heads, m, nodata, per_idx=None):
     Returns
     -------
     sat_thickness : 3 or 4-D np.ndarray
-        Array of saturated thickness
+        Array of saturated thickness. If per_idx is empty, an empty array
+        with shape (0, nlay, nrow, ncol) is returned.
     """
-    # internal calculations done on a masked array
-    heads = np.ma.array(heads, ndmin=4, mask=heads == nodata)
     botm = m.dis.botm.array
     thickness = m.dis.thickness.array
-    nper, nlay, nrow, ncol = heads.shape
-    if per_idx is None:
-        per_idx = list(range(nper))
-    elif np.isscalar(per_idx):
-        per_idx = [per_idx]
 
     # get confined or unconfined/convertible info
     if m.has_package("BCF6") or m.has_package("LPF") or m.has_package("UPW"):
@@ -222,14 +276,17 @@ def get_saturated_thickness(heads, m, nodata, per_idx=None):
         )
 
     # calculate saturated thickness
-    sat_thickness = []
-    for per in per_idx:
-        hds = heads[per]
-        perthickness = hds - botm
+    shape, dtype, chunks = _iter_heads(heads, per_idx)
+    dtype = np.result_type(dtype, botm.dtype, thickness.dtype)
+    sat_thickness = np.empty(shape, dtype=dtype)
+    for idx, hds in chunks:
+        dry = np.ma.getmaskarray(hds) | (np.ma.getdata(hds) == nodata)
+        perthickness = np.ma.getdata(hds) - botm
         conf = np.logical_or(perthickness > thickness, is_conf)
-        perthickness[conf] = thickness[conf]
+        perthickness = np.where(conf, thickness, perthickness)
         # convert to nan-filled array, as is expected(!?)
-        sat_thickness.append(perthickness.filled(np.nan))
+        perthickness[dry] = np.nan
+        sat_thickness[idx] = perthickness
     return np.squeeze(sat_thickness)
 
 
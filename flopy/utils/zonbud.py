@@ -2,7 +2,6 @@ import os
 import copy
 import numpy as np
 from .binaryfile import CellBudgetFile
-from itertools import groupby
 from collections import OrderedDict
 from ..utils.utils_def import totim_to_datetime
 
@@ -29,6 +28,16 @@ class ZoneBudget(object):
         When using this option in conjunction with a list of zones, the
         zone(s) passed may either be all strings (aliases), all integers,
         or mixed.
+    verbose : bool
+        Print the time step or simulation time of each budget as it is
+        computed. (default is False)
+    processes : int
+        Number of worker processes used to compute the budgets of
+        different time steps concurrently. Each worker process opens the
+        cell budget file once. Default is None, which computes the budgets
+        one after the other in this process. On platforms that spawn new
+        processes (e.g. Windows) the ZoneBudget must be created from
+        within an ``if __name__ == "__main__":`` block.
 
     Returns
     -------
@@ -52,6 +61,7 @@ class ZoneBudget(object):
         totim=None,
         aliases=None,
         verbose=False,
+        processes=None,
         **kwargs
     ):
 
@@ -230,24 +240,16 @@ class ZoneBudget(object):
                 array_list.append(recordarray)
         self._budget = np.concatenate(array_list, axis=0)
 
+        # The zone array does not change between time steps, so find the
+        # cell faces between zones and the cells of each zone once
+        self._build_zone_index()
+
         # Update budget record array
         if self.kstpkper is not None:
-            for kk in self.kstpkper:
-                if verbose:
-                    s = (
-                        "Computing the budget for"
-                        " time step {} in stress period {}".format(
-                            kk[0] + 1, kk[1] + 1
-                        )
-                    )
-                    print(s)
-                self._compute_budget(kstpkper=kk)
-        elif self.totim is not None:
-            for t in self.totim:
-                if verbose:
-                    s = "Computing the budget for time {}".format(t)
-                    print(s)
-                self._compute_budget(totim=t)
+            steps = [(kk, None) for kk in self.kstpkper]
+        else:
+            steps = [(None, t) for t in self.totim]
+        self._compute_budgets(steps, verbose, processes)
 
         return
 
@@ -517,6 +519,143 @@ class ZoneBudget(object):
         result.cbc = self.cbc
         return result
 
+    def _build_zone_index(self):
+        """
+        Find the cell faces between different zones and the cells of each
+        zone. These only depend on the zone array and are reused for
+        every time step.
+
+        Returns
+        -------
+        None
+
+        """
+        izone = self.izone
+
+        # "FLOW RIGHT FACE" BETWEEN NODE J,I,K AND J-1,I,K AND BETWEEN
+        # NODE J,I,K AND J+1,I,K
+        k, i, j = np.where(izone[:, :, 1:] > izone[:, :, :-1])
+        frf = [(k, i, j + 1), np.where(izone[:, :, :-1] > izone[:, :, 1:])]
+
+        # "FLOW FRONT FACE" BETWEEN NODE J,I,K AND J,I-1,K AND BETWEEN
+        # NODE J,I,K AND J,I+1,K
+        k, i, j = np.where(izone[:, 1:, :] < izone[:, :-1, :])
+        fff = [(k, i + 1, j), np.where(izone[:, :-1, :] < izone[:, 1:, :])]
+
+        # "FLOW LOWER FACE" BETWEEN NODE J,I,K AND J,I,K-1 AND BETWEEN
+        # NODE J,I,K AND J,I,K+1
+        k, i, j = np.where(izone[1:, :, :] < izone[:-1, :, :])
+        flf = [(k + 1, i, j), np.where(izone[:-1, :, :] < izone[1:, :, :])]
+
+        self._face_index = {"frf": frf, "fff": fff, "flf": flf}
+
+        # flattened indices of the cells in each zone
+        self._zone_cells = OrderedDict(
+            [(z, np.flatnonzero(izone == z)) for z in self.allzones]
+        )
+
+        # rows of the budget record array for each time step
+        self._budget_rows = {}
+        return
+
+    def _get_budget_rows(self, kstpkper=None, totim=None):
+        """
+        Get the rows of the budget record array for a time step.
+
+        Parameters
+        ----------
+        kstpkper : tuple
+            Tuple of kstp and kper to get the rows for (default is None).
+        totim : float
+            Totim to get the rows for (default is None).
+
+        Returns
+        -------
+        rows : ndarray
+            Rows of the time step in the budget record array.
+        namerows : dict
+            Rows of the time step for each record name.
+
+        """
+        if kstpkper is not None:
+            key = ("kstpkper", tuple(kstpkper))
+        else:
+            key = ("totim", totim)
+        if key not in self._budget_rows:
+            if kstpkper is not None:
+                rows = np.where(
+                    (self._budget["time_step"] == kstpkper[0])
+                    & (self._budget["stress_period"] == kstpkper[1])
+                )[0]
+            else:
+                rows = np.where(self._budget["totim"] == totim)[0]
+            namerows = OrderedDict()
+            for row, name in zip(rows, self._budget["name"][rows]):
+                namerows.setdefault(name, []).append(row)
+            for name, idx in namerows.items():
+                namerows[name] = np.array(idx, dtype=rows.dtype)
+            self._budget_rows[key] = (rows, namerows)
+        return self._budget_rows[key]
+
+    def _compute_budgets(self, steps, verbose=False, processes=None):
+        """
+        Compute the budgets of several time steps, one after the other or
+        concurrently in a pool of worker processes.
+
+        Parameters
+        ----------
+        steps : list of tuples
+            (kstpkper, totim) of each time step to compute the budget for.
+        verbose : bool
+            Print each time step as its budget is computed.
+        processes : int
+            Number of worker processes, default is None (no worker
+            processes).
+
+        Returns
+        -------
+        None
+
+        """
+        if processes is None or processes < 2 or len(steps) < 2:
+            for kstpkper, totim in steps:
+                if verbose:
+                    _print_budget_step(kstpkper, totim)
+                self._compute_budget(kstpkper=kstpkper, totim=totim)
+            return
+
+        import multiprocessing
+
+        # the cell budget file and model objects do not pickle, so send a
+        # shallow copy without them to the worker processes, which open
+        # the cell budget file themselves
+        zb = copy.copy(self)
+        zb.cbc = None
+        for attr in ["model", "dis", "sr"]:
+            if hasattr(zb, attr):
+                setattr(zb, attr, None)
+        if self.cbc.realtype == np.float64:
+            precision = "double"
+        else:
+            precision = "single"
+        pool = multiprocessing.Pool(
+            processes,
+            initializer=_init_zonbud_worker,
+            initargs=(zb, self.cbc.filename, precision),
+        )
+        try:
+            for (kstpkper, totim), budget in zip(
+                steps, pool.imap(_compute_zonbud_step, steps)
+            ):
+                if verbose:
+                    _print_budget_step(kstpkper, totim)
+                rows = self._get_budget_rows(kstpkper, totim)[0]
+                self._budget[rows] = budget
+        finally:
+            pool.close()
+            pool.join()
+        return
+
     def _compute_budget(self, kstpkper=None, totim=None):
         """
         Creates a budget for the specified zone array. This function only
@@ -554,23 +693,38 @@ class ZoneBudget(object):
                 totim=totim,
             )[0]
             ich[np.ma.where(chd != 0.0)] = 1
+        # locate the constant head cells once for all face flow terms
+        ichidx = np.where(ich == 1)
         if "FLOW RIGHT FACE" in self.record_names:
-            self._accumulate_flow_frf("FLOW RIGHT FACE", ich, kstpkper, totim)
+            self._accumulate_flow_frf(
+                "FLOW RIGHT FACE", ich, kstpkper, totim, ichidx
+            )
         if "FLOW FRONT FACE" in self.record_names:
-            self._accumulate_flow_fff("FLOW FRONT FACE", ich, kstpkper, totim)
+            self._accumulate_flow_fff(
+                "FLOW FRONT FACE", ich, kstpkper, totim, ichidx
+            )
         if "FLOW LOWER FACE" in self.record_names:
-            self._accumulate_flow_flf("FLOW LOWER FACE", ich, kstpkper, totim)
+            self._accumulate_flow_flf(
+                "FLOW LOWER FACE", ich, kstpkper, totim, ichidx
+            )
         if "SWIADDTOCH" in self.record_names:
             swichd = self.cbc.get_data(
                 text="SWIADDTOCH", full3D=True, kstpkper=kstpkper, totim=totim
             )[0]
             swiich[swichd != 0] = 1
+        swiichidx = np.where(swiich == 1)
         if "SWIADDTOFRF" in self.record_names:
-            self._accumulate_flow_frf("SWIADDTOFRF", swiich, kstpkper, totim)
+            self._accumulate_flow_frf(
+                "SWIADDTOFRF", swiich, kstpkper, totim, swiichidx
+            )
         if "SWIADDTOFFF" in self.record_names:
-            self._accumulate_flow_fff("SWIADDTOFFF", swiich, kstpkper, totim)
+            self._accumulate_flow_fff(
+                "SWIADDTOFFF", swiich, kstpkper, totim, swiichidx
+            )
         if "SWIADDTOFLF" in self.record_names:
-            self._accumulate_flow_flf("SWIADDTOFLF", swiich, kstpkper, totim)
+            self._accumulate_flow_flf(
+                "SWIADDTOFLF", swiich, kstpkper, totim, swiichidx
+            )
 
         # NOT AN INTERNAL FLOW TERM, SO MUST BE A SOURCE TERM OR STORAGE
         # ACCUMULATE THE FLOW BY ZONE
@@ -826,28 +980,19 @@ class ZoneBudget(object):
         """
         try:
 
-            if kstpkper is not None:
-                for rn, cn, flux in zip(rownames, colnames, fluxes):
-                    rowidx = np.where(
-                        (self._budget["time_step"] == kstpkper[0])
-                        & (self._budget["stress_period"] == kstpkper[1])
-                        & (self._budget["name"] == rn)
-                    )
-                    self._budget[cn][rowidx] += flux
-            elif totim is not None:
+            if kstpkper is not None or totim is not None:
+                namerows = self._get_budget_rows(kstpkper, totim)[1]
                 for rn, cn, flux in zip(rownames, colnames, fluxes):
-                    rowidx = np.where(
-                        (self._budget["totim"] == totim)
-                        & (self._budget["name"] == rn)
-                    )
-                    self._budget[cn][rowidx] += flux
+                    rowidx = namerows.get(rn)
+                    if rowidx is not None:
+                        self._budget[cn][rowidx] += flux
 
         except Exception as e:
             print(e)
             raise
         return
 
-    def _accumulate_flow_frf(self, recname, ich, kstpkper, totim):
+    def _accumulate_flow_frf(self, recname, ich, kstpkper, totim, ichidx=None):
         """
 
         Parameters
@@ -856,6 +1001,9 @@ class ZoneBudget(object):
         ich
         kstpkper
         totim
+        ichidx : tuple of ndarrays
+            Indices of the constant head cells in ich. If None, they are
+            found in ich.
 
         Returns
         -------
@@ -872,12 +1020,10 @@ class ZoneBudget(object):
                 # ZONE 4 TO 3 IS THE NEGATIVE OF FLOW FROM 3 TO 4.
                 # 1ST, CALCULATE FLOW BETWEEN NODE J,I,K AND J-1,I,K
 
-                k, i, j = np.where(
-                    self.izone[:, :, 1:] > self.izone[:, :, :-1]
-                )
+                if ichidx is None:
+                    ichidx = np.where(ich == 1)
 
-                # Adjust column values to account for the starting position of "nz"
-                j += 1
+                k, i, j = self._face_index["frf"][0]
 
                 # Define the zone to which flow is going
                 nz = self.izone[k, i, j]
@@ -914,9 +1060,7 @@ class ZoneBudget(object):
                 )
 
                 # FLOW BETWEEN NODE J,I,K AND J+1,I,K
-                k, i, j = np.where(
-                    self.izone[:, :, :-1] > self.izone[:, :, 1:]
-                )
+                k, i, j = self._face_index["frf"][1]
 
                 # Define the zone from which flow is coming
                 nz = self.izone[k, i, j]
@@ -953,7 +1097,7 @@ class ZoneBudget(object):
                 )
 
                 # CALCULATE FLOW TO CONSTANT-HEAD CELLS IN THIS DIRECTION
-                k, i, j = np.where(ich == 1)
+                k, i, j = ichidx
                 k, i, j = k[j > 0], i[j > 0], j[j > 0]
                 jl = j - 1
                 nzl = self.izone[k, i, jl]
@@ -979,7 +1123,7 @@ class ZoneBudget(object):
                     fz, tz, np.abs(f), kstpkper, totim
                 )
 
-                k, i, j = np.where(ich == 1)
+                k, i, j = ichidx
                 k, i, j = (
                     k[j < self.ncol - 1],
                     i[j < self.ncol - 1],
@@ -1014,7 +1158,7 @@ class ZoneBudget(object):
             raise
         return
 
-    def _accumulate_flow_fff(self, recname, ich, kstpkper, totim):
+    def _accumulate_flow_fff(self, recname, ich, kstpkper, totim, ichidx=None):
         """
 
         Parameters
@@ -1023,6 +1167,9 @@ class ZoneBudget(object):
         ich
         kstpkper
         totim
+        ichidx : tuple of ndarrays
+            Indices of the constant head cells in ich. If None, they are
+            found in ich.
 
         Returns
         -------
@@ -1036,10 +1183,10 @@ class ZoneBudget(object):
 
                 # "FLOW FRONT FACE"
                 # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I-1,K
-                k, i, j = np.where(
-                    self.izone[:, 1:, :] < self.izone[:, :-1, :]
-                )
-                i += 1
+                if ichidx is None:
+                    ichidx = np.where(ich == 1)
+
+                k, i, j = self._face_index["fff"][0]
                 ia = i - 1
                 nza = self.izone[k, ia, j]
                 nz = self.izone[k, i, j]
@@ -1061,9 +1208,7 @@ class ZoneBudget(object):
                 )
 
                 # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I+1,K.
-                k, i, j = np.where(
-                    self.izone[:, :-1, :] < self.izone[:, 1:, :]
-                )
+                k, i, j = self._face_index["fff"][1]
                 nz = self.izone[k, i, j]
                 ib = i + 1
                 nzb = self.izone[k, ib, j]
@@ -1085,7 +1230,7 @@ class ZoneBudget(object):
                 )
 
                 # CALCULATE FLOW TO CONSTANT-HEAD CELLS IN THIS DIRECTION
-                k, i, j = np.where(ich == 1)
+                k, i, j = ichidx
                 k, i, j = k[i > 0], i[i > 0], j[i > 0]
                 ia = i - 1
                 nza = self.izone[k, ia, j]
@@ -1111,7 +1256,7 @@ class ZoneBudget(object):
                     fz, tz, np.abs(f), kstpkper, totim
                 )
 
-                k, i, j = np.where(ich == 1)
+                k, i, j = ichidx
                 k, i, j = (
                     k[i < self.nrow - 1],
                     i[i < self.nrow - 1],
@@ -1146,7 +1291,7 @@ class ZoneBudget(object):
             raise
         return
 
-    def _accumulate_flow_flf(self, recname, ich, kstpkper, totim):
+    def _accumulate_flow_flf(self, recname, ich, kstpkper, totim, ichidx=None):
         """
 
         Parameters
@@ -1155,6 +1300,9 @@ class ZoneBudget(object):
         ich
         kstpkper
         totim
+        ichidx : tuple of ndarrays
+            Indices of the constant head cells in ich. If None, they are
+            found in ich.
 
         Returns
         -------
@@ -1168,10 +1316,10 @@ class ZoneBudget(object):
 
                 # "FLOW LOWER FACE"
                 # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I,K-1
-                k, i, j = np.where(
-                    self.izone[1:, :, :] < self.izone[:-1, :, :]
-                )
-                k += 1
+                if ichidx is None:
+                    ichidx = np.where(ich == 1)
+
+                k, i, j = self._face_index["flf"][0]
                 ka = k - 1
                 nza = self.izone[ka, i, j]
                 nz = self.izone[k, i, j]
@@ -1193,9 +1341,7 @@ class ZoneBudget(object):
                 )
 
                 # CALCULATE FLOW BETWEEN NODE J,I,K AND J,I,K+1
-                k, i, j = np.where(
-                    self.izone[:-1, :, :] < self.izone[1:, :, :]
-                )
+                k, i, j = self._face_index["flf"][1]
                 nz = self.izone[k, i, j]
                 kb = k + 1
                 nzb = self.izone[kb, i, j]
@@ -1217,7 +1363,7 @@ class ZoneBudget(object):
                 )
 
                 # CALCULATE FLOW TO CONSTANT-HEAD CELLS IN THIS DIRECTION
-                k, i, j = np.where(ich == 1)
+                k, i, j = ichidx
                 k, i, j = k[k > 0], i[k > 0], j[k > 0]
                 ka = k - 1
                 nza = self.izone[ka, i, j]
@@ -1243,7 +1389,7 @@ class ZoneBudget(object):
                     fz, tz, np.abs(f), kstpkper, totim
                 )
 
-                k, i, j = np.where(ich == 1)
+                k, i, j = ichidx
                 k, i, j = (
                     k[k < self.nlay - 1],
                     i[k < self.nlay - 1],
@@ -1302,12 +1448,11 @@ class ZoneBudget(object):
             qout = np.ma.zeros(
                 (self.nlay * self.nrow * self.ncol), self.float_type
             )
-            for [node, q] in zip(data["node"], data["q"]):
-                idx = node - 1
-                if q > 0:
-                    qin.data[idx] += q
-                elif q < 0:
-                    qout.data[idx] += q
+            node, q = data["node"], data["q"]
+            idx = q > 0
+            np.add.at(qin.data, node[idx] - 1, q[idx])
+            idx = q < 0
+            np.add.at(qout.data, node[idx] - 1, q[idx])
             qin = np.ma.reshape(qin, (self.nlay, self.nrow, self.ncol))
             qout = np.ma.reshape(qout, (self.nlay, self.nrow, self.ncol))
         elif imeth == 0 or imeth == 1:
@@ -1341,12 +1486,13 @@ class ZoneBudget(object):
             )
 
         # Inflows
+        qin = qin.ravel()
         fz = []
         tz = []
         f = []
-        for z in self.allzones:
+        for z, cells in self._zone_cells.items():
             if z != 0:
-                flux = qin[(self.izone == z)].sum()
+                flux = qin[cells].sum()
                 if type(flux) == np.ma.core.MaskedConstant:
                     flux = 0.0
                 fz.append("FROM_" + "_".join(recname.split()))
@@ -1358,12 +1504,13 @@ class ZoneBudget(object):
         self._update_budget_fromssst(fz, tz, np.abs(f), kstpkper, totim)
 
         # Outflows
+        qout = qout.ravel()
         fz = []
         tz = []
         f = []
-        for z in self.allzones:
+        for z, cells in self._zone_cells.items():
             if z != 0:
-                flux = qout[(self.izone == z)].sum()
+                flux = qout[cells].sum()
                 if type(flux) == np.ma.core.MaskedConstant:
                     flux = 0.0
                 fz.append("TO_" + "_".join(recname.split()))
@@ -1382,20 +1529,9 @@ class ZoneBudget(object):
         skipcols = ["time_step", "stress_period", "totim", "name"]
 
         # Compute inflows
-        recnames = self.get_record_names()
-        innames = [n for n in recnames if n.startswith("FROM_")]
-        outnames = [n for n in recnames if n.startswith("TO_")]
-        if kstpkper is not None:
-            rowidx = np.where(
-                (self._budget["time_step"] == kstpkper[0])
-                & (self._budget["stress_period"] == kstpkper[1])
-                & np.in1d(self._budget["name"], innames)
-            )
-        elif totim is not None:
-            rowidx = np.where(
-                (self._budget["totim"] == totim)
-                & np.in1d(self._budget["name"], innames)
-            )
+        rows = self._get_budget_rows(kstpkper, totim)[0]
+        names = self._budget["name"][rows]
+        rowidx = rows[np.char.startswith(names, "FROM_")]
         a = _numpyvoid2numeric(
             self._budget[list(self._zonenamedict.values())][rowidx]
         )
@@ -1407,17 +1543,7 @@ class ZoneBudget(object):
         self._update_budget_fromssst(fz, tz, intot, kstpkper, totim)
 
         # Compute outflows
-        if kstpkper is not None:
-            rowidx = np.where(
-                (self._budget["time_step"] == kstpkper[0])
-                & (self._budget["stress_period"] == kstpkper[1])
-                & np.in1d(self._budget["name"], outnames)
-            )
-        elif totim is not None:
-            rowidx = np.where(
-                (self._budget["totim"] == totim)
-                & np.in1d(self._budget["name"], outnames)
-            )
+        rowidx = rows[np.char.startswith(names, "TO_")]
         a = _numpyvoid2numeric(
             self._budget[list(self._zonenamedict.values())][rowidx]
         )
@@ -1539,6 +1665,41 @@ class ZoneBudget(object):
         return newobj
 
 
+# per-process ZoneBudget of the worker processes that compute budgets
+_zonbud_worker = None
+
+
+def _init_zonbud_worker(zb, cbc_file, precision):
+    """Set the ZoneBudget object and open the cell budget file once for
+    each worker process."""
+    global _zonbud_worker
+    zb.cbc = CellBudgetFile(cbc_file, precision=precision)
+    _zonbud_worker = zb
+
+
+def _compute_zonbud_step(step):
+    """Compute the budget of a single time step in a worker process and
+    return the budget records of the time step."""
+    kstpkper, totim = step
+    zb = _zonbud_worker
+    zb._compute_budget(kstpkper=kstpkper, totim=totim)
+    rows = zb._get_budget_rows(kstpkper, totim)[0]
+    return zb._budget[rows]
+
+
+def _print_budget_step(kstpkper=None, totim=None):
+    if kstpkper is not None:
+        s = (
+            "Computing the budget for"
+            " time step {} in stress period {}".format(
+                kstpkper[0] + 1, kstpkper[1] + 1
+            )
+        )
+    else:
+        s = "Computing the budget for time {}".format(totim)
+    print(s)
+
+
 def _numpyvoid2numeric(a):
     # The budget record array has multiple dtypes and a slice returns
     # the flexible-type numpy.void which must be converted to a numeric
@@ -1759,21 +1920,32 @@ def read_zbarray(fname):
 
 
 def sum_flux_tuples(fromzones, tozones, fluxes):
-    tup = zip(fromzones, tozones, fluxes)
-    sorted_tups = sort_tuple(tup)
-
-    # Group the sorted tuples by (from zone, to zone)
-    # itertools.groupby() returns the index (from zone, to zone) and
-    # a list of the tuples with that index
-    from_zones = []
-    to_zones = []
-    fluxes = []
-    for (fz, tz), ftup in groupby(sorted_tups, lambda tup: tup[:2]):
-        f = np.sum([tup[-1] for tup in list(ftup)])
-        from_zones.append(fz)
-        to_zones.append(tz)
-        fluxes.append(f)
-    return np.array(from_zones), np.array(to_zones), np.array(fluxes)
+    fromzones = np.asarray(fromzones)
+    tozones = np.asarray(tozones)
+    fluxes = np.asarray(fluxes)
+    if len(fluxes) == 0:
+        return np.array([]), np.array([]), np.array([])
+
+    # Sort the fluxes by (from zone, to zone), keeping the original order
+    # of the fluxes within each (from zone, to zone) pair
+    isort = np.lexsort((tozones, fromzones))
+    fromzones = fromzones[isort]
+    tozones = tozones[isort]
+    fluxes = fluxes[isort]
+
+    # Sum the flux values of each (from zone, to zone) pair
+    istart = np.flatnonzero(
+        np.concatenate(
+            (
+                [True],
+                (fromzones[1:] != fromzones[:-1])
+                | (tozones[1:] != tozones[:-1]),
+            )
+        )
+    )
+    iend = np.append(istart[1:], len(fluxes))
+    fluxes = np.array([np.sum(fluxes[i0:i1]) for i0, i1 in zip(istart, iend)])
+    return fromzones[istart], tozones[istart], fluxes
 
 
 def sort_tuple(tup, n=2):